@@ -36,7 +36,8 @@ def setup(app):
     import psycopg  # type: ignore
 
     recover_defined_module(
-        psycopg, skip_modules=["psycopg._dns", "psycopg.types.shapely"]
+        psycopg,
+        skip_modules=["psycopg._dns", "psycopg.types.numpy", "psycopg.types.shapely"],
     )
     monkeypatch_autodoc()
 
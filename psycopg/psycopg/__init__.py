@@ -16,9 +16,13 @@ from .cursor import Cursor
 from .errors import Warning, Error, InterfaceError, DatabaseError
 from .errors import DataError, OperationalError, IntegrityError
 from .errors import InternalError, ProgrammingError, NotSupportedError
-from ._column import Column
+from ._column import Column, ColumnArray
 from .conninfo import ConnectionInfo
 from ._pipeline import Pipeline, AsyncPipeline
+from ._pipeline import PipelineResult, AsyncPipelineResult
+from ._preparing import PreparedRegistry, PreparedStats, StatementStats
+from ._prepared_query import PreparedQuery, AsyncPreparedQuery
+from ._result_cache import ResultCache
 from .connection import BaseConnection, Connection, Notify
 from .transaction import Rollback, Transaction, AsyncTransaction
 from .cursor_async import AsyncCursor
@@ -64,11 +68,14 @@ __all__ = [
     "AsyncCopy",
     "AsyncCursor",
     "AsyncPipeline",
+    "AsyncPipelineResult",
+    "AsyncPreparedQuery",
     "AsyncServerCursor",
     "AsyncTransaction",
     "BaseConnection",
     "ClientCursor",
     "Column",
+    "ColumnArray",
     "Connection",
     "ConnectionInfo",
     "Copy",
@@ -76,8 +83,14 @@ __all__ = [
     "IsolationLevel",
     "Notify",
     "Pipeline",
+    "PipelineResult",
+    "PreparedQuery",
+    "PreparedRegistry",
+    "PreparedStats",
+    "ResultCache",
     "Rollback",
     "ServerCursor",
+    "StatementStats",
     "Transaction",
     "Xid",
     # DBAPI exports
@@ -1,9 +1,10 @@
 """
-The Column object in Cursor.description
+The Column object in Cursor.description and the ColumnArray in fetch_columns()
 """
 
 # Copyright (C) 2020 The Psycopg Team
 
+from array import array
 from typing import Any, NamedTuple, Optional, Sequence, TYPE_CHECKING
 from operator import attrgetter
 
@@ -140,3 +141,27 @@ class Column(Sequence[Any]):
     def null_ok(self) -> Optional[bool]:
         """Always `!None`"""
         return None
+
+
+if TYPE_CHECKING:
+    _array = array[Any]
+else:
+    _array = array
+
+
+class ColumnArray(_array):
+    """
+    An `array.array` containing a numeric column returned by `fetch_columns()`.
+
+    :sql:`NULL` values are stored as ``0`` in the array; their positions are
+    recorded in the `mask`.
+    """
+
+    __module__ = "psycopg"
+
+    mask: Optional["array[int]"] = None
+    """
+    `!None` if the column contains no :sql:`NULL`, otherwise an `array.array`
+    of typecode ``b`` with the same length as the column, containing ``1`` in
+    the positions of the :sql:`NULL` values and ``0`` elsewhere.
+    """
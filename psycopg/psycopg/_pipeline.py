@@ -4,30 +4,56 @@ commands pipeline management
 
 # Copyright (C) 2021 The Psycopg Team
 
+import asyncio
 import logging
+import threading
 from types import TracebackType
-from typing import Any, List, Optional, Union, Tuple, Type, TypeVar, TYPE_CHECKING
+from concurrent.futures import Future
+from typing import Any, Callable, Generic, List, Optional, Union, Tuple, Type
+from typing import TypeVar, TYPE_CHECKING
+from functools import partial
 from typing_extensions import TypeAlias
 
 from . import pq
+from . import adapt
 from . import errors as e
-from .abc import PipelineCommand, PQGen
+from .abc import PipelineCommand, PQGen, Params, Query
+from .rows import Row, RowFactory, AsyncRowFactory
 from ._compat import Deque
+from ._queries import PostgresQuery
 from ._encodings import pgconn_encoding
+from .waiting import Wait
 from ._preparing import Key, Prepare
 from .generators import pipeline_communicate, fetch_many, send
 
 if TYPE_CHECKING:
+    from .abc import Transformer
     from .pq.abc import PGresult
     from .cursor import BaseCursor
     from .connection import BaseConnection, Connection
     from .connection_async import AsyncConnection
 
 
-PendingResult: TypeAlias = Union[
-    None, Tuple["BaseCursor[Any, Any]", Optional[Tuple[Key, Prepare, bytes]]]
+# Function called on the Sync terminating a group of commands, receiving the
+# first error raised by the commands in the group, if any.
+GroupWaiter: TypeAlias = Callable[[Optional[BaseException]], None]
+
+# Function receiving the results of a command, such as a cursor method or
+# a PipelineResult method. It may raise an exception if the results are
+# an error.
+ResultReceiver: TypeAlias = Callable[[List["PGresult"]], None]
+
+PendingCommand: TypeAlias = Union[
+    None, Tuple[ResultReceiver, Optional[Tuple[Key, Prepare, bytes]]]
 ]
+PendingResult: TypeAlias = Union[PendingCommand, GroupWaiter]
+
+TEXT = pq.Format.TEXT
+BINARY = pq.Format.BINARY
 
+COMMAND_OK = pq.ExecStatus.COMMAND_OK
+TUPLES_OK = pq.ExecStatus.TUPLES_OK
+EMPTY_QUERY = pq.ExecStatus.EMPTY_QUERY
 FATAL_ERROR = pq.ExecStatus.FATAL_ERROR
 PIPELINE_ABORTED = pq.ExecStatus.PIPELINE_ABORTED
 BAD = pq.ConnStatus.BAD
@@ -42,12 +68,31 @@ class BasePipeline:
     result_queue: Deque[PendingResult]
     _is_supported: Optional[bool] = None
 
-    def __init__(self, conn: "BaseConnection[Any]") -> None:
+    def __init__(
+        self,
+        conn: "BaseConnection[Any]",
+        max_pending: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
         self._conn = conn
         self.pgconn = conn.pgconn
         self.command_queue = Deque[PipelineCommand]()
         self.result_queue = Deque[PendingResult]()
         self.level = 0
+        self._max_pending: Optional[int] = None
+        self._max_bytes: Optional[int] = None
+        self.max_pending = max_pending
+        self.max_bytes = max_bytes
+        # Number of bytes of queries and parameters sent since the last sync.
+        self._pending_bytes = 0
+
+        # If true, errors are not raised processing results but reported to
+        # the waiter of the group of commands which caused them.
+        self._multiplex = False
+        self._group_error: Optional[BaseException] = None
+
+        # Used to adapt the parameters of the queries passed to submit().
+        self._tx: Optional["Transformer"] = None
 
     def __repr__(self) -> str:
         cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
@@ -58,6 +103,39 @@ class BasePipeline:
     def status(self) -> pq.PipelineStatus:
         return pq.PipelineStatus(self.pgconn.pipeline_status)
 
+    @property
+    def max_pending(self) -> Optional[int]:
+        """
+        The number of pending results after which the pipeline is synced.
+
+        If `!None`, the pipeline is only synced on explicit `sync()` calls or
+        at the end of the block.
+        """
+        return self._max_pending
+
+    @max_pending.setter
+    def max_pending(self, value: Optional[int]) -> None:
+        if value is not None and value < 1:
+            raise ValueError("max_pending must be >= 1")
+        self._max_pending = value
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """
+        The size of the data sent after which the pipeline is synced.
+
+        The size is the number of bytes of the queries and parameters sent
+        since the last synchronization point. If `!None`, the pipeline is
+        not synced on size.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]) -> None:
+        if value is not None and value < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self._max_bytes = value
+
     @classmethod
     def is_supported(cls) -> bool:
         """Return `!True` if the psycopg libpq wrapper supports pipeline mode."""
@@ -134,14 +212,23 @@ class BasePipeline:
             # No need to force flush since we emitted a sync just before.
             yield from self._fetch_gen(flush=False)
 
+    def _maybe_sync_gen(self) -> PQGen[None]:
+        """Sync the pipeline if the pending data exceeds `max_pending` or
+        `max_bytes`.
+        """
+        if (
+            self._max_pending is not None
+            and len(self.result_queue) >= self._max_pending
+        ) or (self._max_bytes is not None and self._pending_bytes >= self._max_bytes):
+            yield from self._sync_gen()
+
     def _communicate_gen(self) -> PQGen[None]:
         """Communicate with pipeline to send commands and possibly fetch
         results, which are then processed.
         """
         fetched = yield from pipeline_communicate(self.pgconn, self.command_queue)
         to_process = [(self.result_queue.popleft(), results) for results in fetched]
-        for queued, results in to_process:
-            self._process_results(queued, results)
+        self._process_all_results(to_process)
 
     def _fetch_gen(self, *, flush: bool) -> PQGen[None]:
         """Fetch available results from the connection and process them with
@@ -169,8 +256,39 @@ class BasePipeline:
             queued = self.result_queue.popleft()
             to_process.append((queued, results))
 
+        self._process_all_results(to_process)
+
+    def _fetch_available_gen(self) -> PQGen[None]:
+        """Wait for the results of the first command in the queue and process
+        them, together with any further result already available.
+        """
+        while self.result_queue:
+            results = yield from fetch_many(self.pgconn)
+            if not results:
+                break
+            self._process_results(self.result_queue.popleft(), results)
+            if self.pgconn.is_busy():
+                break
+
+    def _process_all_results(
+        self, to_process: List[Tuple[PendingResult, List["PGresult"]]]
+    ) -> None:
+        """Process a list of results fetched from the pipeline.
+
+        All the results are processed, even if one of them raises an error,
+        so that the results of the following commands are not lost; the
+        first error is then raised.
+        """
+        error: Optional[e.Error] = None
         for queued, results in to_process:
-            self._process_results(queued, results)
+            try:
+                self._process_results(queued, results)
+            except e.Error as ex:
+                if error is None:
+                    error = ex
+
+        if error is not None:
+            raise error
 
     def _process_results(
         self, queued: PendingResult, results: List["PGresult"]
@@ -180,8 +298,30 @@ class BasePipeline:
         This matches 'results' with its respective element in the pipeline
         queue. For commands (None value in the pipeline queue), results are
         checked directly. For prepare statement creation requests, update the
-        cache. Otherwise, results are attached to their respective cursor.
+        cache. Otherwise, results are passed to their respective receiver.
+
+        In multiplexed mode, errors are not raised but passed to the waiter
+        of the group of commands which caused them.
         """
+        if callable(queued):
+            # Sync terminating a group of commands.
+            exc, self._group_error = self._group_error, None
+            queued(exc)
+            return
+
+        if not self._multiplex:
+            self._process_command_results(queued, results)
+            return
+
+        try:
+            self._process_command_results(queued, results)
+        except e.Error as ex:
+            if self._group_error is None:
+                self._group_error = ex
+
+    def _process_command_results(
+        self, queued: PendingCommand, results: List["PGresult"]
+    ) -> None:
         if queued is None:
             (result,) = results
             if result.status == FATAL_ERROR:
@@ -189,18 +329,136 @@ class BasePipeline:
             elif result.status == PIPELINE_ABORTED:
                 raise e.PipelineAborted("pipeline aborted")
         else:
-            cursor, prepinfo = queued
-            cursor._check_results(results)
-            cursor._set_results(results)
+            receiver, prepinfo = queued
             if prepinfo:
                 key, prep, name = prepinfo
-                # Update the prepare state of the query.
-                cursor._conn._prepared.validate(key, prep, name, results)
-
-    def _enqueue_sync(self) -> None:
-        """Enqueue a PQpipelineSync() command."""
+                # Update the prepare state of the query before the receiver
+                # raises an error: if the preparation failed, the name must
+                # not be left in the cache, otherwise the following executions
+                # would fail with "prepared statement does not exist".
+                self._conn._prepared.validate(key, prep, name, results)
+            receiver(results)
+
+    def _enqueue_sync(self, waiter: Optional[GroupWaiter] = None) -> None:
+        """Enqueue a PQpipelineSync() command.
+
+        If 'waiter' is specified, it is called when the Sync result is
+        received.
+        """
         self.command_queue.append(self.pgconn.pipeline_sync)
-        self.result_queue.append(None)
+        self.result_queue.append(waiter)
+        self._pending_bytes = 0
+
+    def _add_pending_query(self, query: PostgresQuery) -> None:
+        """Account for the size of a query sent in the pipeline."""
+        self._pending_bytes += len(query.query)
+        if query.params:
+            self._pending_bytes += sum(len(p) for p in query.params if p is not None)
+
+    def _submit_gen(
+        self,
+        result: "BasePipelineResult[Any]",
+        query: Query,
+        params: Optional[Params],
+        *,
+        prepare: Optional[bool] = None,
+        binary: bool = False,
+    ) -> PQGen[None]:
+        """Generator implementing `Pipeline.submit()`.
+
+        The query is queued in the pipeline and its results will be passed to
+        'result', without involving a cursor.
+        """
+        yield from self._conn._start_query()
+        if not self._tx:
+            self._tx = adapt.Transformer(self._conn)
+        pgq = PostgresQuery(self._tx)
+        pgq.convert(query, params)
+
+        prep, name = self._conn._prepared.get(pgq, prepare, validated=self._multiplex)
+        self._queue_query(result, pgq, prep, name, binary=binary)
+        if self._multiplex:
+            # Isolate the query from the ones submitted by other tasks.
+            self._enqueue_sync()
+
+        yield from self._communicate_gen()
+        yield from self._maybe_sync_gen()
+
+        for cmd in self._conn._prepared.get_maintenance_commands():
+            yield from self._conn._exec_command(cmd)
+
+    def _queue_query(
+        self,
+        result: "BasePipelineResult[Any]",
+        pgq: PostgresQuery,
+        prep: Prepare,
+        name: bytes,
+        *,
+        binary: bool = False,
+    ) -> None:
+        """Queue a query in the pipeline, passing its results to 'result'.
+
+        'prep' and 'name' are the prepared state of the query, as returned by
+        `PrepareManager.get()`. This is not a generator: the query is only
+        sent at the next communication with the server.
+        """
+        fmt = BINARY if binary else TEXT
+        if prep is Prepare.NO:
+            self.command_queue.append(
+                partial(
+                    self.pgconn.send_query_params,
+                    pgq.query,
+                    pgq.params,
+                    param_formats=pgq.formats,
+                    param_types=pgq.types,
+                    result_format=fmt,
+                )
+            )
+        else:
+            if prep is Prepare.SHOULD:
+                self.command_queue.append(
+                    partial(
+                        self.pgconn.send_prepare,
+                        name,
+                        pgq.query,
+                        param_types=pgq.types,
+                    )
+                )
+                self.result_queue.append((result._set_prepare_results, None))
+            self.command_queue.append(
+                partial(
+                    self.pgconn.send_query_prepared,
+                    name,
+                    pgq.params,
+                    param_formats=pgq.formats,
+                    result_format=fmt,
+                )
+            )
+
+        self._queue_result(result, pgq, prep, name)
+
+    def _queue_result(
+        self,
+        result: "BasePipelineResult[Any]",
+        pgq: PostgresQuery,
+        prep: Prepare,
+        name: bytes,
+    ) -> None:
+        """Queue the object receiving the results of a query just queued."""
+        key = self._conn._prepared.maybe_add_to_cache(pgq, prep, name)
+        self.result_queue.append(
+            (result._set_results, (key, prep, name) if key else None)
+        )
+        self._add_pending_query(pgq)
+
+
+def _wait_input_gen() -> PQGen[None]:
+    """Wait until there is data to read on the connection.
+
+    The generator doesn't operate on the connection, so it can run while other
+    threads or tasks use it.
+    """
+    yield Wait.R
 
 
 class Pipeline(BasePipeline):
@@ -210,8 +468,17 @@ class Pipeline(BasePipeline):
     _conn: "Connection[Any]"
     _Self = TypeVar("_Self", bound="Pipeline")
 
-    def __init__(self, conn: "Connection[Any]") -> None:
-        super().__init__(conn)
+    def __init__(
+        self,
+        conn: "Connection[Any]",
+        max_pending: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        super().__init__(conn, max_pending=max_pending, max_bytes=max_bytes)
+
+        # In multiplexed mode, only one thread at time waits for results.
+        self._reading = False
+        self._results_processed = threading.Condition(conn.lock)
 
     def sync(self) -> None:
         """Sync the pipeline, send any pending command and receive and process
@@ -220,9 +487,120 @@ class Pipeline(BasePipeline):
         try:
             with self._conn.lock:
                 self._conn.wait(self._sync_gen())
+                if self._reading:
+                    self._conn.wait(self._wake_reader_gen())
         except e.Error as ex:
             raise ex.with_traceback(None)
 
+    def submit(
+        self,
+        query: Query,
+        params: Optional[Params] = None,
+        *,
+        prepare: Optional[bool] = None,
+        binary: bool = False,
+        row_factory: Optional[RowFactory[Any]] = None,
+    ) -> "PipelineResult[Any]":
+        """
+        Queue a query in the pipeline and return a handle to its result.
+
+        The rows of the result are only loaded when requested from the handle.
+        """
+        res: PipelineResult[Any] = PipelineResult(
+            self, row_factory or self._conn.row_factory
+        )
+        try:
+            with self._conn.lock:
+                self._conn.wait(
+                    self._submit_gen(res, query, params, prepare=prepare, binary=binary)
+                )
+                if self._reading:
+                    self._conn.wait(self._wake_reader_gen())
+        except e.Error as ex:
+            raise ex.with_traceback(None)
+        return res
+
+    def _wait_result(self, result: "PipelineResult[Any]") -> None:
+        """Wait until the results of a submitted query are received."""
+        try:
+            if self._multiplex:
+                self._execute_multiplexed(None)
+            else:
+                with self._conn.lock:
+                    self._conn.wait(self._fetch_gen(flush=True))
+        except e.Error as ex:
+            raise ex.with_traceback(None)
+
+    def _execute_multiplexed(self, gen: Optional[PQGen[Any]]) -> Any:
+        """Run a generator queuing commands in the pipeline and wait for them.
+
+        The commands are followed by a Sync, so that an error doesn't affect
+        the commands queued by other threads. The lock is not held while
+        waiting for the results, so that other threads can queue their
+        commands in the meantime.
+
+        Return the value returned by 'gen'. Raise the first error caused by the
+        commands queued. If 'gen' is `!None`, only wait for the commands
+        previously queued.
+        """
+        fut: "Future[None]" = Future()
+
+        def waiter(exc: Optional[BaseException]) -> None:
+            if exc:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(None)
+
+        rv = None
+        with self._conn.lock:
+            if gen:
+                rv = self._conn.wait(gen)
+            self._enqueue_sync(waiter)
+            self._conn.wait(self._communicate_gen())
+            if self._reading:
+                self._conn.wait(self._wake_reader_gen())
+
+            while not fut.done():
+                if self._reading:
+                    # Another thread is waiting for results: let it process them.
+                    self._results_processed.wait()
+                    continue
+
+                # Wait for data without holding the lock, then process the
+                # results received, whichever thread they belong to.
+                self._reading = True
+                try:
+                    while self.pgconn.is_busy():
+                        self._conn.lock.release()
+                        try:
+                            self._conn.wait(_wait_input_gen())
+                        finally:
+                            self._conn.lock.acquire()
+                        self.pgconn.consume_input()
+                    self._conn.wait(self._fetch_available_gen())
+                finally:
+                    self._reading = False
+                    self._results_processed.notify_all()
+
+        fut.result()
+        return rv
+
+    def _wake_reader_gen(self) -> PQGen[None]:
+        """Make sure that the thread waiting for data without the lock wakes up.
+
+        Communicating with the server, the thread holding the lock may have
+        received the data the reader is waiting for. Process the results
+        already received: the reader will be woken up by the ones still to
+        come. If there are none, send a Sync, which the server will reply to.
+        """
+        yield from send(self.pgconn)
+        if not self.pgconn.is_busy():
+            yield from self._fetch_available_gen()
+        if not self.result_queue:
+            self.pgconn.pipeline_sync()
+            self.result_queue.append(None)
+            yield from send(self.pgconn)
+
     def __enter__(self: _Self) -> _Self:
         with self._conn.lock:
             self._conn.wait(self._enter_gen())
@@ -254,16 +632,149 @@ class AsyncPipeline(BasePipeline):
     _conn: "AsyncConnection[Any]"
     _Self = TypeVar("_Self", bound="AsyncPipeline")
 
-    def __init__(self, conn: "AsyncConnection[Any]") -> None:
-        super().__init__(conn)
+    def __init__(
+        self,
+        conn: "AsyncConnection[Any]",
+        max_pending: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        super().__init__(conn, max_pending=max_pending, max_bytes=max_bytes)
+
+        # In multiplexed mode, only one task at time waits for results: the
+        # future is resolved when it has stopped waiting.
+        self._reading: "Optional[asyncio.Future[None]]" = None
+        # Resolved when the reading task can read data from the connection.
+        self._readable: "Optional[asyncio.Future[None]]" = None
 
     async def sync(self) -> None:
         try:
             async with self._conn.lock:
+                self._stop_wait_input()
                 await self._conn.wait(self._sync_gen())
         except e.Error as ex:
             raise ex.with_traceback(None)
 
+    async def submit(
+        self,
+        query: Query,
+        params: Optional[Params] = None,
+        *,
+        prepare: Optional[bool] = None,
+        binary: bool = False,
+        row_factory: Optional[AsyncRowFactory[Any]] = None,
+    ) -> "AsyncPipelineResult[Any]":
+        """
+        Queue a query in the pipeline and return a handle to its result.
+
+        The rows of the result are only loaded when requested from the handle.
+        """
+        res: AsyncPipelineResult[Any] = AsyncPipelineResult(
+            self, row_factory or self._conn.row_factory
+        )
+        try:
+            async with self._conn.lock:
+                self._stop_wait_input()
+                await self._conn.wait(
+                    self._submit_gen(res, query, params, prepare=prepare, binary=binary)
+                )
+        except e.Error as ex:
+            raise ex.with_traceback(None)
+        return res
+
+    async def _wait_result(self, result: "AsyncPipelineResult[Any]") -> None:
+        """Wait until the results of a submitted query are received."""
+        try:
+            if self._multiplex:
+                await self._execute_multiplexed(None)
+            else:
+                async with self._conn.lock:
+                    await self._conn.wait(self._fetch_gen(flush=True))
+        except e.Error as ex:
+            raise ex.with_traceback(None)
+
+    async def _execute_multiplexed(self, gen: Optional[PQGen[Any]]) -> Any:
+        """Run a generator queuing commands in the pipeline and wait for them.
+
+        The commands are followed by a Sync, so that an error doesn't affect
+        the commands queued by other tasks. The lock is not held while waiting
+        for the results, so that other tasks can queue their commands in the
+        meantime.
+
+        Return the value returned by 'gen'. Raise the first error caused by the
+        commands queued. If 'gen' is `!None`, only wait for the commands
+        previously queued.
+        """
+        fut: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+
+        def waiter(exc: Optional[BaseException]) -> None:
+            if fut.done():
+                # The waiting task was cancelled.
+                return
+            if exc:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(None)
+
+        rv = None
+        async with self._conn.lock:
+            self._stop_wait_input()
+            if gen:
+                rv = await self._conn.wait(gen)
+            self._enqueue_sync(waiter)
+            await self._conn.wait(self._communicate_gen())
+
+        loop = asyncio.get_running_loop()
+        while not fut.done():
+            if self._reading:
+                # Another task is waiting for results: let it process them.
+                await asyncio.wait([self._reading])
+                continue
+
+            # Process the results already received, whichever task they
+            # belong to. Wait for more data without holding the lock, so that
+            # other tasks can queue their commands in the meantime.
+            self._reading = reading = loop.create_future()
+            try:
+                async with self._conn.lock:
+                    self.pgconn.consume_input()
+                    busy = self.pgconn.is_busy()
+                    if not busy:
+                        await self._conn.wait(self._fetch_available_gen())
+                if busy:
+                    await self._wait_input()
+            finally:
+                self._reading = None
+                reading.set_result(None)
+
+        await fut
+        return rv
+
+    async def _wait_input(self) -> None:
+        """Wait until there is data to read on the connection, or until another
+        task takes the lock to communicate with the server.
+        """
+        loop = asyncio.get_running_loop()
+        self._readable = fut = loop.create_future()
+        loop.add_reader(self.pgconn.socket, self._stop_wait_input)
+        try:
+            await fut
+        finally:
+            self._stop_wait_input()
+
+    def _stop_wait_input(self) -> None:
+        """Stop the task waiting in `_wait_input()`, if any.
+
+        Called by the tasks taking the lock before communicating with the
+        server: the event loop only watches a file descriptor for a single
+        reader, and they may receive the data the reader is waiting for.
+        """
+        fut, self._readable = self._readable, None
+        if not fut:
+            return
+        asyncio.get_running_loop().remove_reader(self.pgconn.socket)
+        if not fut.done():
+            fut.set_result(None)
+
     async def __aenter__(self: _Self) -> _Self:
         async with self._conn.lock:
             await self._conn.wait(self._enter_gen())
@@ -286,3 +797,140 @@ class AsyncPipeline(BasePipeline):
                 raise exc2.with_traceback(None)
         finally:
             self._exit(exc_val)
+
+
+class BasePipelineResult(Generic[Row]):
+    """
+    Base class for the handles to the result of a query submitted to a pipeline.
+    """
+
+    __slots__ = ("_pipeline", "_row_factory", "pgresult", "_error", "_rows")
+
+    def __init__(self, pipeline: BasePipeline):
+        self._pipeline = pipeline
+        self.pgresult: Optional["PGresult"] = None
+        self._error: Optional[e.Error] = None
+        self._rows: Optional[List[Row]] = None
+
+    def __repr__(self) -> str:
+        cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+        if self._error:
+            status = "error"
+        elif self.pgresult:
+            status = pq.ExecStatus(self.pgresult.status).name
+        else:
+            status = "pending"
+        return f"<{cls} [{status}] at 0x{id(self):x}>"
+
+    def done(self) -> bool:
+        """Return `!True` if the result of the query was received."""
+        return self.pgresult is not None or self._error is not None
+
+    def _set_results(self, results: List["PGresult"]) -> None:
+        # Errors are not raised, but only reported by result().
+        if self._error:
+            # The statement failed to prepare.
+            return
+        if not results:
+            self._error = e.InternalError("got no result from the query")
+            return
+
+        res = self.pgresult = results[-1]
+        status = res.status
+        if status != TUPLES_OK and status != COMMAND_OK and status != EMPTY_QUERY:
+            self._error = self._error_from_result(res)
+
+    def _set_prepare_results(self, results: List["PGresult"]) -> None:
+        (res,) = results
+        if res.status != COMMAND_OK:
+            self.pgresult = res
+            self._error = self._error_from_result(res)
+
+    def _error_from_result(self, result: "PGresult") -> e.Error:
+        status = result.status
+        if status == FATAL_ERROR:
+            encoding = pgconn_encoding(self._pipeline.pgconn)
+            return e.error_from_result(result, encoding=encoding)
+        elif status == PIPELINE_ABORTED:
+            return e.PipelineAborted("pipeline aborted")
+        else:
+            return e.ProgrammingError(
+                "unexpected result status from query:" f" {pq.ExecStatus(status).name}"
+            )
+
+    def _get_rows(self) -> List[Row]:
+        if self._error:
+            raise self._error.with_traceback(None)
+        if self.pgresult is None:
+            raise e.ProgrammingError("no result available")
+
+        if self._rows is None:
+            res = self.pgresult
+            if res.status != TUPLES_OK:
+                self._rows = []
+            else:
+                # Load the rows with a cursor, which is what row factories
+                # expect, but only now that they are requested.
+                cur = self._make_cursor()
+                cur._tx = adapt.Transformer(cur)
+                cur._results = [res]
+                cur._select_current_result(0)
+                self._rows = cur._tx.load_rows(0, res.ntuples, cur._make_row)
+
+        return self._rows
+
+    def _make_cursor(self) -> "BaseCursor[Any, Row]":
+        raise NotImplementedError
+
+
+class PipelineResult(BasePipelineResult[Row]):
+    """
+    Handle to the result of a query submitted with `Pipeline.submit()`.
+    """
+
+    __module__ = "psycopg"
+    __slots__ = ()
+    _pipeline: Pipeline
+
+    def __init__(self, pipeline: Pipeline, row_factory: RowFactory[Row]):
+        super().__init__(pipeline)
+        self._row_factory = row_factory
+
+    def _make_cursor(self) -> "BaseCursor[Any, Row]":
+        conn = self._pipeline._conn
+        return conn.cursor_factory(conn, row_factory=self._row_factory)
+
+    def result(self) -> List[Row]:
+        """
+        Return the rows returned by the query.
+
+        Wait for the result, if not available yet. Raise the error caused by
+        the query, if any. Return an empty list if the query didn't return
+        rows.
+        """
+        if not self.done():
+            self._pipeline._wait_result(self)
+        return self._get_rows()
+
+
+class AsyncPipelineResult(BasePipelineResult[Row]):
+    """
+    Handle to the result of a query submitted with `AsyncPipeline.submit()`.
+    """
+
+    __module__ = "psycopg"
+    __slots__ = ()
+    _pipeline: AsyncPipeline
+
+    def __init__(self, pipeline: AsyncPipeline, row_factory: AsyncRowFactory[Row]):
+        super().__init__(pipeline)
+        self._row_factory = row_factory
+
+    def _make_cursor(self) -> "BaseCursor[Any, Row]":
+        conn = self._pipeline._conn
+        return conn.cursor_factory(conn, row_factory=self._row_factory)
+
+    async def result(self) -> List[Row]:
+        if not self.done():
+            await self._pipeline._wait_result(self)
+        return self._get_rows()
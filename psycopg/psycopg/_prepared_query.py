@@ -0,0 +1,245 @@
+"""
+Queries prepared explicitly
+"""
+
+# Copyright (C) 2023 The Psycopg Team
+
+from types import TracebackType
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar
+from typing import TYPE_CHECKING
+from functools import partial
+
+from . import pq
+from . import adapt
+from . import errors as e
+from .abc import ConnectionType, Query, Params, PQGen
+from .rows import Row
+from .cursor import BaseCursor, Cursor
+from .cursor_async import AsyncCursor
+from .generators import execute
+from ._queries import PostgresQuery
+from ._encodings import pgconn_encoding
+
+if TYPE_CHECKING:
+    from .pq.abc import PGresult
+    from .connection import Connection
+    from .connection_async import AsyncConnection
+
+COMMAND_OK = pq.ExecStatus.COMMAND_OK
+FATAL_ERROR = pq.ExecStatus.FATAL_ERROR
+
+
+class BasePreparedQuery(Generic[ConnectionType, Row]):
+    __slots__ = ("_conn", "_cursor", "_pgq", "_names", "_generation")
+
+    def __init__(self, cursor: BaseCursor[ConnectionType, Row], query: Query):
+        self._conn = cursor.connection
+        self._cursor = cursor
+
+        # The transformer is kept across executions, together with the
+        # dumpers and loaders it selects.
+        cursor._tx = adapt.Transformer(cursor)
+        self._pgq = PostgresQuery(cursor._tx)
+        self._pgq.parse(query)
+
+        # Name of the statements prepared, by parameters types.
+        self._names: Dict[Tuple[int, ...], bytes] = {}
+        self._generation = self._conn._prepared._generation
+
+    def __repr__(self) -> str:
+        cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+        status = "closed" if self.closed else "open"
+        return f"<{cls} [{status}] {self._pgq.query!r} at 0x{id(self):x}>"
+
+    @property
+    def query(self) -> bytes:
+        """The query, as sent to the server."""
+        return self._pgq.query
+
+    @property
+    def closed(self) -> bool:
+        """`!True` if the object is closed."""
+        return self._cursor.closed
+
+    def _execute_gen(self, params: Optional[Params]) -> PQGen[None]:
+        """Generator implementing `PreparedQuery.execute()`."""
+        cur = self._cursor
+        if cur.closed:
+            raise e.InterfaceError("the prepared query is closed")
+
+        conn = self._conn
+        prepared = conn._prepared
+
+        # Run pending maintenance first: it might deallocate our statements.
+        for cmd in prepared.get_maintenance_commands():
+            yield from conn._exec_command(cmd)
+        if self._generation != prepared._generation:
+            self._names.clear()
+            self._generation = prepared._generation
+
+        cur._reset()
+        yield from conn._start_query()
+
+        pgq = self._pgq
+        pgq.dump(params)
+        cur._query = pgq
+
+        name = self._names.get(pgq.types)
+        if not name:
+            name = self._names[pgq.types] = prepared._next_name()
+            prepared._external.add(name)
+            if conn._pipeline:
+                conn._pipeline.command_queue.append(
+                    partial(
+                        cur._pgconn.send_prepare,
+                        name,
+                        pgq.query,
+                        param_types=pgq.types,
+                    )
+                )
+                conn._pipeline.result_queue.append(
+                    (partial(self._set_prepare_results, pgq.types, name), None)
+                )
+            else:
+                cur._pgconn.send_prepare(name, pgq.query, param_types=pgq.types)
+                self._set_prepare_results(
+                    pgq.types, name, (yield from execute(cur._pgconn))
+                )
+
+        cur._send_query_prepared(name, pgq)
+
+        if conn._pipeline:
+            conn._pipeline.result_queue.append((cur._set_pipeline_results, None))
+            conn._pipeline._add_pending_query(pgq)
+            yield from conn._pipeline._communicate_gen()
+            yield from conn._pipeline._maybe_sync_gen()
+            return
+
+        results = yield from execute(cur._pgconn)
+        cur._check_results(results)
+        cur._set_results(results)
+
+    def _set_prepare_results(
+        self, types: Tuple[int, ...], name: bytes, results: List["PGresult"]
+    ) -> None:
+        (result,) = results
+        if result.status == COMMAND_OK:
+            return
+
+        # The statement doesn't exist: prepare it again on the next execution.
+        if self._names.get(types) == name:
+            del self._names[types]
+        self._conn._prepared._external.discard(name)
+
+        if result.status == FATAL_ERROR:
+            raise e.error_from_result(
+                result, encoding=pgconn_encoding(self._cursor._pgconn)
+            )
+        else:
+            raise e.PipelineAborted("pipeline aborted")
+
+    def _close(self) -> None:
+        if self._cursor.closed:
+            return
+
+        # Deallocate the statements the next time the connection is used.
+        prepared = self._conn._prepared
+        if self._generation == prepared._generation:
+            for name in self._names.values():
+                if name in prepared._external:
+                    prepared._external.discard(name)
+                    prepared._maint_commands.append(b"DEALLOCATE " + name)
+
+        self._names.clear()
+        self._cursor._close()
+
+
+class PreparedQuery(BasePreparedQuery["Connection[Any]", Row]):
+    """
+    A query prepared on the server, to be executed repeatedly.
+
+    This object is returned by `Connection.prepare()`.
+    """
+
+    __module__ = "psycopg"
+    __slots__ = ()
+    _conn: "Connection[Any]"
+    _cursor: Cursor[Row]
+    _Self = TypeVar("_Self", bound="PreparedQuery[Any]")
+
+    def __enter__(self: _Self) -> _Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def execute(self, params: Optional[Params] = None) -> Cursor[Row]:
+        """
+        Execute the prepared query with the specified parameters.
+
+        :return: A cursor to read the query results. The same cursor is
+            returned at every execution.
+        """
+        try:
+            gen = self._execute_gen(params)
+            p = self._conn._pipeline
+            if p and p._multiplex:
+                p._execute_multiplexed(gen)
+            else:
+                with self._conn.lock:
+                    self._conn.wait(gen)
+        except e.Error as ex:
+            raise ex.with_traceback(None)
+        return self._cursor
+
+    def close(self) -> None:
+        """
+        Close the object and deallocate the prepared statement.
+        """
+        self._close()
+
+
+class AsyncPreparedQuery(BasePreparedQuery["AsyncConnection[Any]", Row]):
+    """
+    A query prepared on the server, to be executed repeatedly.
+
+    This object is returned by `AsyncConnection.prepare()`.
+    """
+
+    __module__ = "psycopg"
+    __slots__ = ()
+    _conn: "AsyncConnection[Any]"
+    _cursor: AsyncCursor[Row]
+    _Self = TypeVar("_Self", bound="AsyncPreparedQuery[Any]")
+
+    async def __aenter__(self: _Self) -> _Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def execute(self, params: Optional[Params] = None) -> AsyncCursor[Row]:
+        try:
+            gen = self._execute_gen(params)
+            p = self._conn._pipeline
+            if p and p._multiplex:
+                await p._execute_multiplexed(gen)
+            else:
+                async with self._conn.lock:
+                    await self._conn.wait(gen)
+        except e.Error as ex:
+            raise ex.with_traceback(None)
+        return self._cursor
+
+    async def close(self) -> None:
+        self._close()
@@ -4,8 +4,11 @@ Support for prepared statements
 
 # Copyright (C) 2020 The Psycopg Team
 
+import threading
+from time import monotonic
 from enum import IntEnum, auto
-from typing import Iterator, Optional, Sequence, Tuple, TYPE_CHECKING
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import TYPE_CHECKING
 from collections import OrderedDict
 from typing_extensions import TypeAlias
 
@@ -28,13 +31,141 @@ class Prepare(IntEnum):
     SHOULD = auto()
 
 
+class StatementStats(NamedTuple):
+    """Usage statistics about a query executed on a connection."""
+
+    query: bytes
+    """The query, as sent to the server."""
+
+    types: Tuple[int, ...]
+    """The OIDs of the query parameters."""
+
+    name: Optional[bytes]
+    """The name of the prepared statement, `!None` if not prepared."""
+
+    executions: int
+    """The number of executions of the query since it was prepared, or
+    counted towards `~Connection.prepare_threshold` if not prepared."""
+
+
+StatementStats.__module__ = "psycopg"
+
+
+class PreparedStats(NamedTuple):
+    """Statistics about the prepared statements of a connection."""
+
+    hits: int
+    """Number of executions using an already prepared statement."""
+
+    misses: int
+    """Number of executions of a query not prepared."""
+
+    prepares: int
+    """Number of statements prepared."""
+
+    evictions: int
+    """Number of statements deallocated to respect
+    `~Connection.prepared_max`."""
+
+    statements: List[StatementStats]
+    """The queries tracked: the prepared ones first, then the ones not
+    prepared yet, each group from the least recently used."""
+
+
+PreparedStats.__module__ = "psycopg"
+
+
+class PreparedRegistry:
+    """
+    A registry of frequently prepared statements, shared by several connections.
+
+    The connections the registry is attached to record in it the queries they
+    prepare; new connections can prepare the recorded statements in advance,
+    without waiting to execute them `~Connection.prepare_threshold` times.
+
+    :param maxsize: Maximum number of statements to remember; the least
+        recently prepared are forgotten first.
+    """
+
+    __module__ = "psycopg"
+
+    def __init__(self, maxsize: int = 100):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+
+        self.maxsize = maxsize
+        self._keys: OrderedDict[Key, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__module__}.{type(self).__qualname__}"
+            f" (size={len(self)}) at 0x{id(self):x}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Key) -> None:
+        """Record a statement prepared by a connection."""
+        with self._lock:
+            self._keys[key] = None
+            self._keys.move_to_end(key)
+            while len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+
+    def discard(self, key: Key) -> None:
+        """Forget a statement, for instance because it can't be prepared."""
+        with self._lock:
+            self._keys.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all the statements recorded."""
+        with self._lock:
+            self._keys.clear()
+
+    def keys(self) -> List[Key]:
+        """Return the statements recorded, from the least recently prepared."""
+        with self._lock:
+            return list(self._keys)
+
+
+class _Usage:
+    __slots__ = ("last", "latency")
+
+    def __init__(self, last: float):
+        # Time of the last execution of the query.
+        self.last = last
+        # Time taken by the last execution of the query, if measured.
+        self.latency = 0.0
+
+
 class PrepareManager:
     # Number of times a query is executed before it is prepared.
     prepare_threshold: Optional[int] = 5
 
+    # If true, adapt the threshold to the queries cost.
+    prepare_adaptive: bool = False
+
+    # In adaptive mode, queries executed again within this time (in seconds)
+    # are considered executed in a loop, and are prepared on their second
+    # execution. So are queries longer than this, with more parameters than
+    # this, or taking longer than this (in seconds) to execute, in excess of
+    # the fastest query executed on the connection, whose time is mostly the
+    # network round trip.
+    loop_interval = 0.05
+    long_query = 2048
+    many_params = 32
+    slow_query = 0.002
+
     # Maximum number of prepared statements on the connection.
     prepared_max: int = 100
 
+    # Policy to choose the prepared statement to deallocate.
+    prepared_eviction: str = "lru"
+
+    EVICTION_POLICIES = ("lru", "lfu")
+
     def __init__(self) -> None:
         # Map (query, types) to the number of times the query was seen.
         self._counts: OrderedDict[Key, int] = OrderedDict()
@@ -42,20 +173,58 @@ class PrepareManager:
         # Map (query, types) to the name of the statement if  prepared.
         self._names: OrderedDict[Key, bytes] = OrderedDict()
 
+        # Statements sent for preparation whose results were not validated yet.
+        self._unvalidated: Set[Key] = set()
+
+        # Map (query, types) to the number of executions, if prepared.
+        self._executions: Dict[Key, int] = {}
+
+        # In LFU eviction, map (query, types) to the executions credited to the
+        # statement when prepared, so that new statements can compete with
+        # the ones executed often in the past (dynamic aging).
+        self._credits: Dict[Key, int] = {}
+        self._lfu_age = 0
+
+        # In adaptive mode, map (query, types) to its usage, if not prepared.
+        self._usage: Dict[Key, _Usage] = {}
+
+        # In adaptive mode, the shortest execution time measured, estimating
+        # the network round trip time.
+        self._min_latency: Optional[float] = None
+
         # Counter to generate prepared statements names
         self._prepared_idx = 0
 
+        # Names of the statements prepared by `PreparedQuery` objects.
+        self._external: Set[bytes] = set()
+
+        # Incremented every time all the statements are deallocated.
+        self._generation = 0
+
+        # Statistics counters
+        self._hits = self._misses = self._prepares = self._evictions = 0
+
         self._maint_commands = Deque[bytes]()
 
+        # Registry shared with other connections to record the statements
+        # prepared.
+        self.registry: Optional[PreparedRegistry] = None
+
     @staticmethod
     def key(query: PostgresQuery) -> Key:
         return (query.query, query.types)
 
     def get(
-        self, query: PostgresQuery, prepare: Optional[bool] = None
+        self,
+        query: PostgresQuery,
+        prepare: Optional[bool] = None,
+        validated: bool = False,
     ) -> Tuple[Prepare, bytes]:
         """
         Check if a query is prepared, tell back whether to prepare it.
+
+        If 'validated' is true, don't use a prepared statement until the
+        result of its preparation is known.
         """
         if prepare is False or self.prepare_threshold is None:
             # The user doesn't want this query to be prepared
@@ -64,19 +233,62 @@ class PrepareManager:
         key = self.key(query)
         name = self._names.get(key)
         if name:
+            if validated and key in self._unvalidated:
+                # The preparation might still fail
+                self._misses += 1
+                return Prepare.NO, b""
             # The query was already prepared in this session
+            self._hits += 1
+            self._executions[key] += 1
             return Prepare.YES, name
 
         count = self._counts.get(key, 0)
-        if count >= self.prepare_threshold or prepare:
+        if prepare or count >= (
+            self._adaptive_threshold(query, key)
+            if self.prepare_adaptive
+            else self.prepare_threshold
+        ):
             # The query has been executed enough times and needs to be prepared
-            name = f"_pg3_{self._prepared_idx}".encode()
-            self._prepared_idx += 1
-            return Prepare.SHOULD, name
+            return Prepare.SHOULD, self._next_name()
         else:
             # The query is not to be prepared yet
+            self._misses += 1
             return Prepare.NO, b""
 
+    def _adaptive_threshold(self, query: PostgresQuery, key: Key) -> int:
+        """Return the number of executions after which to prepare 'query'."""
+        usage = self._usage.get(key)
+        if not usage:
+            # Never prepare a query on its first execution: it might be
+            # dynamically generated and never executed again.
+            return 1
+
+        if (
+            # The query is executed in a loop
+            monotonic() - usage.last < self.loop_interval
+            # The query is expensive to parse or to plan
+            or len(query.query) > self.long_query
+            or len(query.types) > self.many_params
+            or usage.latency - (self._min_latency or 0.0) > self.slow_query
+        ):
+            return 0
+
+        assert self.prepare_threshold is not None
+        return self.prepare_threshold
+
+    def record_latency(self, query: PostgresQuery, latency: float) -> None:
+        """Record the time taken to execute a query not prepared."""
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        usage = self._usage.get(self.key(query))
+        if usage:
+            usage.latency = latency
+
+    def _next_name(self) -> bytes:
+        name = f"_pg3_{self._prepared_idx}".encode()
+        self._prepared_idx += 1
+        return name
+
     def _should_discard(self, prep: Prepare, results: Sequence["PGresult"]) -> bool:
         """Check if we need to discard our entire state: it should happen on
         rollback or on dropping objects, because the same object may get
@@ -112,11 +324,29 @@ class PrepareManager:
         resized, deallocate gradually.
         """
         if len(self._counts) > self.prepared_max:
-            self._counts.popitem(last=False)
+            key = self._counts.popitem(last=False)[0]
+            self._usage.pop(key, None)
 
         if len(self._names) > self.prepared_max:
-            name = self._names.popitem(last=False)[1]
+            if self.prepared_eviction == "lfu":
+                # Evict the least executed; the least recently used if tied.
+                # Never evict the statement just added: it didn't have the
+                # chance to be executed yet.
+                keys = list(self._names)
+                if len(keys) > 1:
+                    del keys[-1]
+                key = min(keys, key=self._lfu_priority)
+                self._lfu_age = self._lfu_priority(key)
+                name = self._names.pop(key)
+            else:
+                key, name = self._names.popitem(last=False)
+            del self._executions[key]
+            self._credits.pop(key, None)
             self._maint_commands.append(b"DEALLOCATE " + name)
+            self._evictions += 1
+
+    def _lfu_priority(self, key: Key) -> int:
+        return self._executions[key] + self._credits.get(key, 0)
 
     def maybe_add_to_cache(
         self, query: PostgresQuery, prep: Prepare, name: bytes
@@ -136,10 +366,16 @@ class PrepareManager:
         if key in self._counts:
             if prep is Prepare.SHOULD:
                 del self._counts[key]
-                self._names[key] = name
+                self._usage.pop(key, None)
+                self._add_name(key, name)
+                # Validate the results: the statement preparation might fail.
+                self._unvalidated.add(key)
+                return key
             else:
                 self._counts[key] += 1
                 self._counts.move_to_end(key)
+                if self.prepare_adaptive:
+                    self._track_usage(key)
             return None
 
         elif key in self._names:
@@ -148,11 +384,27 @@ class PrepareManager:
 
         else:
             if prep is Prepare.SHOULD:
-                self._names[key] = name
+                self._add_name(key, name)
+                self._unvalidated.add(key)
             else:
                 self._counts[key] = 1
+                if self.prepare_adaptive:
+                    self._track_usage(key)
             return key
 
+    def _track_usage(self, key: Key) -> None:
+        usage = self._usage.get(key)
+        if usage:
+            usage.last = monotonic()
+        else:
+            self._usage[key] = _Usage(monotonic())
+
+    def _add_name(self, key: Key, name: bytes) -> None:
+        self._names[key] = name
+        self._executions[key] = 1
+        self._credits[key] = self._lfu_age
+        self._prepares += 1
+
     def validate(
         self,
         key: Key,
@@ -166,14 +418,34 @@ class PrepareManager:
 
         Note: this method is only called in pipeline mode.
         """
+        self._unvalidated.discard(key)
         if self._should_discard(prep, results):
             return
 
         if not self._check_results(results):
             self._names.pop(key, None)
             self._counts.pop(key, None)
+            self._executions.pop(key, None)
+            self._credits.pop(key, None)
+            self._usage.pop(key, None)
+            if self.registry is not None and prep is Prepare.SHOULD:
+                self.registry.discard(key)
         else:
             self._rotate()
+            if self.registry is not None and prep is Prepare.SHOULD:
+                self.registry.add(key)
+
+    def install(self, key: Key, name: bytes) -> None:
+        """Add to the cache a statement prepared outside the normal flow.
+
+        Used to add the statements prepared in advance from the registry.
+        """
+        self._counts.pop(key, None)
+        self._usage.pop(key, None)
+        self._names[key] = name
+        self._executions[key] = 0
+        self._credits[key] = self._lfu_age
+        self._rotate()
 
     def clear(self) -> bool:
         """Clear the cache of the maintenance commands.
@@ -182,14 +454,35 @@ class PrepareManager:
         the server.
         """
         self._counts.clear()
-        if self._names:
+        self._unvalidated.clear()
+        self._executions.clear()
+        self._credits.clear()
+        self._lfu_age = 0
+        self._usage.clear()
+        if self._names or self._external:
             self._names.clear()
+            self._external.clear()
+            self._generation += 1
             self._maint_commands.clear()
             self._maint_commands.append(b"DEALLOCATE ALL")
             return True
         else:
             return False
 
+    def stats(self) -> PreparedStats:
+        """Return the statistics about the statements tracked."""
+        stmts = [
+            StatementStats(key[0], key[1], name, self._executions[key])
+            for key, name in self._names.items()
+        ]
+        stmts.extend(
+            StatementStats(key[0], key[1], None, count)
+            for key, count in self._counts.items()
+        )
+        return PreparedStats(
+            self._hits, self._misses, self._prepares, self._evictions, stmts
+        )
+
     def get_maintenance_commands(self) -> Iterator[bytes]:
         """
         Iterate over the commands needed to align the server state to our state
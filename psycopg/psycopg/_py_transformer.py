@@ -9,8 +9,11 @@ dependencies problems).
 
 # Copyright (C) 2020 The Psycopg Team
 
+from array import array
+from weakref import proxy
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 from typing import DefaultDict, TYPE_CHECKING
+from functools import lru_cache
 from collections import defaultdict
 from typing_extensions import TypeAlias
 
@@ -18,8 +21,10 @@ from . import pq
 from . import abc
 from . import errors as e
 from .abc import Buffer, LoadFunc, AdaptContext, PyFormat, DumperKey, NoneType
-from .rows import Row, RowMaker
-from ._oids import INVALID_OID, TEXT_OID
+from .rows import Row, RowMaker, LazyRowMaker
+from ._column import ColumnArray
+from ._oids import INVALID_OID, TEXT_OID, BOOL_OID, RECORD_OID
+from ._oids import INT2_OID, INT4_OID, INT8_OID, FLOAT4_OID, FLOAT8_OID
 from ._encodings import pgconn_encoding
 
 if TYPE_CHECKING:
@@ -33,6 +38,12 @@ LoaderCache: TypeAlias = Dict[int, abc.Loader]
 
 TEXT = pq.Format.TEXT
 PY_TEXT = PyFormat.TEXT
+OK = pq.ConnStatus.OK
+
+RECORD_ARRAY_OID = 2287
+
+# Connection parameters the loaders may depend on.
+LOADERS_PARAMS = (b"client_encoding", b"DateStyle", b"IntervalStyle", b"TimeZone")
 
 
 class Transformer(AdaptContext):
@@ -155,9 +166,39 @@ class Transformer(AdaptContext):
 
         fmt: pq.Format
         fmt = result.fformat(0) if format is None else format  # type: ignore
-        self._row_loaders = [
-            self.get_loader(result.ftype(i), fmt).load for i in range(nf)
-        ]
+        self._row_loaders = self._get_row_loaders(
+            tuple(map(result.ftype, range(nf))), fmt
+        )
+
+    def _get_row_loaders(self, oids: Tuple[int, ...], fmt: pq.Format) -> List[LoadFunc]:
+        """
+        Return the load functions for a result with columns of types *oids*.
+
+        The loaders are looked up in the connection cache, so that results of
+        the same shape don't need to create their loaders again.
+        """
+        conn = self._conn
+        if (
+            not conn
+            or conn.pgconn.status != OK
+            or RECORD_OID in oids
+            or RECORD_ARRAY_OID in oids
+        ):
+            # Records loaders configure themselves on the first value, so
+            # they can't be shared by results of different queries.
+            loaders: List[LoadFunc] = [self.get_loader(oid, fmt).load for oid in oids]
+            return loaders
+
+        params = tuple(map(conn.pgconn.parameter_status, LOADERS_PARAMS))
+        cache: Optional[_LoadersCache] = conn._loaders_cache
+        if (
+            cache is None
+            or cache.loaders[fmt] is not self._adapters._loaders[fmt]
+            or cache.params != params
+        ):
+            cache = conn._loaders_cache = _LoadersCache(self, params)
+
+        return cache.get_row_loaders(oids, fmt)
 
     def set_dumper_types(self, types: Sequence[int], format: pq.Format) -> None:
         self._row_dumpers = [self.get_dumper_by_oid(oid, format) for oid in types]
@@ -302,6 +343,9 @@ class Transformer(AdaptContext):
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
+        if isinstance(make_row, LazyRowMaker):
+            return [make_row.make_lazy(res, row) for row in range(row0, row1)]
+
         records = []
         for row in range(row0, row1):
             record: List[Any] = [None] * self._nfields
@@ -321,6 +365,9 @@ class Transformer(AdaptContext):
         if not 0 <= row < self._ntuples:
             return None
 
+        if isinstance(make_row, LazyRowMaker):
+            return make_row.make_lazy(res, row)
+
         record: List[Any] = [None] * self._nfields
         for col in range(self._nfields):
             val = res.get_value(row, col)
@@ -329,6 +376,49 @@ class Transformer(AdaptContext):
 
         return make_row(record)
 
+    def load_columns(self, row0: int, row1: int) -> List[Sequence[Any]]:
+        res = self._pgresult
+        if not res:
+            raise e.InterfaceError("result not set")
+
+        if not (0 <= row0 <= self._ntuples and 0 <= row1 <= self._ntuples):
+            raise e.InterfaceError(
+                f"rows must be included between 0 and {self._ntuples}"
+            )
+
+        typecodes = _get_array_typecodes()
+        columns: List[Sequence[Any]] = []
+        for col in range(self._nfields):
+            load = self._row_loaders[col]
+            values: List[Any] = [None] * (row1 - row0)
+            has_nulls = False
+            for row in range(row0, row1):
+                val = res.get_value(row, col)
+                if val is not None:
+                    values[row - row0] = load(val)
+                else:
+                    has_nulls = True
+
+            # Use a compact array for the builtin numeric loaders, whether or
+            # not the column contains nulls, so that the type returned only
+            # depends on the column type.
+            loader = getattr(load, "__self__", None)
+            typecode = typecodes.get((type(loader), res.ftype(col)))
+            if not typecode:
+                columns.append(values)
+                continue
+
+            if not has_nulls:
+                columns.append(ColumnArray(typecode, values))
+                continue
+
+            mask = array("b", [v is None for v in values])
+            column = ColumnArray(typecode, [0 if v is None else v for v in values])
+            column.mask = mask
+            columns.append(column)
+
+        return columns
+
     def load_sequence(self, record: Sequence[Optional[Buffer]]) -> Tuple[Any, ...]:
         if len(self._row_loaders) != len(record):
             raise e.ProgrammingError(
@@ -354,3 +444,74 @@ class Transformer(AdaptContext):
                 raise e.InterfaceError("unknown oid loader not found")
         loader = self._loaders[format][oid] = loader_cls(oid, self)
         return loader
+
+
+class _LoadersCache:
+    """
+    The loaders of the results already received by a connection.
+
+    The object is stored on the connection, and it is used as the adaptation
+    context of the loaders it creates. It is valid as long as the connection
+    uses the same loaders maps and parameters seen upon creation.
+    """
+
+    __slots__ = ("adapters", "connection", "loaders", "params", "_tx", "_plans")
+
+    MAXSIZE = 128
+
+    def __init__(self, context: AdaptContext, params: Tuple[Optional[bytes], ...]):
+        from .adapt import AdaptersMap
+
+        # Copying the map makes the current loaders maps read-only.
+        self.adapters = AdaptersMap(context.adapters)
+        self.loaders = self.adapters._loaders[:]
+        self.params = params
+
+        # Use a proxy to avoid a loop between the connection and its loaders.
+        self.connection: Optional["BaseConnection[Any]"]
+        self.connection = proxy(context.connection) if context.connection else None
+
+        self._tx = Transformer(self)
+
+        # mapping fmt, oids -> load functions
+        self._plans: Tuple[Dict[Tuple[int, ...], List[LoadFunc]], ...] = ({}, {})
+
+    def get_row_loaders(self, oids: Tuple[int, ...], fmt: pq.Format) -> List[LoadFunc]:
+        plans = self._plans[fmt]
+        try:
+            return plans[oids]
+        except KeyError:
+            pass
+
+        get_loader = self._tx.get_loader
+        rv: List[LoadFunc] = [get_loader(oid, fmt).load for oid in oids]
+        if len(plans) >= self.MAXSIZE:
+            del plans[next(iter(plans))]
+        plans[oids] = rv
+        return rv
+
+
+@lru_cache()
+def _get_array_typecodes() -> Dict[Tuple[type, int], str]:
+    """
+    Return the `array` typecode to use to load a column, by loader and oid.
+
+    Only the builtin loaders are mapped: a column using a custom loader is
+    returned as a list of objects.
+    """
+    from .types import bool as b, numeric as n
+
+    return {
+        (n.IntLoader, INT2_OID): "h",
+        (n.IntLoader, INT4_OID): "i",
+        (n.IntLoader, INT8_OID): "q",
+        (n.Int2BinaryLoader, INT2_OID): "h",
+        (n.Int4BinaryLoader, INT4_OID): "i",
+        (n.Int8BinaryLoader, INT8_OID): "q",
+        (n.FloatLoader, FLOAT4_OID): "f",
+        (n.FloatLoader, FLOAT8_OID): "d",
+        (n.Float4BinaryLoader, FLOAT4_OID): "f",
+        (n.Float8BinaryLoader, FLOAT8_OID): "d",
+        (b.BoolLoader, BOOL_OID): "b",
+        (b.BoolBinaryLoader, BOOL_OID): "b",
+    }
@@ -59,26 +59,35 @@ class PostgresQuery:
         The results of this function can be obtained accessing the object
         attributes (`query`, `params`, `types`, `formats`).
         """
-        if isinstance(query, str):
-            bquery = query.encode(self._encoding)
-        elif isinstance(query, Composable):
-            bquery = query.as_bytes(self._tx)
-        else:
-            bquery = query
-
         if vars is not None:
-            (
-                self.query,
-                self._want_formats,
-                self._order,
-                self._parts,
-            ) = _query2pg(bquery, self._encoding)
+            self.parse(query)
         else:
-            self.query = bquery
+            self.query = self._encode(query)
             self._want_formats = self._order = None
 
         self.dump(vars)
 
+    def parse(self, query: Query) -> None:
+        """
+        Set up the query to convert, parsing its placeholders.
+
+        Parameters can be then passed to the query using `dump()`.
+        """
+        (
+            self.query,
+            self._want_formats,
+            self._order,
+            self._parts,
+        ) = _query2pg(self._encode(query), self._encoding)
+
+    def _encode(self, query: Query) -> bytes:
+        if isinstance(query, str):
+            return query.encode(self._encoding)
+        elif isinstance(query, Composable):
+            return query.as_bytes(self._tx)
+        else:
+            return query
+
     def dump(self, vars: Optional[Params]) -> None:
         """
         Process a new set of variables on the query processed by `convert()`.
@@ -96,6 +105,19 @@ class PostgresQuery:
             self.types = ()
             self.formats = None
 
+    def transpose(self, vars_seq: Sequence[Params]) -> List[List[Any]]:
+        """
+        Return the values of a sequence of parameters grouped by placeholder.
+
+        The query must have been processed by `convert()`. Return a list of
+        values for every ``$n`` placeholder in `query`.
+        """
+        rows = [
+            _validate_and_reorder_params(self._parts, vars, self._order)
+            for vars in vars_seq
+        ]
+        return [list(col) for col in zip(*rows)]
+
 
 class PostgresClientQuery(PostgresQuery):
     """
@@ -233,6 +255,209 @@ def _query2pg_client(
     return b"".join(chunks), order, parts
 
 
+@lru_cache()
+def _query2unnest(query: bytes, nparams: int) -> Optional[bytes]:
+    """
+    Rewrite a query to execute it once for every item of arrays of parameters.
+
+    ``query`` is in Postgres format, with ``$1`` ... ``$nparams``
+    placeholders. The placeholders in the returned query are arrays,
+    unnested together: every placeholder in the original query is replaced by
+    the respective array item.
+
+    Only simple statements are supported:
+
+    - ``INSERT ... VALUES (...)`` with a single record, whose placeholders
+      are only in the ``VALUES`` clause, and without ``ON CONFLICT DO UPDATE``
+      clause (which would fail if two records affect the same row);
+    - ``UPDATE ... WHERE ...`` without a ``FROM`` clause;
+    - ``DELETE ... WHERE ...`` without a ``USING`` clause.
+
+    Return `!None` if the query is not in one of the above forms.
+    """
+    tokens = [m for m in _re_sql_token.finditer(query) if not m.group("skip")]
+    if not (tokens and tokens[0].group("word")):
+        return None
+
+    # Find the tokens outside brackets and the matching brackets.
+    top: Dict[bytes, Match[bytes]] = {}
+    brackets: Dict[int, int] = {}
+    stack: List[int] = []
+    for i, tok in enumerate(tokens):
+        if tok.group(0) == b"(":
+            stack.append(i)
+        elif tok.group(0) == b")":
+            if not stack:
+                return None
+            brackets[stack.pop()] = i
+        elif not stack and tok.group("word"):
+            top.setdefault(tok.group(0).lower(), tok)
+    if stack:
+        return None
+
+    params = [tok for tok in tokens if tok.group("param")]
+    args = b", ".join(b"$%d" % (i + 1) for i in range(nparams))
+    cols = b", ".join(b"p%d" % (i + 1) for i in range(nparams))
+    unnest = b"unnest(%s) AS _psycopg_args(%s)" % (args, cols)
+
+    verb = tokens[0].group(0).lower()
+    if verb == b"insert":
+        if b"values" not in top:
+            return None
+        i = tokens.index(top[b"values"])
+        if i + 1 >= len(tokens) or i + 1 not in brackets:
+            return None
+        j = brackets[i + 1]
+        if j + 1 < len(tokens) and tokens[j + 1].group(0) == b",":
+            return None  # more than one record
+        start, end = tokens[i + 1].end(), tokens[j].start()
+        if any(not (start <= tok.start() < end) for tok in params):
+            return None
+        if any(tok.group(0).lower() == b"default" for tok in tokens[i + 1 : j]):
+            return None
+        if b"conflict" in top:
+            k = tokens.index(top[b"conflict"])
+            for tok, nxt in zip(tokens[k:], tokens[k + 1 :]):
+                if tok.group(0).lower() == b"do":
+                    if nxt.group(0).lower() == b"update":
+                        return None
+                    break
+
+        return b"".join(
+            (
+                query[: top[b"values"].start()],
+                b"SELECT ",
+                _sub_unnest_params(query, params, start, end),
+                b" FROM ",
+                unnest,
+                query[tokens[j].end() :],
+            )
+        )
+
+    elif verb == b"update" or verb == b"delete":
+        clause = b"FROM" if verb == b"update" else b"USING"
+        if clause.lower() in top or b"where" not in top:
+            return None
+        where = top[b"where"]
+        i = tokens.index(where)
+        if i + 1 < len(tokens) and tokens[i + 1].group(0).lower() == b"current":
+            return None  # WHERE CURRENT OF
+
+        return b"".join(
+            (
+                _sub_unnest_params(query, params, 0, where.start()),
+                clause,
+                b" ",
+                unnest,
+                b" ",
+                _sub_unnest_params(query, params, where.start(), len(query)),
+            )
+        )
+
+    return None
+
+
+@lru_cache()
+def _query2copy(query: bytes, nparams: int) -> Optional[Tuple[bytes, bytes]]:
+    """
+    Convert an INSERT query into a COPY statement loading the same records.
+
+    ``query`` is in Postgres format. Only a statement in the form
+    ``INSERT INTO table (col1, ..., colN) VALUES ($1, ..., $N)`` is
+    supported: the column list must be specified and every value must be a
+    placeholder, in the same order of the columns. Return a binary
+    ``COPY ... FROM STDIN`` statement and the name of the target table, as
+    written in the query.
+
+    Return `!None` if the query is not in the above form.
+    """
+    tokens = [m for m in _re_sql_token.finditer(query) if not m.group("skip")]
+    if tokens and tokens[-1].group(0) == b";":
+        tokens.pop()
+
+    def name(i: int) -> bool:
+        return i < len(tokens) and bool(
+            tokens[i].group("word") or tokens[i].group("ident")
+        )
+
+    def punct(i: int, c: bytes) -> bool:
+        return i < len(tokens) and tokens[i].group(0) == c
+
+    if not (
+        name(0)
+        and tokens[0].group(0).lower() == b"insert"
+        and name(1)
+        and tokens[1].group(0).lower() == b"into"
+        and name(2)
+    ):
+        return None
+
+    i = 3
+    while punct(i, b".") and name(i + 1):
+        i += 2
+    target = b"".join(tok.group(0) for tok in tokens[2:i])
+
+    cols: List[bytes] = []
+    while punct(i, b"(" if not cols else b",") and name(i + 1):
+        cols.append(tokens[i + 1].group(0))
+        i += 2
+    if not (cols and len(cols) == nparams and punct(i, b")")):
+        return None
+    i += 1
+
+    if not (name(i) and tokens[i].group(0).lower() == b"values"):
+        return None
+    i += 1
+
+    for n in range(nparams):
+        if not (
+            punct(i, b"(" if not n else b",")
+            and i + 1 < len(tokens)
+            and tokens[i + 1].group(0) == b"$%d" % (n + 1)
+        ):
+            return None
+        i += 2
+    if not (punct(i, b")") and i + 1 == len(tokens)):
+        return None
+
+    stmt = b"COPY %s (%s) FROM STDIN (FORMAT BINARY)" % (target, b", ".join(cols))
+    return stmt, target
+
+
+def _sub_unnest_params(
+    query: bytes, params: List[Match[bytes]], start: int, end: int
+) -> bytes:
+    """
+    Return a slice of a query replacing the placeholders with array items.
+    """
+    chunks = []
+    for tok in params:
+        if start <= tok.start() < end:
+            chunks.append(query[start : tok.start()])
+            chunks.append(b"_psycopg_args.p%s" % tok.group(0)[1:])
+            start = tok.end()
+    chunks.append(query[start:end])
+    return b"".join(chunks)
+
+
+_re_sql_token = re.compile(
+    rb"""(?xs)
+        (?P<skip>
+            [eE]'(?:[^'\\]|\\.|'')*'   # escape string
+            | '(?:[^']|'')*'            # string
+            | \$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?\$(?P=tag)\$  # dollar quoting
+            | --[^\n]*                  # comment
+            | /\*.*?\*/                  # block comment
+            | \s+
+        )
+        | (?P<param>\$\d+)                # placeholder
+        | (?P<word>[A-Za-z_][\w$]*)       # keyword or identifier
+        | (?P<ident>"(?:[^"]|"")*")       # quoted identifier
+        | .                             # anything else
+        """
+)
+
+
 def _validate_and_reorder_params(
     parts: List[QueryPart], vars: Params, order: Optional[List[str]]
 ) -> Sequence[Any]:
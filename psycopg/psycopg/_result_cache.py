@@ -0,0 +1,179 @@
+"""
+Client-side cache of query results
+"""
+
+# Copyright (C) 2023 The Psycopg Team
+
+import threading
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing_extensions import TypeAlias
+
+from . import pq
+from ._queries import PostgresQuery
+
+if TYPE_CHECKING:
+    from .pq.abc import PGresult
+    from .connection import Notify
+
+Key: TypeAlias = Tuple[bytes, Tuple[Optional[bytes], ...], Tuple[int, ...], pq.Format]
+
+TUPLES_OK = pq.ExecStatus.TUPLES_OK
+
+
+class _Entry:
+    __slots__ = ("results", "tags", "expires")
+
+    def __init__(
+        self, results: List["PGresult"], tags: Set[str], expires: Optional[float]
+    ):
+        self.results = results
+        self.tags = tags
+        self.expires = expires
+
+
+class ResultCache:
+    """
+    A cache of query results, which can be attached to one or more connections.
+
+    :param maxsize: Maximum number of results to keep; the least recently used
+        are evicted first.
+    :param ttl: Number of seconds after which a result is considered stale.
+        If `!None`, results never expire.
+    :param channel: Name of the :sql:`LISTEN` channel whose notifications
+        invalidate the results tagged with the notification payload.
+    """
+
+    __module__ = "psycopg"
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: Optional[float] = None,
+        channel: Optional[str] = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.channel = channel
+
+        self.hits = 0
+        """Number of queries served from the cache."""
+        self.misses = 0
+        """Number of cacheable queries not found in the cache."""
+        self.evictions = 0
+        """Number of results discarded because expired or to make room."""
+        self.invalidations = 0
+        """Number of results discarded by `invalidate()` or `clear()`."""
+
+        self._entries: OrderedDict[Key, _Entry] = OrderedDict()
+        self._tags: Dict[str, Set[Key]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__module__}.{type(self).__qualname__}"
+            f" (size={len(self)}, hits={self.hits}, misses={self.misses},"
+            f" evictions={self.evictions}) at 0x{id(self):x}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(query: PostgresQuery, format: pq.Format) -> Key:
+        params = tuple(bytes(p) if p is not None else None for p in query.params or ())
+        return (query.query, params, query.types, format)
+
+    def get(self, key: Key) -> Optional[List["PGresult"]]:
+        """
+        Return the results cached for a query, if available and not expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                if entry.expires is None or entry.expires > monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.results
+
+                self._remove(key)
+                self.evictions += 1
+
+            self.misses += 1
+            return None
+
+    def put(
+        self, key: Key, results: Sequence["PGresult"], tags: Iterable[str] = ()
+    ) -> None:
+        """
+        Store the results of a query in the cache.
+
+        Only results containing tuples are stored; results of commands are
+        ignored.
+        """
+        if not results or any(res.status != TUPLES_OK for res in results):
+            return
+
+        expires = monotonic() + self.ttl if self.ttl is not None else None
+        entry = _Entry(list(results), set(tags), expires)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        Discard the results stored with any of the specified tags.
+        """
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Discard all the results stored.
+        """
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._tags.clear()
+
+    def handle_notify(self, n: "Notify") -> None:
+        """
+        Invalidate the cache upon receiving a notification on `channel`.
+
+        A notification with a payload invalidates the results with that tag;
+        one without a payload clears the cache. The method is registered as
+        notify handler on the connections the cache is attached to.
+        """
+        if n.channel != self.channel:
+            return
+
+        if n.payload:
+            self.invalidate(n.payload)
+        else:
+            self.clear()
+
+    def _remove(self, key: Key) -> None:
+        entry = self._entries.pop(key)
+        for tag in entry.tags:
+            keys = self._tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
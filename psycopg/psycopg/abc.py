@@ -258,6 +258,9 @@ class Transformer(Protocol):
     def load_row(self, row: int, make_row: "RowMaker[Row]") -> Optional["Row"]:
         ...
 
+    def load_columns(self, row0: int, row1: int) -> List[Sequence[Any]]:
+        ...
+
     def load_sequence(self, record: Sequence[Optional[Buffer]]) -> Tuple[Any, ...]:
         ...
 
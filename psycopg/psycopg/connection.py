@@ -8,8 +8,8 @@ import logging
 import threading
 from types import TracebackType
 from typing import Any, Callable, cast, Dict, Generator, Generic, Iterator
-from typing import List, NamedTuple, Optional, Type, TypeVar, Tuple, Union
-from typing import overload, TYPE_CHECKING
+from typing import List, NamedTuple, Optional, Sequence, Type, TypeVar, Tuple
+from typing import Union, overload, TYPE_CHECKING
 from weakref import ref, ReferenceType
 from warnings import warn
 from functools import partial
@@ -28,14 +28,16 @@ from .rows import Row, RowFactory, tuple_row, TupleRow, args_row
 from .adapt import AdaptersMap
 from ._enums import IsolationLevel
 from .cursor import Cursor
+from ._prepared_query import PreparedQuery
 from ._compat import LiteralString
 from .conninfo import make_conninfo, conninfo_to_dict, ConnectionInfo
 from ._pipeline import BasePipeline, Pipeline
 from .generators import notifies, connect, execute
 from ._encodings import pgconn_encoding
-from ._preparing import PrepareManager
+from ._preparing import Key, PrepareManager, PreparedRegistry, PreparedStats
+from ._result_cache import ResultCache
 from .transaction import Transaction
-from .server_cursor import ServerCursor
+from .server_cursor import ServerCursor, ServerCursorMixin
 
 if TYPE_CHECKING:
     from .pq.abc import PGconn, PGresult
@@ -120,8 +122,12 @@ class BaseConnection(Generic[Row]):
 
         self._closed = False  # closed by an explicit close()
         self._prepared: PrepareManager = PrepareManager()
+        self._result_cache: Optional[ResultCache] = None
         self._tpc: Optional[Tuple[Xid, bool]] = None  # xid, prepared
 
+        # Loaders for the results already seen, managed by the Transformer.
+        self._loaders_cache: Any = None
+
         wself = ref(self)
         pgconn.notice_handler = partial(BaseConnection._notice_handler, wself)
         pgconn.notify_handler = partial(BaseConnection._notify_handler, wself)
@@ -132,6 +138,10 @@ class BaseConnection(Generic[Row]):
 
         self._pipeline: Optional[BasePipeline] = None
 
+        # Server cursor with a FETCH sent in advance, whose result was not
+        # received yet.
+        self._prefetching: Optional[ServerCursorMixin[Any, Any]] = None
+
         # Time after which the connection should be closed
         self._expire_at: float
 
@@ -395,6 +405,25 @@ class BaseConnection(Generic[Row]):
     def prepare_threshold(self, value: Optional[int]) -> None:
         self._prepared.prepare_threshold = value
 
+    @property
+    def prepare_adaptive(self) -> bool:
+        """
+        If `!True`, decide when to prepare a query according to its cost,
+        using `prepare_threshold` only for the queries with no special
+        treatment.
+
+        See :ref:`prepare-adaptive` for details.
+
+        Default value: `!False`
+        """
+        return self._prepared.prepare_adaptive
+
+    @prepare_adaptive.setter
+    def prepare_adaptive(self, value: bool) -> None:
+        self._prepared.prepare_adaptive = value
+        if not value:
+            self._prepared._usage.clear()
+
     @property
     def prepared_max(self) -> int:
         """
@@ -408,6 +437,65 @@ class BaseConnection(Generic[Row]):
     def prepared_max(self, value: int) -> None:
         self._prepared.prepared_max = value
 
+    @property
+    def prepared_eviction(self) -> str:
+        """
+        The policy to choose the prepared statement to deallocate when more
+        than `prepared_max` statements are prepared.
+
+        - ``"lru"``: deallocate the least recently used statement.
+        - ``"lfu"``: deallocate the least frequently executed statement (the
+          least recently used among the ones executed the same number of
+          times).
+
+        Default value: ``"lru"``
+        """
+        return self._prepared.prepared_eviction
+
+    @prepared_eviction.setter
+    def prepared_eviction(self, value: str) -> None:
+        if value not in PrepareManager.EVICTION_POLICIES:
+            raise ValueError(f"bad prepared_eviction policy: {value!r}")
+        self._prepared.prepared_eviction = value
+
+    def prepared_stats(self) -> PreparedStats:
+        """
+        Return statistics about the prepared statements of the connection.
+        """
+        return self._prepared.stats()
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """
+        The `ResultCache` used to store the results of queries executed with
+        `!cache=True`.
+
+        Default value: `!None`, meaning that results are not cached.
+        """
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, value: Optional[ResultCache]) -> None:
+        if self._result_cache is not None and self._result_cache.channel:
+            self.remove_notify_handler(self._result_cache.handle_notify)
+        self._result_cache = value
+        if value is not None and value.channel:
+            self.add_notify_handler(value.handle_notify)
+
+    @property
+    def prepared_registry(self) -> Optional[PreparedRegistry]:
+        """
+        The `PreparedRegistry` where the statements prepared on the connection
+        are recorded.
+
+        Default value: `!None`, meaning that prepared statements are not shared.
+        """
+        return self._prepared.registry
+
+    @prepared_registry.setter
+    def prepared_registry(self, value: Optional[PreparedRegistry]) -> None:
+        self._prepared.registry = value
+
     # Generators to perform high-level operations on the connection
     #
     # These operations are expressed in terms of non-blocking generators
@@ -431,6 +519,17 @@ class BaseConnection(Generic[Row]):
         conn._autocommit = bool(autocommit)
         return conn
 
+    def _receive_fetch_gen(self) -> PQGen[None]:
+        """
+        Receive the result of a FETCH sent in advance by a server cursor, if any.
+
+        The result is kept by the cursor until its iteration continues, leaving
+        the connection free for other operations.
+        """
+        cur, self._prefetching = self._prefetching, None
+        if cur:
+            yield from cur._fetch_stash_gen()
+
     def _exec_command(
         self, command: Query, result_format: pq.Format = TEXT
     ) -> PQGen[Optional["PGresult"]]:
@@ -471,6 +570,45 @@ class BaseConnection(Generic[Row]):
                 )
         return result
 
+    def _preload_prepared_gen(self) -> PQGen[None]:
+        """
+        Generator to prepare the statements recorded in the prepared registry.
+
+        In pipeline mode the statements are only queued: they are sent, each
+        one followed by a Sync, when the pipeline is synced. A statement that
+        fails to prepare is dropped from the registry.
+        """
+        self._check_connection_ok()
+
+        prepared = self._prepared
+        registry = prepared.registry
+        if registry is None or prepared.prepare_threshold is None:
+            return
+
+        for key in registry.keys()[-prepared.prepared_max :]:
+            if key in prepared._names:
+                continue
+            name = prepared._next_name()
+            if self._pipeline:
+                self._pipeline.command_queue.append(
+                    partial(self.pgconn.send_prepare, name, key[0], param_types=key[1])
+                )
+                self._pipeline.result_queue.append(
+                    (partial(self._preloaded, key, name), None)
+                )
+                self._pipeline._enqueue_sync()
+            else:
+                self.pgconn.send_prepare(name, key[0], param_types=key[1])
+                self._preloaded(key, name, (yield from execute(self.pgconn)))
+
+    def _preloaded(self, key: Key, name: bytes, results: List["PGresult"]) -> None:
+        status = results[0].status
+        if status == COMMAND_OK:
+            self._prepared.install(key, name)
+        elif status == FATAL_ERROR:
+            assert self._prepared.registry is not None
+            self._prepared.registry.discard(key)
+
     def _check_connection_ok(self) -> None:
         if self.pgconn.status == OK:
             return
@@ -866,6 +1004,8 @@ class Connection(BaseConnection[Row]):
         *,
         prepare: Optional[bool] = None,
         binary: bool = False,
+        cache: bool = False,
+        cache_tags: Sequence[str] = (),
     ) -> Cursor[Row]:
         """Execute a query and return a cursor to read its results."""
         try:
@@ -873,11 +1013,39 @@ class Connection(BaseConnection[Row]):
             if binary:
                 cur.format = BINARY
 
-            return cur.execute(query, params, prepare=prepare)
+            return cur.execute(
+                query, params, prepare=prepare, cache=cache, cache_tags=cache_tags
+            )
 
         except e.Error as ex:
             raise ex.with_traceback(None)
 
+    @overload
+    def prepare(self, query: Query, *, binary: bool = False) -> PreparedQuery[Row]:
+        ...
+
+    @overload
+    def prepare(
+        self, query: Query, *, binary: bool = False, row_factory: RowFactory[CursorRow]
+    ) -> PreparedQuery[CursorRow]:
+        ...
+
+    def prepare(
+        self,
+        query: Query,
+        *,
+        binary: bool = False,
+        row_factory: Optional[RowFactory[Any]] = None,
+    ) -> PreparedQuery[Any]:
+        """
+        Return an object to execute a query repeatedly as a prepared statement.
+        """
+        self._check_connection_ok()
+        cur = Cursor(self, row_factory=row_factory or self.row_factory)
+        if binary:
+            cur.format = BINARY
+        return PreparedQuery(cur, query)
+
     def commit(self) -> None:
         """Commit any pending transaction to the database."""
         with self.lock:
@@ -903,6 +1071,10 @@ class Connection(BaseConnection[Row]):
             block even if there were no error (e.g. to try a no-op process).
         :rtype: Transaction
         """
+        if self._pipeline and self._pipeline._multiplex:
+            raise e.ProgrammingError(
+                "transaction() cannot be used in multiplexed pipeline mode"
+            )
         tx = Transaction(self, savepoint_name, force_rollback)
         if self._pipeline:
             with self.pipeline(), tx, self.pipeline():
@@ -927,15 +1099,39 @@ class Connection(BaseConnection[Row]):
                 yield n
 
     @contextmanager
-    def pipeline(self) -> Iterator[Pipeline]:
+    def pipeline(
+        self,
+        *,
+        max_pending: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        multiplex: bool = False,
+    ) -> Iterator[Pipeline]:
         """Switch the connection into pipeline mode."""
         with self.lock:
             self._check_connection_ok()
 
             pipeline = self._pipeline
+            if multiplex:
+                if not self.autocommit:
+                    raise e.ProgrammingError(
+                        "multiplexed pipeline mode requires an autocommit connection"
+                    )
+                if pipeline and not pipeline._multiplex:
+                    raise e.ProgrammingError(
+                        "can't enter multiplexed mode in a non-multiplexed pipeline"
+                    )
+
             if pipeline is None:
                 # WARNING: reference loop, broken ahead.
-                pipeline = self._pipeline = Pipeline(self)
+                pipeline = self._pipeline = Pipeline(
+                    self, max_pending=max_pending, max_bytes=max_bytes
+                )
+                pipeline._multiplex = multiplex
+            else:
+                if max_pending is not None:
+                    pipeline.max_pending = max_pending
+                if max_bytes is not None:
+                    pipeline.max_bytes = max_bytes
 
         try:
             with pipeline:
@@ -946,6 +1142,22 @@ class Connection(BaseConnection[Row]):
                     assert pipeline is self._pipeline
                     self._pipeline = None
 
+    def _preload_prepared(self) -> None:
+        """Prepare the statements recorded in `prepared_registry`.
+
+        If pipeline mode is supported, all the statements are prepared in a
+        single roundtrip.
+        """
+        if not self._prepared.registry:
+            return
+
+        if Pipeline.is_supported():
+            with self.pipeline(), self.lock:
+                self.wait(self._preload_prepared_gen())
+        else:
+            with self.lock:
+                self.wait(self._preload_prepared_gen())
+
     def wait(self, gen: PQGen[RV], timeout: Optional[float] = 0.1) -> RV:
         """
         Consume a generator operating on the connection.
@@ -954,6 +1166,8 @@ class Connection(BaseConnection[Row]):
         fd (i.e. not on connect and reset).
         """
         try:
+            if self._prefetching:
+                waiting.wait(self._receive_fetch_gen(), self.pgconn.socket)
             return waiting.wait(gen, self.pgconn.socket, timeout=timeout)
         except KeyboardInterrupt:
             # On Ctrl-C, try to cancel the query in the server, otherwise
@@ -9,7 +9,7 @@ import asyncio
 import logging
 from types import TracebackType
 from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional
-from typing import Type, TypeVar, Union, cast, overload, TYPE_CHECKING
+from typing import Sequence, Type, TypeVar, Union, cast, overload, TYPE_CHECKING
 from contextlib import asynccontextmanager
 
 from . import pq
@@ -27,6 +27,7 @@ from .connection import BaseConnection, CursorRow, Notify
 from .generators import notifies
 from .transaction import AsyncTransaction
 from .cursor_async import AsyncCursor
+from ._prepared_query import AsyncPreparedQuery
 from .server_cursor import AsyncServerCursor
 
 if TYPE_CHECKING:
@@ -273,17 +274,48 @@ class AsyncConnection(BaseConnection[Row]):
         *,
         prepare: Optional[bool] = None,
         binary: bool = False,
+        cache: bool = False,
+        cache_tags: Sequence[str] = (),
     ) -> AsyncCursor[Row]:
         try:
             cur = self.cursor()
             if binary:
                 cur.format = BINARY
 
-            return await cur.execute(query, params, prepare=prepare)
+            return await cur.execute(
+                query, params, prepare=prepare, cache=cache, cache_tags=cache_tags
+            )
 
         except e.Error as ex:
             raise ex.with_traceback(None)
 
+    @overload
+    def prepare(self, query: Query, *, binary: bool = False) -> AsyncPreparedQuery[Row]:
+        ...
+
+    @overload
+    def prepare(
+        self,
+        query: Query,
+        *,
+        binary: bool = False,
+        row_factory: AsyncRowFactory[CursorRow],
+    ) -> AsyncPreparedQuery[CursorRow]:
+        ...
+
+    def prepare(
+        self,
+        query: Query,
+        *,
+        binary: bool = False,
+        row_factory: Optional[AsyncRowFactory[Any]] = None,
+    ) -> AsyncPreparedQuery[Any]:
+        self._check_connection_ok()
+        cur = AsyncCursor(self, row_factory=row_factory or self.row_factory)
+        if binary:
+            cur.format = BINARY
+        return AsyncPreparedQuery(cur, query)
+
     async def commit(self) -> None:
         async with self.lock:
             await self.wait(self._commit_gen())
@@ -303,6 +335,10 @@ class AsyncConnection(BaseConnection[Row]):
 
         :rtype: AsyncTransaction
         """
+        if self._pipeline and self._pipeline._multiplex:
+            raise e.ProgrammingError(
+                "transaction() cannot be used in multiplexed pipeline mode"
+            )
         tx = AsyncTransaction(self, savepoint_name, force_rollback)
         if self._pipeline:
             async with self.pipeline(), tx, self.pipeline():
@@ -324,15 +360,39 @@ class AsyncConnection(BaseConnection[Row]):
                 yield n
 
     @asynccontextmanager
-    async def pipeline(self) -> AsyncIterator[AsyncPipeline]:
+    async def pipeline(
+        self,
+        *,
+        max_pending: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        multiplex: bool = False,
+    ) -> AsyncIterator[AsyncPipeline]:
         """Context manager to switch the connection into pipeline mode."""
         async with self.lock:
             self._check_connection_ok()
 
             pipeline = self._pipeline
+            if multiplex:
+                if not self.autocommit:
+                    raise e.ProgrammingError(
+                        "multiplexed pipeline mode requires an autocommit connection"
+                    )
+                if pipeline and not pipeline._multiplex:
+                    raise e.ProgrammingError(
+                        "can't enter multiplexed mode in a non-multiplexed pipeline"
+                    )
+
             if pipeline is None:
                 # WARNING: reference loop, broken ahead.
-                pipeline = self._pipeline = AsyncPipeline(self)
+                pipeline = self._pipeline = AsyncPipeline(
+                    self, max_pending=max_pending, max_bytes=max_bytes
+                )
+                pipeline._multiplex = multiplex
+            else:
+                if max_pending is not None:
+                    pipeline.max_pending = max_pending
+                if max_bytes is not None:
+                    pipeline.max_bytes = max_bytes
 
         try:
             async with pipeline:
@@ -343,8 +403,28 @@ class AsyncConnection(BaseConnection[Row]):
                     assert pipeline is self._pipeline
                     self._pipeline = None
 
+    async def _preload_prepared(self) -> None:
+        """Prepare the statements recorded in `prepared_registry`.
+
+        If pipeline mode is supported, all the statements are prepared in a
+        single roundtrip.
+        """
+        if not self._prepared.registry:
+            return
+
+        if AsyncPipeline.is_supported():
+            async with self.pipeline():
+                async with self.lock:
+                    await self.wait(self._preload_prepared_gen())
+        else:
+            async with self.lock:
+                await self.wait(self._preload_prepared_gen())
+
     async def wait(self, gen: PQGen[RV]) -> RV:
         try:
+            if self._prefetching:
+                gen1 = self._receive_fetch_gen()
+                await waiting.wait_async(gen1, self.pgconn.socket)
             return await waiting.wait_async(gen, self.pgconn.socket)
         except KeyboardInterrupt:
             # TODO: this doesn't seem to work as it does for sync connections
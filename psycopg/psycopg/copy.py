@@ -4,26 +4,34 @@ psycopg copy support
 
 # Copyright (C) 2020 The Psycopg Team
 
+import io
+import os
 import re
+import mmap
 import queue
 import struct
 import asyncio
 import threading
+import zlib
 from abc import ABC, abstractmethod
 from types import TracebackType
-from typing import Any, AsyncIterator, Dict, Generic, Iterator, List, Match, IO
+from typing import Any, AsyncIterator, Callable, Dict, Generic, Iterator, List
+from typing import Match, IO
 from typing import Optional, Sequence, Tuple, Type, TypeVar, Union, TYPE_CHECKING
+from typing_extensions import TypeAlias
 
 from . import pq
 from . import adapt
 from . import errors as e
-from .abc import Buffer, ConnectionType, PQGen, Transformer
-from ._compat import create_task
+from .abc import Buffer, ConnectionType, Params, PQGen, Query, Transformer
+from ._compat import create_task, Protocol
 from ._cmodule import _psycopg
 from ._encodings import pgconn_encoding
-from .generators import copy_from, copy_to, copy_end
+from .generators import copy_from, copy_from_into, copy_from_many
+from .generators import copy_to, copy_end
 
 if TYPE_CHECKING:
+    from .pq.abc import PGresult
     from .cursor import BaseCursor, Cursor
     from .cursor_async import AsyncCursor
     from .connection import Connection  # noqa: F401
@@ -58,6 +66,29 @@ MAX_BUFFER_SIZE = 4 * BUFFER_SIZE
 # Each buffer should be around BUFFER_SIZE size.
 QUEUE_SIZE = 1024
 
+# Max number of buffers queued to compress by read_into(). Each buffer should
+# be around MAX_BUFFER_SIZE size.
+COMPRESS_QUEUE_SIZE = 16
+
+# Number of blocks of data (usually rows) received by AsyncCopy.read_into()
+# before writing them to the file in an executor.
+READ_INTO_BATCH = 1024
+
+FileSource: TypeAlias = Union[str, "os.PathLike[str]", IO[bytes]]
+FileTarget: TypeAlias = Union[int, str, "os.PathLike[str]", IO[bytes]]
+
+
+class Compressor(Protocol):
+    """
+    An object to compress data, such as the ones returned by `zlib.compressobj()`.
+    """
+
+    def compress(self, data: Buffer) -> bytes:
+        ...
+
+    def flush(self) -> bytes:
+        ...
+
 
 class BaseCopy(Generic[ConnectionType]):
     """
@@ -157,14 +188,7 @@ class BaseCopy(Generic[ConnectionType]):
             return res
 
         # res is the final PGresult
-        self._finished = True
-
-        # This result is a COMMAND_OK which has info about the number of rows
-        # returned, but not about the columns, which is instead an information
-        # that was received on the COPY_OUT result at the beginning of COPY.
-        # So, don't replace the results in the cursor, just update the rowcount.
-        nrows = res.command_tuples
-        self.cursor._rowcount = nrows if nrows is not None else -1
+        self._set_copy_out_result(res)
         return memoryview(b"")
 
     def _read_row_gen(self) -> PQGen[Optional[Tuple[Any, ...]]]:
@@ -181,6 +205,40 @@ class BaseCopy(Generic[ConnectionType]):
 
         return row
 
+    def _read_blocks_gen(self, n: int) -> PQGen[List[Buffer]]:
+        if self._finished:
+            return []
+
+        blocks, res = yield from copy_from_many(self._pgconn, n)
+        if res:
+            self._set_copy_out_result(res)
+
+        return blocks
+
+    def _read_rows_gen(self, n: int) -> PQGen[List[Tuple[Any, ...]]]:
+        if n < 1:
+            raise ValueError(f"the number of rows must be positive, got {n}")
+
+        rows: List[Tuple[Any, ...]] = []
+        while not (rows or self._finished):
+            blocks, res = yield from copy_from_many(self._pgconn, n)
+            # Note: blocks may contain no row, e.g. only the binary trailer.
+            rows = self.formatter.parse_rows(blocks)
+            if res:
+                self._set_copy_out_result(res)
+
+        return rows
+
+    def _set_copy_out_result(self, res: "PGresult") -> None:
+        self._finished = True
+
+        # This result is a COMMAND_OK which has info about the number of rows
+        # returned, but not about the columns, which is instead an information
+        # that was received on the COPY_OUT result at the beginning of COPY.
+        # So, don't replace the results in the cursor, just update the rowcount.
+        nrows = res.command_tuples
+        self.cursor._rowcount = nrows if nrows is not None else -1
+
     def _end_copy_out_gen(self, exc: Optional[BaseException]) -> PQGen[None]:
         if not exc:
             return
@@ -201,6 +259,46 @@ class BaseCopy(Generic[ConnectionType]):
         except e.QueryCanceled:
             pass
 
+    def _read_into_gen(self, target: Union[int, Callable[[Buffer], Any]]) -> PQGen[int]:
+        if self._finished:
+            return 0
+
+        nbytes, res = yield from copy_from_into(self._pgconn, target)
+        self._set_copy_out_result(res)
+        return nbytes
+
+    def _file_chunks(self, file: FileSource) -> Iterator[Buffer]:
+        """
+        Return the content of a file in chunks of at most `MAX_BUFFER_SIZE`.
+
+        If possible, the file is memory-mapped and the chunks are slices of
+        the map, so that the data is not copied into Python objects.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as f:
+                yield from self._file_chunks(f)
+            return
+
+        try:
+            m = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Not a regular file (e.g. a pipe or an in-memory file), or an
+            # empty file, which cannot be mapped: read it in chunks instead.
+            while True:
+                data = file.read(MAX_BUFFER_SIZE)
+                if not data:
+                    break
+                yield data
+            return
+
+        # Don't close the map: the writer might still hold some of the slices
+        # (e.g. in a queue). It will be released when the last one goes away.
+        view = memoryview(m)
+        start = file.tell()
+        for i in range(start, len(view), MAX_BUFFER_SIZE):
+            yield view[i : i + MAX_BUFFER_SIZE]
+        file.seek(0, io.SEEK_END)
+
 
 class Copy(BaseCopy["Connection[Any]"]):
     """Manage a :sql:`COPY` operation.
@@ -266,18 +364,28 @@ class Copy(BaseCopy["Connection[Any]"]):
         """
         return self.connection.wait(self._read_gen())
 
-    def rows(self) -> Iterator[Tuple[Any, ...]]:
+    def rows(self, batch: Optional[int] = None) -> Iterator[Tuple[Any, ...]]:
         """
         Iterate on the result of a :sql:`COPY TO` operation record by record.
 
+        :param batch: if specified, read and parse the records in batches of
+            this size, using `read_rows()`.
+
         Note that the records returned will be tuples of unparsed strings or
         bytes, unless data types are specified using `set_types()`.
         """
-        while True:
-            record = self.read_row()
-            if record is None:
-                break
-            yield record
+        if batch:
+            while True:
+                records = self.read_rows(batch)
+                if not records:
+                    break
+                yield from records
+        else:
+            while True:
+                record = self.read_row()
+                if record is None:
+                    break
+                yield record
 
     def read_row(self) -> Optional[Tuple[Any, ...]]:
         """
@@ -290,6 +398,46 @@ class Copy(BaseCopy["Connection[Any]"]):
         """
         return self.connection.wait(self._read_row_gen())
 
+    def read_rows(self, n: int) -> List[Tuple[Any, ...]]:
+        """
+        Read up to `!n` parsed rows of data after a :sql:`COPY TO` operation.
+
+        Return fewer than `!n` rows only when the data is finished, and an
+        empty list after that.
+
+        The data received is parsed in a single step, which is faster than
+        reading the rows one by one with `read_row()`.
+        """
+        return self.connection.wait(self._read_rows_gen(n))
+
+    def read_into(
+        self, file: FileTarget, compress: Union[None, str, Compressor] = None
+    ) -> int:
+        """
+        Write all the data of a :sql:`COPY TO` operation to a file.
+
+        :param file: the file to write: a path, a file descriptor, or a file
+            object open in binary mode.
+        :param compress: compress the data before writing it. It can be
+            ``"gzip"`` or an object with `!compress()` and `!flush()` methods,
+            such as the ones returned by `zlib.compressobj()`. The data is
+            compressed in a separate thread.
+        :return: the number of bytes of data received (before compression).
+
+        The data is received and written without passing through Python
+        objects if `!file` is a path or a file descriptor and no compression
+        is requested.
+        """
+        sink = _FileSink(file, compress)
+        try:
+            nbytes = self.connection.wait(self._read_into_gen(sink.target))
+        except BaseException as ex:
+            sink.close(ex)
+            raise
+
+        sink.close()
+        return nbytes
+
     def write(self, buffer: Union[Buffer, str]) -> None:
         """
         Write a block of data to a table after a :sql:`COPY FROM` operation.
@@ -301,6 +449,21 @@ class Copy(BaseCopy["Connection[Any]"]):
         if data:
             self._write(data)
 
+    def write_file(self, file: FileSource) -> None:
+        """
+        Write the content of a file to a table after a :sql:`COPY FROM`
+        operation.
+
+        `!file` can be a path or a file object open in binary mode; in the
+        latter case, data is read from the current position to the end. The
+        content must be in the format of the :sql:`COPY` operation.
+
+        Regular files are memory-mapped and passed to the connection in
+        slices, without reading them into Python objects.
+        """
+        for data in self._file_chunks(file):
+            self.write(data)
+
     def write_row(self, row: Sequence[Any]) -> None:
         """Write a record to a table after a :sql:`COPY FROM` operation."""
         data = self.formatter.write_row(row)
@@ -363,6 +526,8 @@ class LibpqWriter(Writer):
         else:
             # Copy a buffer too large in chunks to avoid causing a memory
             # error in the libpq, which may cause an infinite loop (#255).
+            # Slice a memoryview, so that the chunks don't copy the data.
+            data = memoryview(data)
             for i in range(0, len(data), MAX_BUFFER_SIZE):
                 self.connection.wait(
                     copy_to(self._pgconn, data[i : i + MAX_BUFFER_SIZE])
@@ -432,8 +597,11 @@ class QueuedLibpqDriver(LibpqWriter):
         else:
             # Copy a buffer too large in chunks to avoid causing a memory
             # error in the libpq, which may cause an infinite loop (#255).
+            # Copy the chunks: the caller may change or reuse the buffer
+            # before the worker has sent them.
+            data = memoryview(data)
             for i in range(0, len(data), MAX_BUFFER_SIZE):
-                self._queue.put(data[i : i + MAX_BUFFER_SIZE])
+                self._queue.put(bytes(data[i : i + MAX_BUFFER_SIZE]))
 
     def finish(self, exc: Optional[BaseException] = None) -> None:
         self._queue.put(b"")
@@ -464,6 +632,191 @@ class FileWriter(Writer):
         self.file.write(data)  # type: ignore[arg-type]
 
 
+class _FileSink:
+    """
+    The destination of the data of `Copy.read_into()`.
+
+    Expose, as `target`, a file descriptor or a function to pass the data to.
+    If compression is requested, the data is compressed and written by a
+    worker thread.
+
+    If `!threaded` is false, no worker thread is used: `target` is `write()`,
+    which compresses and writes the data in the calling thread.
+    """
+
+    def __init__(
+        self,
+        file: FileTarget,
+        compress: Union[None, str, Compressor],
+        threaded: bool = True,
+    ):
+        self._compressor: Optional[Compressor]
+        if compress is None:
+            self._compressor = None
+        elif compress == "gzip":
+            self._compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        elif isinstance(compress, str):
+            raise ValueError(f"unknown compression: {compress!r}")
+        else:
+            self._compressor = compress
+
+        self._fd = -1
+        self._close_fd = False
+        self._file: Optional[IO[bytes]] = None
+        self._close_file = False
+        self._worker: Optional[threading.Thread] = None
+        self._worker_error: Optional[BaseException] = None
+        if isinstance(file, int):
+            self._fd = file
+        elif isinstance(file, (str, os.PathLike)):
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            self._fd = os.open(file, flags, 0o666)
+            self._close_fd = True
+        else:
+            self._file = file
+
+        self.target: Union[int, Callable[[Buffer], Any]]
+        if threaded and not self._compressor:
+            self.target = self._fd if self._file is None else self._file.write
+            return
+
+        if self._file is None:
+            self._file = open(self._fd, "wb", closefd=False)
+            self._close_file = True
+
+        if not threaded:
+            self.target = self.write
+            return
+
+        self.target = self._put
+        self._buffer = bytearray()
+        self._queue: queue.Queue[Optional[bytearray]]
+        self._queue = queue.Queue(maxsize=COMPRESS_QUEUE_SIZE)
+        # warning: reference loop, broken by close()
+        self._worker = threading.Thread(target=self.worker, daemon=True)
+        self._worker.start()
+
+    def worker(self) -> None:
+        """Compress and write the data queued, until receiving `!None`.
+
+        In case of error keep on consuming the queue, so that the producer
+        doesn't block, and report the error on the next `_put()`.
+        """
+        assert self._compressor and self._file
+        while True:
+            data = self._queue.get(block=True, timeout=24 * 60 * 60)
+            if data is None:
+                break
+            if self._worker_error:
+                continue
+            try:
+                self.write(data)
+            except BaseException as ex:
+                self._worker_error = ex
+
+        if not self._worker_error:
+            try:
+                self._file.write(self._compressor.flush())
+            except BaseException as ex:
+                self._worker_error = ex
+
+    def write(self, data: Buffer) -> None:
+        """Compress, if requested, and write a block of data to the file."""
+        assert self._file
+        if self._compressor:
+            data = self._compressor.compress(data)
+        self._file.write(data)
+
+    def _put(self, data: Buffer) -> None:
+        # If the worker thread raised an exception, re-raise it to the caller.
+        if self._worker_error:
+            raise self._worker_error
+
+        # Copy data arrives one row at time: accumulate it in larger buffers,
+        # which are cheaper to pass around and to compress.
+        self._buffer += data
+        if len(self._buffer) >= MAX_BUFFER_SIZE:
+            self._queue.put(self._buffer)
+            self._buffer = bytearray()
+
+    def close(self, exc: Optional[BaseException] = None) -> None:
+        """
+        Terminate writing and release the resources.
+
+        Raise the error of the worker thread, if any, unless `!exc` is
+        specified.
+        """
+        try:
+            if self._worker:
+                if self._buffer and not exc:
+                    self._queue.put(self._buffer)
+                self._queue.put(None)
+                self._worker.join()
+                self._worker = None  # break the loop
+            elif self._compressor and self._file and not exc:
+                self._file.write(self._compressor.flush())
+
+            if self._file:
+                if self._close_file:
+                    self._file.close()
+                else:
+                    self._file.flush()
+
+            if self._worker_error and not exc:
+                raise self._worker_error
+        finally:
+            if self._close_fd:
+                os.close(self._fd)
+                self._close_fd = False
+
+
+def pipe(
+    src_cursor: "Cursor[Any]",
+    src_statement: Query,
+    dst_cursor: "Cursor[Any]",
+    dst_statement: Query,
+    *,
+    src_params: Optional[Params] = None,
+    dst_params: Optional[Params] = None,
+) -> int:
+    """
+    Copy data from a :sql:`COPY TO` operation to a :sql:`COPY FROM` operation.
+
+    :param src_cursor: the cursor to run `!src_statement` on.
+    :param src_statement: a :sql:`COPY ... TO STDOUT` statement.
+    :param dst_cursor: the cursor to run `!dst_statement` on. It must be
+        on a different connection than `!src_cursor`.
+    :param dst_statement: a :sql:`COPY ... FROM STDIN` statement.
+    :return: the number of records copied.
+
+    The data is passed unparsed from a connection to the other, so the two
+    statements must use the same format. Reading from `!src_cursor` and
+    writing to `!dst_cursor` happen concurrently, in different threads.
+    """
+    if src_cursor.connection is dst_cursor.connection:
+        raise e.ProgrammingError("cannot pipe COPY data on the same connection")
+
+    with src_cursor.copy(src_statement, src_params) as src:
+        writer = QueuedLibpqDriver(dst_cursor)
+        with dst_cursor.copy(dst_statement, dst_params, writer=writer) as dst:
+            # Data arrives one row at time: accumulate it in larger buffers,
+            # which are cheaper to pass to the writer thread.
+            buffer = bytearray()
+
+            def write(data: Buffer) -> None:
+                nonlocal buffer
+                buffer += data
+                if len(buffer) >= BUFFER_SIZE:
+                    dst.write(buffer)
+                    buffer = bytearray()
+
+            src.connection.wait(src._read_into_gen(write))
+            if buffer:
+                dst.write(buffer)
+
+    return dst_cursor.rowcount
+
+
 class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
     """Manage an asynchronous :sql:`COPY` operation."""
 
@@ -508,21 +861,68 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
     async def read(self) -> Buffer:
         return await self.connection.wait(self._read_gen())
 
-    async def rows(self) -> AsyncIterator[Tuple[Any, ...]]:
-        while True:
-            record = await self.read_row()
-            if record is None:
-                break
-            yield record
+    async def rows(self, batch: Optional[int] = None) -> AsyncIterator[Tuple[Any, ...]]:
+        if batch:
+            while True:
+                records = await self.read_rows(batch)
+                if not records:
+                    break
+                for row in records:
+                    yield row
+        else:
+            while True:
+                record = await self.read_row()
+                if record is None:
+                    break
+                yield record
 
     async def read_row(self) -> Optional[Tuple[Any, ...]]:
         return await self.connection.wait(self._read_row_gen())
 
+    async def read_rows(self, n: int) -> List[Tuple[Any, ...]]:
+        return await self.connection.wait(self._read_rows_gen(n))
+
+    async def read_into(
+        self, file: FileTarget, compress: Union[None, str, Compressor] = None
+    ) -> int:
+        # Don't write or compress in the event loop thread: receive the data
+        # in batches, and write each batch in an executor while receiving the
+        # next one.
+        sink = _FileSink(file, compress, threaded=False)
+        loop = asyncio.get_running_loop()
+        nbytes = 0
+        writing: Optional["asyncio.Future[None]"] = None
+        try:
+            while not self._finished:
+                blocks = await self.connection.wait(
+                    self._read_blocks_gen(READ_INTO_BATCH)
+                )
+                data = b"".join(blocks)
+                nbytes += len(data)
+                if writing:
+                    await writing
+                writing = loop.run_in_executor(None, sink.write, data)
+            if writing:
+                await writing
+
+        except BaseException as ex:
+            if writing:
+                await asyncio.gather(writing, return_exceptions=True)
+            await loop.run_in_executor(None, sink.close, ex)
+            raise
+
+        await loop.run_in_executor(None, sink.close)
+        return nbytes
+
     async def write(self, buffer: Union[Buffer, str]) -> None:
         data = self.formatter.write(buffer)
         if data:
             await self._write(data)
 
+    async def write_file(self, file: FileSource) -> None:
+        for data in self._file_chunks(file):
+            await self.write(data)
+
     async def write_row(self, row: Sequence[Any]) -> None:
         data = self.formatter.write_row(row)
         if data:
@@ -570,6 +970,8 @@ class AsyncLibpqWriter(AsyncWriter):
         else:
             # Copy a buffer too large in chunks to avoid causing a memory
             # error in the libpq, which may cause an infinite loop (#255).
+            # Slice a memoryview, so that the chunks don't copy the data.
+            data = memoryview(data)
             for i in range(0, len(data), MAX_BUFFER_SIZE):
                 await self.connection.wait(
                     copy_to(self._pgconn, data[i : i + MAX_BUFFER_SIZE])
@@ -626,8 +1028,11 @@ class AsyncQueuedLibpqWriter(AsyncLibpqWriter):
         else:
             # Copy a buffer too large in chunks to avoid causing a memory
             # error in the libpq, which may cause an infinite loop (#255).
+            # Copy the chunks: the caller may change or reuse the buffer
+            # before the worker has sent them.
+            data = memoryview(data)
             for i in range(0, len(data), MAX_BUFFER_SIZE):
-                await self._queue.put(data[i : i + MAX_BUFFER_SIZE])
+                await self._queue.put(bytes(data[i : i + MAX_BUFFER_SIZE]))
 
     async def finish(self, exc: Optional[BaseException] = None) -> None:
         await self._queue.put(b"")
@@ -639,6 +1044,42 @@ class AsyncQueuedLibpqWriter(AsyncLibpqWriter):
         await super().finish(exc)
 
 
+async def pipe_async(
+    src_cursor: "AsyncCursor[Any]",
+    src_statement: Query,
+    dst_cursor: "AsyncCursor[Any]",
+    dst_statement: Query,
+    *,
+    src_params: Optional[Params] = None,
+    dst_params: Optional[Params] = None,
+) -> int:
+    """
+    Copy data from a :sql:`COPY TO` operation to a :sql:`COPY FROM` operation.
+
+    Async version of `pipe()`: reading from `!src_cursor` and writing to
+    `!dst_cursor` happen concurrently, in different tasks.
+    """
+    if src_cursor.connection is dst_cursor.connection:
+        raise e.ProgrammingError("cannot pipe COPY data on the same connection")
+
+    async with src_cursor.copy(src_statement, src_params) as src:
+        writer = AsyncQueuedLibpqWriter(dst_cursor)
+        async with dst_cursor.copy(dst_statement, dst_params, writer=writer) as dst:
+            # Data arrives one row at time: accumulate it in larger buffers,
+            # which are cheaper to pass to the writer task.
+            buffer = bytearray()
+            async for data in src:
+                buffer += data
+                if len(buffer) >= BUFFER_SIZE:
+                    await dst.write(buffer)
+                    buffer = bytearray()
+
+            if buffer:
+                await dst.write(buffer)
+
+    return dst_cursor.rowcount
+
+
 class Formatter(ABC):
     """
     A class which understand a copy format (text, binary).
@@ -655,6 +1096,10 @@ class Formatter(ABC):
     def parse_row(self, data: Buffer) -> Optional[Tuple[Any, ...]]:
         ...
 
+    @abstractmethod
+    def parse_rows(self, blocks: List[Buffer]) -> List[Tuple[Any, ...]]:
+        ...
+
     @abstractmethod
     def write(self, buffer: Union[Buffer, str]) -> Buffer:
         ...
@@ -681,6 +1126,9 @@ class TextFormatter(Formatter):
         else:
             return None
 
+    def parse_rows(self, blocks: List[Buffer]) -> List[Tuple[Any, ...]]:
+        return parse_rows_text(blocks, self.transformer)
+
     def write(self, buffer: Union[Buffer, str]) -> Buffer:
         data = self._ensure_bytes(buffer)
         self._signature_sent = True
@@ -733,6 +1181,24 @@ class BinaryFormatter(Formatter):
 
         return parse_row_binary(data, self.transformer)
 
+    def parse_rows(self, blocks: List[Buffer]) -> List[Tuple[Any, ...]]:
+        if not blocks:
+            return []
+
+        if not self._signature_sent:
+            data = blocks[0]
+            if data[: len(_binary_signature)] != _binary_signature:
+                raise e.DataError(
+                    "binary copy doesn't start with the expected signature"
+                )
+            self._signature_sent = True
+            blocks[0] = data[len(_binary_signature) :]
+
+        if blocks[-1] == _binary_trailer:
+            del blocks[-1]
+
+        return parse_rows_binary(blocks, self.transformer)
+
     def write(self, buffer: Union[Buffer, str]) -> Buffer:
         data = self._ensure_bytes(buffer)
         self._signature_sent = True
@@ -835,6 +1301,10 @@ def _parse_row_text(data: Buffer, tx: Transformer) -> Tuple[Any, ...]:
     return tx.load_sequence(row)
 
 
+def _parse_rows_text(blocks: List[Buffer], tx: Transformer) -> List[Tuple[Any, ...]]:
+    return [_parse_row_text(data, tx) for data in blocks]
+
+
 def _parse_row_binary(data: Buffer, tx: Transformer) -> Tuple[Any, ...]:
     row: List[Optional[Buffer]] = []
     nfields = _unpack_int2(data, 0)[0]
@@ -851,6 +1321,10 @@ def _parse_row_binary(data: Buffer, tx: Transformer) -> Tuple[Any, ...]:
     return tx.load_sequence(row)
 
 
+def _parse_rows_binary(blocks: List[Buffer], tx: Transformer) -> List[Tuple[Any, ...]]:
+    return [_parse_row_binary(data, tx) for data in blocks]
+
+
 _pack_int2 = struct.Struct("!h").pack
 _pack_int4 = struct.Struct("!i").pack
 _unpack_int2 = struct.Struct("!h").unpack_from
@@ -894,9 +1368,13 @@ if _psycopg:
     format_row_binary = _psycopg.format_row_binary
     parse_row_text = _psycopg.parse_row_text
     parse_row_binary = _psycopg.parse_row_binary
+    parse_rows_text = _psycopg.parse_rows_text
+    parse_rows_binary = _psycopg.parse_rows_binary
 
 else:
     format_row_text = _format_row_text
     format_row_binary = _format_row_binary
     parse_row_text = _parse_row_text
     parse_row_binary = _parse_row_binary
+    parse_rows_text = _parse_rows_text
+    parse_rows_binary = _parse_rows_binary
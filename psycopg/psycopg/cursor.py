@@ -4,6 +4,7 @@ psycopg cursor objects
 
 # Copyright (C) 2020 The Psycopg Team
 
+from time import monotonic
 from functools import partial
 from types import TracebackType
 from typing import Any, Generic, Iterable, Iterator, List
@@ -15,14 +16,15 @@ from . import pq
 from . import adapt
 from . import errors as e
 from .abc import ConnectionType, Query, Params, PQGen
-from .copy import Copy, Writer as CopyWriter
+from .copy import Copy, Writer as CopyWriter, BinaryFormatter, MAX_BUFFER_SIZE
 from .rows import Row, RowMaker, RowFactory
 from ._column import Column
-from ._queries import PostgresQuery, PostgresClientQuery
-from ._pipeline import Pipeline
+from ._oids import INVALID_OID, INT2_OID, INT4_OID, INT8_OID
+from ._queries import PostgresQuery, PostgresClientQuery, _query2copy, _query2unnest
+from ._pipeline import Pipeline, BasePipelineResult
 from ._encodings import pgconn_encoding
 from ._preparing import Prepare
-from .generators import execute, fetch, send
+from .generators import execute, fetch, send, copy_to, copy_end, _consume_notifies
 
 if TYPE_CHECKING:
     from .abc import Transformer
@@ -40,9 +42,14 @@ COPY_IN = pq.ExecStatus.COPY_IN
 COPY_BOTH = pq.ExecStatus.COPY_BOTH
 FATAL_ERROR = pq.ExecStatus.FATAL_ERROR
 SINGLE_TUPLE = pq.ExecStatus.SINGLE_TUPLE
+TUPLES_CHUNK = pq.ExecStatus.TUPLES_CHUNK
 PIPELINE_ABORTED = pq.ExecStatus.PIPELINE_ABORTED
 
 ACTIVE = pq.TransactionStatus.ACTIVE
+IDLE = pq.TransactionStatus.IDLE
+
+# Number of records loaded by each COPY in executemany(), if not specified.
+COPY_BATCH_SIZE = 10_000
 
 
 class BaseCursor(Generic[ConnectionType, Row]):
@@ -119,7 +126,10 @@ class BaseCursor(Generic[ConnectionType, Row]):
         # the query said we got tuples (mostly to handle the super useful
         # query "SELECT ;"
         if res and (
-            res.nfields or res.status == TUPLES_OK or res.status == SINGLE_TUPLE
+            res.nfields
+            or res.status == TUPLES_OK
+            or res.status == SINGLE_TUPLE
+            or res.status == TUPLES_CHUNK
         ):
             return [Column(self, i) for i in range(res.nfields)]
         else:
@@ -189,13 +199,37 @@ class BaseCursor(Generic[ConnectionType, Row]):
         *,
         prepare: Optional[bool] = None,
         binary: Optional[bool] = None,
+        cache: bool = False,
+        cache_tags: Sequence[str] = (),
     ) -> PQGen[None]:
         """Generator implementing `Cursor.execute()`."""
         yield from self._start_query(query)
         pgq = self._convert_query(query, params)
+
+        rcache = self._conn._result_cache
+        if not (cache or cache_tags) or self._conn._pipeline:
+            rcache = None
+        if rcache is not None:
+            key = rcache.key(pgq, self._get_result_format(binary))
+            if rcache.channel:
+                # Receive pending notifications, which may invalidate the cache.
+                self._pgconn.consume_input()
+                _consume_notifies(self._pgconn)
+            results = rcache.get(key)
+            if results is not None:
+                self._query = pgq
+                self._set_results(results)
+                self._last_query = query
+                return
+
         yield from self._maybe_prepare_gen(pgq, prepare=prepare, binary=binary)
         if self._conn._pipeline:
             yield from self._conn._pipeline._communicate_gen()
+            yield from self._conn._pipeline._maybe_sync_gen()
+        elif rcache is not None and self._pgconn.transaction_status == IDLE:
+            # Results read in a transaction might include uncommitted changes,
+            # or changes which will be rolled back: don't store them.
+            rcache.put(key, self._results, cache_tags)
 
         self._last_query = query
 
@@ -229,6 +263,7 @@ class BaseCursor(Generic[ConnectionType, Row]):
 
             yield from self._maybe_prepare_gen(pgq, prepare=True)
             yield from pipeline._communicate_gen()
+            yield from pipeline._maybe_sync_gen()
 
         self._last_query = query
 
@@ -267,6 +302,321 @@ class BaseCursor(Generic[ConnectionType, Row]):
         for cmd in self._conn._prepared.get_maintenance_commands():
             yield from self._conn._exec_command(cmd)
 
+    def _execute_batch_gen_pipeline(
+        self,
+        statements: Iterable[Tuple[Query, Optional[Params]]],
+        *,
+        binary: Optional[bool] = None,
+        fail_fast: bool = True,
+        sync: bool = True,
+    ) -> PQGen[List[BasePipelineResult[Any]]]:
+        """
+        Generator implementing `Cursor.execute_batch()` with pipelines available.
+
+        Queue the statements in the pipeline and return the objects receiving
+        their results, which are only available after the pipeline is synced,
+        which happens at the end if 'sync' is true.
+        """
+        pipeline = self._conn._pipeline
+        assert pipeline
+
+        yield from self._start_query()
+        is_binary = self._get_result_format(binary) == BINARY
+        # Adapt all the parameters before queuing anything, in case of errors.
+        pgqs = [self._convert_query(query, params) for query, params in statements]
+
+        results: List[BasePipelineResult[Any]] = []
+        for pgq in pgqs:
+            self._query = pgq
+            res: BasePipelineResult[Any] = BasePipelineResult(pipeline)
+            prep, name = self._get_prepared(pgq)
+            if prep is Prepare.NO:
+                # Let the cursor send the query, for instance merging the
+                # parameters client-side.
+                self._execute_send(pgq, binary=binary)
+                pipeline._queue_result(res, pgq, prep, name)
+            else:
+                pipeline._queue_query(res, pgq, prep, name, binary=is_binary)
+            results.append(res)
+            if not fail_fast:
+                # Isolate the statement from the following ones.
+                pipeline._enqueue_sync()
+            yield from pipeline._communicate_gen()
+            yield from pipeline._maybe_sync_gen()
+
+        if sync:
+            yield from pipeline._sync_gen()
+
+        for cmd in self._conn._prepared.get_maintenance_commands():
+            yield from self._conn._exec_command(cmd)
+
+        return results
+
+    def _execute_batch_gen_no_pipeline(
+        self,
+        statements: Iterable[Tuple[Query, Optional[Params]]],
+        *,
+        binary: Optional[bool] = None,
+        fail_fast: bool = True,
+    ) -> PQGen[None]:
+        """
+        Generator implementing `Cursor.execute_batch()` with pipelines not available.
+        """
+        yield from self._start_query()
+        statements = list(statements)
+        if not statements:
+            return
+
+        if (
+            fail_fast
+            and self._get_result_format(binary) == TEXT
+            and all(params is None for _, params in statements)
+        ):
+            # Merge the statements in a single query, executed in an implicit
+            # transaction, which stops at the first error. Separate them on
+            # new lines, in case a statement ends with a comment.
+            queries = []
+            for query, _ in statements:
+                pgq = self._convert_query(query)
+                queries.append(pgq.query)
+
+            self._query = pgq
+            self._pgconn.send_query(b"\n;\n".join(queries))
+            results = yield from execute(self._pgconn)
+            if results[-1].status == FATAL_ERROR:
+                if len(results) > 1:
+                    self._set_results(results[:-1])
+                self._raise_for_result(results[-1])
+            self._check_results(results)
+            self._set_results(results)
+            return
+
+        # Execute the statements one at a time. In fail-fast mode, emulate the
+        # implicit transaction of the pipeline if not already in a transaction.
+        # Adapt all the parameters before starting it, in case of errors.
+        pgqs = [self._convert_query(query, params) for query, params in statements]
+        tx = fail_fast and self._pgconn.transaction_status == IDLE
+        if tx:
+            yield from self._conn._exec_command(b"BEGIN")
+
+        pgresults: List["PGresult"] = []
+        error = None
+        for pgq in pgqs:
+            self._execute_send(pgq, binary=binary)
+            results = yield from execute(self._pgconn)
+            if fail_fast and results[-1].status == FATAL_ERROR:
+                error = results[-1]
+                break
+            pgresults.extend(results)
+
+        if tx:
+            yield from self._conn._exec_command(b"ROLLBACK" if error else b"COMMIT")
+
+        if pgresults:
+            self._set_results(pgresults)
+        if error:
+            self._raise_for_result(error)
+
+    def _set_batch_results(
+        self, results: List[BasePipelineResult[Any]], fail_fast: bool
+    ) -> None:
+        """
+        Set the results of the statements executed by `execute_batch()`.
+
+        Raise the first error in fail-fast mode.
+        """
+        pgresults: List["PGresult"] = []
+        for res in results:
+            if fail_fast and res._error:
+                if pgresults:
+                    self._set_results(pgresults)
+                raise res._error
+            if res.pgresult:
+                pgresults.append(res.pgresult)
+
+        if pgresults:
+            self._set_results(pgresults)
+
+    def _executemany_gen_strategy(
+        self,
+        query: Query,
+        params_seq: Sequence[Params],
+        returning: bool,
+        strategy: str,
+        batch_size: Optional[int],
+    ) -> PQGen[int]:
+        """
+        Generator implementing `Cursor.executemany()` with an optional strategy.
+
+        Return the number of records processed: the caller should execute the
+        remaining ones using the default strategy (all of them if `!0` is
+        returned, for instance if the strategy cannot be used with the query).
+        """
+        if strategy not in ("unnest", "copy"):
+            raise ValueError(f"bad executemany strategy: {strategy!r}")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        if returning or not params_seq or self._conn._pipeline:
+            return 0
+
+        yield from self._start_query(query)
+        pgq = self._convert_query(query, params_seq[0])
+        if isinstance(pgq, PostgresClientQuery) or not pgq.params:
+            return 0
+
+        nrecs = len(params_seq)
+        if strategy == "unnest":
+            stmt = _query2unnest(pgq.query, len(pgq.params))
+            if not stmt:
+                return 0
+            # Don't declare the type of the ints of the first record, which
+            # depends on their value.
+            types = [INT8_OID if t in (INT2_OID, INT4_OID) else t for t in pgq.types]
+            types = yield from self._describe_params_gen(pgq.query, types)
+            step = batch_size or nrecs
+        else:
+            copy = _query2copy(pgq.query, len(pgq.params))
+            if not copy:
+                return 0
+            stmt, target = copy
+            # Let the server infer the types of the target columns.
+            types = [INVALID_OID] * len(pgq.params)
+            types = yield from self._describe_params_gen(pgq.query, types)
+            if not (yield from self._check_copy_target_gen(target)):
+                return 0
+            # Don't format all the records in memory at once.
+            step = batch_size or COPY_BATCH_SIZE
+
+        self._query = pgq
+        self._rowcount = 0
+        self._execmany_returning = False
+
+        columns = pgq.transpose(params_seq)
+        for i in range(0, nrecs, step):
+            batch = [col[i : i + step] for col in columns]
+            if strategy == "unnest":
+                done = yield from self._execute_unnest_gen(stmt, types, batch)
+            else:
+                done = yield from self._execute_copy_gen(stmt, types, batch)
+            if not done:
+                # The values can't be dumped to the types expected. Leave the
+                # default strategy to deal with them and to report errors.
+                nrecs = i
+                break
+
+        if nrecs:
+            self._last_query = query
+
+        for cmd in self._conn._prepared.get_maintenance_commands():
+            yield from self._conn._exec_command(cmd)
+
+        return nrecs
+
+    def _describe_params_gen(
+        self, query: bytes, types: Sequence[int]
+    ) -> PQGen[List[int]]:
+        """
+        Return the types the server expects for the parameters of a query.
+        """
+        self._pgconn.send_prepare(b"", query, param_types=types)
+        (result,) = yield from execute(self._pgconn)
+        if result.status == FATAL_ERROR:
+            raise e.error_from_result(result, encoding=self._encoding)
+
+        self._pgconn.send_describe_prepared(b"")
+        (result,) = yield from execute(self._pgconn)
+        if result.status == FATAL_ERROR:
+            raise e.error_from_result(result, encoding=self._encoding)
+
+        return [result.param_type(i) for i in range(result.nparams)]
+
+    def _check_copy_target_gen(self, target: bytes) -> PQGen[bool]:
+        """
+        Return `!True` if COPY can load `!target` in the same way of INSERT.
+
+        COPY cannot load views and doesn't apply the rules of a table.
+        """
+        self._pgconn.send_query_params(
+            b"SELECT relkind IN ('r', 'p') AND NOT relhasrules"
+            b" FROM pg_catalog.pg_class WHERE oid = $1::regclass",
+            [target],
+        )
+        (result,) = yield from execute(self._pgconn)
+        if result.status == FATAL_ERROR:
+            raise e.error_from_result(result, encoding=self._encoding)
+
+        return result.get_value(0, 0) == b"t"
+
+    def _execute_unnest_gen(
+        self, query: bytes, types: Sequence[int], columns: List[List[Any]]
+    ) -> PQGen[bool]:
+        """
+        Execute a query returned by `_query2unnest()` on a batch of parameters.
+
+        Return `!False` if the values cannot be dumped as arrays of `!types`.
+        """
+        adapters = self._tx.adapters
+        params = []
+        atypes = []
+        for oid, values in zip(types, columns):
+            info = adapters.types.get(oid)
+            if not (info and info.array_oid):
+                return False
+            try:
+                dcls = adapters.get_dumper_by_oid(info.array_oid, BINARY)
+                params.append(dcls(list, self._tx).dump(values))
+            except Exception:
+                return False
+            atypes.append(info.array_oid)
+
+        pgq = PostgresQuery(self._tx)
+        pgq.query = query
+        pgq.params = params
+        pgq.types = tuple(atypes)
+        pgq.formats = [BINARY] * len(params)
+        yield from self._maybe_prepare_gen(pgq)
+        return True
+
+    def _execute_copy_gen(
+        self, statement: bytes, types: Sequence[int], columns: List[List[Any]]
+    ) -> PQGen[bool]:
+        """
+        Execute a statement returned by `_query2copy()` on a batch of parameters.
+
+        Return `!False` if the values cannot be dumped to `!types`.
+        """
+        # Format the data before starting the COPY: on error we can still
+        # execute the query in a different way.
+        tx = adapt.Transformer(self)
+        formatter = BinaryFormatter(tx)
+        data = []
+        try:
+            tx.set_dumper_types(types, BINARY)
+            for row in zip(*columns):
+                data.append(formatter.write_row(row))
+            data.append(formatter.end())
+        except Exception:
+            return False
+
+        pgq = PostgresQuery(self._tx)
+        pgq.query = statement
+        self._query = pgq
+
+        self._pgconn.send_query(statement)
+        results = yield from execute(self._pgconn)
+        if len(results) != 1:
+            raise e.ProgrammingError("COPY cannot be mixed with other operations")
+        self._check_copy_result(results[0])
+
+        for buf in data:
+            for i in range(0, len(buf), MAX_BUFFER_SIZE):
+                yield from copy_to(self._pgconn, buf[i : i + MAX_BUFFER_SIZE])
+
+        result = yield from copy_end(self._pgconn, None)
+        self._rowcount += result.command_tuples or 0
+        return True
+
     def _maybe_prepare_gen(
         self,
         pgq: PostgresQuery,
@@ -299,11 +649,19 @@ class BaseCursor(Generic[ConnectionType, Row]):
             queued = None
             if key is not None:
                 queued = (key, prep, name)
-            self._conn._pipeline.result_queue.append((self, queued))
+            self._conn._pipeline.result_queue.append(
+                (self._set_pipeline_results, queued)
+            )
+            self._conn._pipeline._add_pending_query(pgq)
             return
 
         # run the query
-        results = yield from execute(self._pgconn)
+        if prep is Prepare.NO and self._conn._prepared.prepare_adaptive:
+            t0 = monotonic()
+            results = yield from execute(self._pgconn)
+            self._conn._prepared.record_latency(pgq, monotonic() - t0)
+        else:
+            results = yield from execute(self._pgconn)
 
         if key is not None:
             self._conn._prepared.validate(key, prep, name, results)
@@ -314,7 +672,12 @@ class BaseCursor(Generic[ConnectionType, Row]):
     def _get_prepared(
         self, pgq: PostgresQuery, prepare: Optional[bool] = None
     ) -> Tuple[Prepare, bytes]:
-        return self._conn._prepared.get(pgq, prepare)
+        # In multiplexed mode, a statement failing to prepare must not affect
+        # the queries of other tasks.
+        p = self._conn._pipeline
+        return self._conn._prepared.get(
+            pgq, prepare, validated=bool(p and p._multiplex)
+        )
 
     def _stream_send_gen(
         self,
@@ -322,12 +685,20 @@ class BaseCursor(Generic[ConnectionType, Row]):
         params: Optional[Params] = None,
         *,
         binary: Optional[bool] = None,
+        size: int = 1,
     ) -> PQGen[None]:
         """Generator to send the query for `Cursor.stream()`."""
+        if size < 1:
+            raise ValueError("size must be >= 1")
+
         yield from self._start_query(query)
         pgq = self._convert_query(query, params)
         self._execute_send(pgq, binary=binary, force_extended=True)
-        self._pgconn.set_single_row_mode()
+        if size > 1 and _chunked_rows_supported():
+            self._pgconn.set_chunked_rows_mode(size)
+        else:
+            # With an old libpq, chunks are emulated by _stream_fetchmany_gen
+            self._pgconn.set_single_row_mode()
         self._last_query = query
         yield from send(self._pgconn)
 
@@ -337,7 +708,7 @@ class BaseCursor(Generic[ConnectionType, Row]):
             return None
 
         status = res.status
-        if status == SINGLE_TUPLE:
+        if status == SINGLE_TUPLE or status == TUPLES_CHUNK:
             self.pgresult = res
             self._tx.set_pgresult(res, set_loaders=first)
             if first:
@@ -358,6 +729,31 @@ class BaseCursor(Generic[ConnectionType, Row]):
             # Errors, unexpected values
             return self._raise_for_result(res)
 
+    def _stream_fetchmany_gen(self, first: bool, size: int) -> PQGen[List[Row]]:
+        """Generator returning the next batch of rows for `Cursor.stream()`.
+
+        In chunked rows mode every result received contains up to `!size`
+        rows. If the libpq doesn't support it, the query runs in single row
+        mode and the batch is filled with up to `!size` results.
+
+        Return an empty list at the end of the stream.
+        """
+        res = yield from self._stream_fetchone_gen(first)
+        if not res:
+            return []
+
+        recs = self._tx.load_rows(0, res.ntuples, self._make_row)
+        if size == 1 or res.status == TUPLES_CHUNK:
+            return recs
+
+        while len(recs) < size:
+            res = yield from self._stream_fetchone_gen(False)
+            if not res:
+                break
+            recs.extend(self._tx.load_rows(0, res.ntuples, self._make_row))
+
+        return recs
+
     def _start_query(self, query: Optional[Query] = None) -> PQGen[None]:
         """Generator to start the processing of a query.
 
@@ -413,11 +809,7 @@ class BaseCursor(Generic[ConnectionType, Row]):
 
         This is not a generator, but a normal non-blocking function.
         """
-        if binary is None:
-            fmt = self.format
-        else:
-            fmt = BINARY if binary else TEXT
-
+        fmt = self._get_result_format(binary)
         self._query = query
 
         if self._conn._pipeline:
@@ -535,6 +927,11 @@ class BaseCursor(Generic[ConnectionType, Row]):
                 for res in results:
                     self._rowcount += res.command_tuples or 0
 
+    def _set_pipeline_results(self, results: List["PGresult"]) -> None:
+        """Receive the results of a query executed in pipeline mode."""
+        self._check_results(results)
+        self._set_results(results)
+
     def _send_prepare(self, name: bytes, query: PostgresQuery) -> None:
         if self._conn._pipeline:
             self._conn._pipeline.command_queue.append(
@@ -572,6 +969,12 @@ class BaseCursor(Generic[ConnectionType, Row]):
                 name, pgq.params, param_formats=pgq.formats, result_format=fmt
             )
 
+    def _get_result_format(self, binary: Optional[bool] = None) -> pq.Format:
+        if binary is None:
+            return self.format
+        else:
+            return BINARY if binary else TEXT
+
     def _check_result_for_fetch(self) -> None:
         if self.closed:
             raise e.InterfaceError("the cursor is closed")
@@ -629,6 +1032,11 @@ class BaseCursor(Generic[ConnectionType, Row]):
         return pgconn_encoding(self._pgconn)
 
 
+def _chunked_rows_supported() -> bool:
+    """Return `!True` if the libpq supports the chunked rows mode."""
+    return pq.__build_version__ >= 170000 and pq.version() >= 170000
+
+
 class Cursor(BaseCursor["Connection[Any]", Row]):
     __module__ = "psycopg"
     __slots__ = ()
@@ -694,15 +1102,78 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         *,
         prepare: Optional[bool] = None,
         binary: Optional[bool] = None,
+        cache: bool = False,
+        cache_tags: Sequence[str] = (),
     ) -> _Self:
         """
         Execute a query or command to the database.
         """
         try:
-            with self._conn.lock:
-                self._conn.wait(
-                    self._execute_gen(query, params, prepare=prepare, binary=binary)
-                )
+            gen = self._execute_gen(
+                query,
+                params,
+                prepare=prepare,
+                binary=binary,
+                cache=cache,
+                cache_tags=cache_tags,
+            )
+            p = self._conn._pipeline
+            if p and p._multiplex:
+                p._execute_multiplexed(gen)
+            else:
+                with self._conn.lock:
+                    self._conn.wait(gen)
+        except e.Error as ex:
+            raise ex.with_traceback(None)
+        return self
+
+    def execute_batch(
+        self: _Self,
+        statements: Iterable[Tuple[Query, Optional[Params]]],
+        *,
+        binary: Optional[bool] = None,
+        fail_fast: bool = True,
+    ) -> _Self:
+        """
+        Execute a sequence of different statements in a single round trip.
+        """
+        try:
+            if Pipeline.is_supported():
+                p = self._conn._pipeline
+                if p and p._multiplex:
+                    results = p._execute_multiplexed(
+                        self._execute_batch_gen_pipeline(
+                            statements, binary=binary, fail_fast=fail_fast, sync=False
+                        )
+                    )
+                else:
+                    with self._conn.lock:
+                        p = self._conn._pipeline
+                        if p:
+                            results = self._conn.wait(
+                                self._execute_batch_gen_pipeline(
+                                    statements, binary=binary, fail_fast=fail_fast
+                                )
+                            )
+                # Otherwise, make a new one, which is synced on exit.
+                if not p:
+                    with self._conn.pipeline(), self._conn.lock:
+                        results = self._conn.wait(
+                            self._execute_batch_gen_pipeline(
+                                statements,
+                                binary=binary,
+                                fail_fast=fail_fast,
+                                sync=False,
+                            )
+                        )
+                self._set_batch_results(results, fail_fast)
+            else:
+                with self._conn.lock:
+                    self._conn.wait(
+                        self._execute_batch_gen_no_pipeline(
+                            statements, binary=binary, fail_fast=fail_fast
+                        )
+                    )
         except e.Error as ex:
             raise ex.with_traceback(None)
         return self
@@ -713,20 +1184,46 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         params_seq: Iterable[Params],
         *,
         returning: bool = False,
+        strategy: Optional[str] = None,
+        batch_size: Optional[int] = None,
     ) -> None:
         """
         Execute the same command with a sequence of input data.
         """
         try:
+            nrecs = 0
+            if strategy is not None:
+                params_seq = list(params_seq)
+                with self._conn.lock:
+                    nrecs = self._conn.wait(
+                        self._executemany_gen_strategy(
+                            query, params_seq, returning, strategy, batch_size
+                        )
+                    )
+                if nrecs:
+                    if nrecs == len(params_seq):
+                        return
+                    # Execute the records left in the normal way.
+                    params_seq = params_seq[nrecs:]
+                    rowcount = self._rowcount
+
             if Pipeline.is_supported():
                 # If there is already a pipeline, ride it, in order to avoid
                 # sending unnecessary Sync.
-                with self._conn.lock:
-                    p = self._conn._pipeline
-                    if p:
-                        self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
-                        )
+                p = self._conn._pipeline
+                if p and p._multiplex:
+                    p._execute_multiplexed(
+                        self._executemany_gen_pipeline(query, params_seq, returning)
+                    )
+                else:
+                    with self._conn.lock:
+                        p = self._conn._pipeline
+                        if p:
+                            self._conn.wait(
+                                self._executemany_gen_pipeline(
+                                    query, params_seq, returning
+                                )
+                            )
                 # Otherwise, make a new one
                 if not p:
                     with self._conn.pipeline(), self._conn.lock:
@@ -738,6 +1235,9 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
                     self._conn.wait(
                         self._executemany_gen_no_pipeline(query, params_seq, returning)
                     )
+
+            if nrecs:
+                self._rowcount += rowcount
         except e.Error as ex:
             raise ex.with_traceback(None)
 
@@ -747,22 +1247,31 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         params: Optional[Params] = None,
         *,
         binary: Optional[bool] = None,
+        size: int = 1,
     ) -> Iterator[Row]:
         """
         Iterate row-by-row on a result from the database.
+
+        :param size: if greater than 1, results will be retrieved by chunks of
+            this size from the server (but still yielded row-by-row); this is
+            only available from version 17 of the libpq, otherwise chunks are
+            emulated on the client.
         """
         if self._pgconn.pipeline_status:
             raise e.ProgrammingError("stream() cannot be used in pipeline mode")
 
         with self._conn.lock:
             try:
-                self._conn.wait(self._stream_send_gen(query, params, binary=binary))
+                self._conn.wait(
+                    self._stream_send_gen(query, params, binary=binary, size=size)
+                )
                 first = True
-                while self._conn.wait(self._stream_fetchone_gen(first)):
-                    # We know that, if we got a result, it has a single row.
-                    rec: Row = self._tx.load_row(0, self._make_row)  # type: ignore
-                    yield rec
+                while True:
+                    recs = self._conn.wait(self._stream_fetchmany_gen(first, size))
+                    if not recs:
+                        break
                     first = False
+                    yield from recs
 
             except e.Error as ex:
                 raise ex.with_traceback(None)
@@ -835,6 +1344,38 @@ class Cursor(BaseCursor["Connection[Any]", Row]):
         self._pos = self.pgresult.ntuples
         return records
 
+    def fetchmany_columns(self, size: int = 0) -> List[Sequence[Any]]:
+        """
+        Return the next `!size` records from the current recordset by column.
+
+        `!size` default to `!self.arraysize` if not specified.
+
+        :rtype: List[Sequence[Any]], one sequence for each column
+        """
+        self._fetch_pipeline()
+        self._check_result_for_fetch()
+        assert self.pgresult
+
+        if not size:
+            size = self.arraysize
+        row1 = min(self._pos + size, self.pgresult.ntuples)
+        columns = self._tx.load_columns(self._pos, row1)
+        self._pos = row1
+        return columns
+
+    def fetch_columns(self) -> List[Sequence[Any]]:
+        """
+        Return all the remaining records from the current recordset by column.
+
+        :rtype: List[Sequence[Any]], one sequence for each column
+        """
+        self._fetch_pipeline()
+        self._check_result_for_fetch()
+        assert self.pgresult
+        columns = self._tx.load_columns(self._pos, self.pgresult.ntuples)
+        self._pos = self.pgresult.ntuples
+        return columns
+
     def __iter__(self) -> Iterator[Row]:
         self._fetch_pipeline()
         self._check_result_for_fetch()
@@ -5,8 +5,8 @@ psycopg async cursor objects
 # Copyright (C) 2020 The Psycopg Team
 
 from types import TracebackType
-from typing import Any, AsyncIterator, Iterable, List
-from typing import Optional, Type, TypeVar, TYPE_CHECKING, overload
+from typing import Any, AsyncIterator, Iterable, List, Sequence
+from typing import Optional, Tuple, Type, TypeVar, TYPE_CHECKING, overload
 from contextlib import asynccontextmanager
 
 from . import pq
@@ -84,12 +84,72 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         *,
         prepare: Optional[bool] = None,
         binary: Optional[bool] = None,
+        cache: bool = False,
+        cache_tags: Sequence[str] = (),
     ) -> _Self:
         try:
-            async with self._conn.lock:
-                await self._conn.wait(
-                    self._execute_gen(query, params, prepare=prepare, binary=binary)
-                )
+            gen = self._execute_gen(
+                query,
+                params,
+                prepare=prepare,
+                binary=binary,
+                cache=cache,
+                cache_tags=cache_tags,
+            )
+            p = self._conn._pipeline
+            if p and p._multiplex:
+                await p._execute_multiplexed(gen)
+            else:
+                async with self._conn.lock:
+                    await self._conn.wait(gen)
+        except e.Error as ex:
+            raise ex.with_traceback(None)
+        return self
+
+    async def execute_batch(
+        self: _Self,
+        statements: Iterable[Tuple[Query, Optional[Params]]],
+        *,
+        binary: Optional[bool] = None,
+        fail_fast: bool = True,
+    ) -> _Self:
+        try:
+            if Pipeline.is_supported():
+                p = self._conn._pipeline
+                if p and p._multiplex:
+                    results = await p._execute_multiplexed(
+                        self._execute_batch_gen_pipeline(
+                            statements, binary=binary, fail_fast=fail_fast, sync=False
+                        )
+                    )
+                else:
+                    async with self._conn.lock:
+                        p = self._conn._pipeline
+                        if p:
+                            results = await self._conn.wait(
+                                self._execute_batch_gen_pipeline(
+                                    statements, binary=binary, fail_fast=fail_fast
+                                )
+                            )
+                # Otherwise, make a new one, which is synced on exit.
+                if not p:
+                    async with self._conn.pipeline(), self._conn.lock:
+                        results = await self._conn.wait(
+                            self._execute_batch_gen_pipeline(
+                                statements,
+                                binary=binary,
+                                fail_fast=fail_fast,
+                                sync=False,
+                            )
+                        )
+                self._set_batch_results(results, fail_fast)
+            else:
+                async with self._conn.lock:
+                    await self._conn.wait(
+                        self._execute_batch_gen_no_pipeline(
+                            statements, binary=binary, fail_fast=fail_fast
+                        )
+                    )
         except e.Error as ex:
             raise ex.with_traceback(None)
         return self
@@ -100,17 +160,43 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         params_seq: Iterable[Params],
         *,
         returning: bool = False,
+        strategy: Optional[str] = None,
+        batch_size: Optional[int] = None,
     ) -> None:
         try:
+            nrecs = 0
+            if strategy is not None:
+                params_seq = list(params_seq)
+                async with self._conn.lock:
+                    nrecs = await self._conn.wait(
+                        self._executemany_gen_strategy(
+                            query, params_seq, returning, strategy, batch_size
+                        )
+                    )
+                if nrecs:
+                    if nrecs == len(params_seq):
+                        return
+                    # Execute the records left in the normal way.
+                    params_seq = params_seq[nrecs:]
+                    rowcount = self._rowcount
+
             if Pipeline.is_supported():
                 # If there is already a pipeline, ride it, in order to avoid
                 # sending unnecessary Sync.
-                async with self._conn.lock:
-                    p = self._conn._pipeline
-                    if p:
-                        await self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
-                        )
+                p = self._conn._pipeline
+                if p and p._multiplex:
+                    await p._execute_multiplexed(
+                        self._executemany_gen_pipeline(query, params_seq, returning)
+                    )
+                else:
+                    async with self._conn.lock:
+                        p = self._conn._pipeline
+                        if p:
+                            await self._conn.wait(
+                                self._executemany_gen_pipeline(
+                                    query, params_seq, returning
+                                )
+                            )
                 # Otherwise, make a new one
                 if not p:
                     async with self._conn.pipeline(), self._conn.lock:
@@ -121,6 +207,9 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
                 await self._conn.wait(
                     self._executemany_gen_no_pipeline(query, params_seq, returning)
                 )
+
+            if nrecs:
+                self._rowcount += rowcount
         except e.Error as ex:
             raise ex.with_traceback(None)
 
@@ -130,6 +219,7 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         params: Optional[Params] = None,
         *,
         binary: Optional[bool] = None,
+        size: int = 1,
     ) -> AsyncIterator[Row]:
         if self._pgconn.pipeline_status:
             raise e.ProgrammingError("stream() cannot be used in pipeline mode")
@@ -137,14 +227,18 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         async with self._conn.lock:
             try:
                 await self._conn.wait(
-                    self._stream_send_gen(query, params, binary=binary)
+                    self._stream_send_gen(query, params, binary=binary, size=size)
                 )
                 first = True
-                while await self._conn.wait(self._stream_fetchone_gen(first)):
-                    # We know that, if we got a result, it has a single row.
-                    rec: Row = self._tx.load_row(0, self._make_row)  # type: ignore
-                    yield rec
+                while True:
+                    recs = await self._conn.wait(
+                        self._stream_fetchmany_gen(first, size)
+                    )
+                    if not recs:
+                        break
                     first = False
+                    for rec in recs:
+                        yield rec
 
             except e.Error as ex:
                 raise ex.with_traceback(None)
@@ -200,6 +294,26 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         self._pos = self.pgresult.ntuples
         return records
 
+    async def fetchmany_columns(self, size: int = 0) -> List[Sequence[Any]]:
+        await self._fetch_pipeline()
+        self._check_result_for_fetch()
+        assert self.pgresult
+
+        if not size:
+            size = self.arraysize
+        row1 = min(self._pos + size, self.pgresult.ntuples)
+        columns = self._tx.load_columns(self._pos, row1)
+        self._pos = row1
+        return columns
+
+    async def fetch_columns(self) -> List[Sequence[Any]]:
+        await self._fetch_pipeline()
+        self._check_result_for_fetch()
+        assert self.pgresult
+        columns = self._tx.load_columns(self._pos, self.pgresult.ntuples)
+        self._pos = self.pgresult.ntuples
+        return columns
+
     async def __aiter__(self) -> AsyncIterator[Row]:
         await self._fetch_pipeline()
         self._check_result_for_fetch()
@@ -16,7 +16,7 @@ when the file descriptor is ready.
 # Copyright (C) 2020 The Psycopg Team
 
 import logging
-from typing import List, Optional, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from . import pq
 from . import errors as e
@@ -257,7 +257,67 @@ def copy_from(pgconn: PGconn) -> PQGen[Union[memoryview, PGresult]]:
         # some data
         return data
 
-    # Retrieve the final result of copy
+    return (yield from _copy_out_result(pgconn))
+
+
+def _copy_from_many(
+    pgconn: PGconn, n: int
+) -> PQGen[Tuple[List[Buffer], Optional[PGresult]]]:
+    """
+    Generator reading up to `!n` blocks of data of a :sql:`COPY TO` operation.
+
+    Return the blocks read and, if the operation is finished, its final result.
+    Fewer than `!n` blocks are returned only if the operation is finished.
+    """
+    blocks: List[Buffer] = []
+    while len(blocks) < n:
+        nbytes, data = pgconn.get_copy_data(1)
+        if nbytes > 0:
+            blocks.append(data)
+        elif nbytes == 0:
+            # would block
+            yield WAIT_R
+            pgconn.consume_input()
+        else:
+            return blocks, (yield from _copy_out_result(pgconn))
+
+    return blocks, None
+
+
+def _copy_from_into(
+    pgconn: PGconn, target: Union[int, Callable[[Buffer], Any]]
+) -> PQGen[Tuple[int, PGresult]]:
+    """
+    Generator passing all the data of a :sql:`COPY TO` operation to `!target`.
+
+    `!target` can be a file descriptor or a function to call with every block
+    of data received. Return the number of bytes received and the final result
+    of the operation.
+    """
+    if isinstance(target, int):
+        with open(target, "wb", closefd=False) as f:
+            return (yield from _copy_from_into(pgconn, f.write))
+
+    nbytes = 0
+    while True:
+        size, data = pgconn.get_copy_data(1)
+        if size > 0:
+            target(data)
+            nbytes += size
+        elif size == 0:
+            # would block
+            yield WAIT_R
+            pgconn.consume_input()
+        else:
+            break
+
+    return nbytes, (yield from _copy_out_result(pgconn))
+
+
+def _copy_out_result(pgconn: PGconn) -> PQGen[PGresult]:
+    """
+    Retrieve the final result of a :sql:`COPY TO` once the data is finished.
+    """
     results = yield from _fetch_many(pgconn)
     if len(results) > 1:
         # TODO: too brutal? Copy worked.
@@ -310,6 +370,8 @@ if _psycopg:
     fetch_many = _psycopg.fetch_many
     fetch = _psycopg.fetch
     pipeline_communicate = _psycopg.pipeline_communicate
+    copy_from_into = _psycopg.copy_from_into
+    copy_from_many = _psycopg.copy_from_many
 
 else:
     connect = _connect
@@ -318,3 +380,5 @@ else:
     fetch_many = _fetch_many
     fetch = _fetch
     pipeline_communicate = _pipeline_communicate
+    copy_from_into = _copy_from_into
+    copy_from_many = _copy_from_many
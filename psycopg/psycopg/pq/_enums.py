@@ -120,6 +120,13 @@ class ExecStatus(IntEnum):
     return PGRES_PIPELINE_SYNC and normal processing can resume.
     """
 
+    TUPLES_CHUNK = auto()
+    """
+    The PGresult contains several result tuples from the current command.
+
+    This status occurs only when chunked mode has been selected for the query.
+    """
+
 
 class TransactionStatus(IntEnum):
     """
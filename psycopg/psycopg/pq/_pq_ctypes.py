@@ -389,6 +389,23 @@ PQparamtype.restype = Oid
 
 # PQprint: pretty useless
 
+_PQresultMemorySize = None
+
+if libpq_version >= 120000:
+    _PQresultMemorySize = pq.PQresultMemorySize
+    _PQresultMemorySize.argtypes = [PGresult_ptr]
+    _PQresultMemorySize.restype = c_size_t
+
+
+def PQresultMemorySize(pgresult: PGresult_struct) -> int:
+    if not _PQresultMemorySize:
+        raise NotSupportedError(
+            "PQresultMemorySize requires libpq from PostgreSQL 12,"
+            f" {libpq_version} available instead"
+        )
+    return _PQresultMemorySize(pgresult)
+
+
 # 33.3.3. Retrieving Other Result Information
 
 PQcmdStatus = pq.PQcmdStatus
@@ -525,6 +542,22 @@ PQsetSingleRowMode = pq.PQsetSingleRowMode
 PQsetSingleRowMode.argtypes = [PGconn_ptr]
 PQsetSingleRowMode.restype = c_int
 
+_PQsetChunkedRowsMode = None
+
+if libpq_version >= 170000:
+    _PQsetChunkedRowsMode = pq.PQsetChunkedRowsMode
+    _PQsetChunkedRowsMode.argtypes = [PGconn_ptr, c_int]
+    _PQsetChunkedRowsMode.restype = c_int
+
+
+def PQsetChunkedRowsMode(pgconn: PGconn_struct, chunk_size: int) -> int:
+    if not _PQsetChunkedRowsMode:
+        raise NotSupportedError(
+            "PQsetChunkedRowsMode requires libpq from PostgreSQL 17,"
+            f" {libpq_version} available instead"
+        )
+    return _PQsetChunkedRowsMode(pgconn, chunk_size)
+
 
 # 33.6. Canceling Queries in Progress
 
@@ -112,6 +112,8 @@ def PQtrace(
     arg1: Optional[PGconn_struct],
     arg2: _Pointer[FILE],  # type: ignore[type-var]
 ) -> None: ...
+def PQsetChunkedRowsMode(pgconn: Optional[PGconn_struct], chunk_size: int) -> int: ...
+def PQresultMemorySize(pgresult: Optional[PGresult_struct]) -> int: ...
 def PQencryptPasswordConn(
     arg1: Optional[PGconn_struct],
     arg2: bytes,
@@ -174,6 +176,7 @@ def PQftype(arg1: Optional[PGresult_struct], arg2: int) -> int: ...
 def PQfmod(arg1: Optional[PGresult_struct], arg2: int) -> int: ...
 def PQfsize(arg1: Optional[PGresult_struct], arg2: int) -> int: ...
 def PQbinaryTuples(arg1: Optional[PGresult_struct]) -> int: ...
+def _PQresultMemorySize(arg1: Optional[PGresult_struct]) -> int: ...
 def PQgetisnull(arg1: Optional[PGresult_struct], arg2: int, arg3: int) -> int: ...
 def PQgetlength(arg1: Optional[PGresult_struct], arg2: int, arg3: int) -> int: ...
 def PQnparams(arg1: Optional[PGresult_struct]) -> int: ...
@@ -196,6 +199,7 @@ def PQsetnonblocking(arg1: Optional[PGconn_struct], arg2: int) -> int: ...
 def PQisnonblocking(arg1: Optional[PGconn_struct]) -> int: ...
 def PQflush(arg1: Optional[PGconn_struct]) -> int: ...
 def PQsetSingleRowMode(arg1: Optional[PGconn_struct]) -> int: ...
+def _PQsetChunkedRowsMode(arg1: Optional[PGconn_struct], arg2: int) -> int: ...
 def PQgetCancel(arg1: Optional[PGconn_struct]) -> PGcancel_struct: ...
 def PQfreeCancel(arg1: Optional[PGcancel_struct]) -> None: ...
 def PQputCopyData(arg1: Optional[PGconn_struct], arg2: bytes, arg3: int) -> int: ...
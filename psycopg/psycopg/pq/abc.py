@@ -219,6 +219,9 @@ class PGconn(Protocol):
     def set_single_row_mode(self) -> None:
         ...
 
+    def set_chunked_rows_mode(self, size: int) -> None:
+        ...
+
     def get_cancel(self) -> "PGcancel":
         ...
 
@@ -316,6 +319,10 @@ class PGresult(Protocol):
     def binary_tuples(self) -> int:
         ...
 
+    @property
+    def memory_size(self) -> int:
+        ...
+
     def get_value(self, row_number: int, column_number: int) -> Optional[bytes]:
         ...
 
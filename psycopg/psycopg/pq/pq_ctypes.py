@@ -553,6 +553,17 @@ class PGconn:
         if not impl.PQsetSingleRowMode(self._pgconn_ptr):
             raise e.OperationalError("setting single row mode failed")
 
+    def set_chunked_rows_mode(self, size: int) -> None:
+        """
+        Select chunked mode for the currently-executing query.
+
+        :raises ~e.NotSupportedError: if the libpq is older than version 17.
+
+        See :pq:`PQsetChunkedRowsMode` for details.
+        """
+        if not impl.PQsetChunkedRowsMode(self._pgconn_ptr, size):
+            raise e.OperationalError("setting chunked rows mode failed")
+
     def get_cancel(self) -> "PGcancel":
         """
         Create an object with the information needed to cancel a command.
@@ -814,6 +825,17 @@ class PGresult:
     def binary_tuples(self) -> int:
         return impl.PQbinaryTuples(self._pgresult_ptr)
 
+    @property
+    def memory_size(self) -> int:
+        """
+        The number of bytes allocated for the result.
+
+        :raises ~e.NotSupportedError: if the libpq is older than version 12.
+
+        See :pq:`PQresultMemorySize` for details.
+        """
+        return impl.PQresultMemorySize(self._pgresult_ptr)
+
     def get_value(self, row_number: int, column_number: int) -> Optional[bytes]:
         length: int = impl.PQgetlength(self._pgresult_ptr, row_number, column_number)
         if length:
@@ -4,9 +4,11 @@ psycopg row factories
 
 # Copyright (C) 2021 The Psycopg Team
 
+import sys
 import functools
-from typing import Any, Callable, Dict, List, Optional, NamedTuple, NoReturn
-from typing import TYPE_CHECKING, Sequence, Tuple, Type, TypeVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, NamedTuple
+from typing import NoReturn, TYPE_CHECKING, Sequence, Tuple, Type, TypeVar, Union
+from typing import overload
 from collections import namedtuple
 from typing_extensions import TypeAlias
 
@@ -16,6 +18,7 @@ from ._compat import Protocol
 from ._encodings import _as_python_identifier
 
 if TYPE_CHECKING:
+    from .abc import LoadFunc
     from .cursor import BaseCursor, Cursor
     from .cursor_async import AsyncCursor
     from psycopg.pq.abc import PGresult
@@ -23,6 +26,7 @@ if TYPE_CHECKING:
 COMMAND_OK = pq.ExecStatus.COMMAND_OK
 TUPLES_OK = pq.ExecStatus.TUPLES_OK
 SINGLE_TUPLE = pq.ExecStatus.SINGLE_TUPLE
+TUPLES_CHUNK = pq.ExecStatus.TUPLES_CHUNK
 
 T = TypeVar("T", covariant=True)
 
@@ -120,11 +124,7 @@ def dict_row(cursor: "BaseCursor[Any, Any]") -> "RowMaker[DictRow]":
     if names is None:
         return no_result
 
-    def dict_row_(values: Sequence[Any]) -> Dict[str, Any]:
-        # https://github.com/python/mypy/issues/2608
-        return dict(zip(names, values))  # type: ignore[arg-type]
-
-    return dict_row_
+    return DictRowMaker(names)
 
 
 def namedtuple_row(
@@ -144,7 +144,7 @@ def namedtuple_row(
         return no_result
 
     nt = _make_nt(cursor._encoding, *(res.fname(i) for i in range(nfields)))
-    return nt._make
+    return NamedTupleRowMaker(nt)
 
 
 @functools.lru_cache(512)
@@ -153,6 +153,175 @@ def _make_nt(enc: str, *names: bytes) -> Type[NamedTuple]:
     return namedtuple("Row", snames)  # type: ignore[return-value]
 
 
+class DictRowMaker:
+    """
+    The `RowMaker` returned by `dict_row()`.
+
+    The Transformer recognises this object and creates the dictionaries
+    directly, without building a tuple of the values first.
+    """
+
+    __slots__ = ("names",)
+
+    def __init__(self, names: List[str]):
+        # Interned keys make the lookup by column name faster.
+        self.names = [sys.intern(name) for name in names]
+
+    def __call__(self, values: Sequence[Any]) -> Dict[str, Any]:
+        return dict(zip(self.names, values))
+
+
+class NamedTupleRowMaker:
+    """
+    The `RowMaker` returned by `namedtuple_row()`.
+
+    The Transformer recognises this object and creates the records without
+    calling the `!_make()` method of the namedtuple class.
+    """
+
+    __slots__ = ("cls",)
+
+    def __init__(self, cls: Type[NamedTuple]):
+        self.cls = cls
+
+    def __call__(self, values: Sequence[Any]) -> NamedTuple:
+        return self.cls._make(values)
+
+
+def lazy_row(cursor: "BaseCursor[Any, Any]") -> "RowMaker[LazyRow]":
+    """Row factory to represent rows as `LazyRow` objects.
+
+    The values of the record are only converted to Python objects when they
+    are accessed for the first time.
+    """
+    res = cursor.pgresult
+    if not res:
+        return no_result
+
+    nfields = _get_nfields(res)
+    if nfields is None:
+        return no_result
+
+    tx = cursor._tx
+    loads: List["LoadFunc"] = [
+        tx.get_loader(res.ftype(i), pq.Format(res.fformat(i))).load
+        for i in range(nfields)
+    ]
+    names = _get_names(cursor)
+    assert names is not None
+    return LazyRowMaker(loads, names)
+
+
+class LazyRowMaker:
+    """
+    The `RowMaker` returned by `lazy_row()`.
+
+    The Transformer recognises this object and, instead of loading all the
+    values of a record, calls `make_lazy()` to create the records.
+    """
+
+    __slots__ = ("loads", "names", "_index")
+
+    def __init__(self, loads: List["LoadFunc"], names: List[str]):
+        self.loads = loads
+        self.names = names
+        self._index = {name: i for i, name in reversed(list(enumerate(names)))}
+
+    def __call__(self, values: Sequence[Any]) -> "LazyRow":
+        return LazyRow(self, None, 0, list(values))
+
+    def make_lazy(self, pgresult: "PGresult", row: int) -> "LazyRow":
+        return LazyRow(self, pgresult, row, [_NOT_LOADED] * len(self.loads))
+
+
+_NOT_LOADED = object()
+
+
+class LazyRow(Sequence[Any]):
+    """
+    A record whose values are converted to Python objects on first access.
+
+    The object holds a reference to the query result, until all the values are
+    loaded. Values can be accessed by position or by column name.
+    """
+
+    __slots__ = ("_maker", "_pgresult", "_row", "_values", "_to_load")
+
+    def __init__(
+        self,
+        maker: LazyRowMaker,
+        pgresult: Optional["PGresult"],
+        row: int,
+        values: List[Any],
+    ):
+        self._maker = maker
+        self._pgresult = pgresult
+        self._row = row
+        self._values = values
+        self._to_load = len(values) if pgresult else 0
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__} {tuple(self)!r}>"
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @overload
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Tuple[Any, ...]:
+        ...
+
+    def __getitem__(self, key: Union[int, str, slice]) -> Any:
+        if isinstance(key, str):
+            try:
+                return self._load(self._maker._index[key])
+            except KeyError:
+                raise KeyError(f"no column named {key!r}") from None
+        elif isinstance(key, slice):
+            return tuple(self._load(i) for i in range(*key.indices(len(self))))
+        else:
+            if key < 0:
+                key += len(self._values)
+            if not 0 <= key < len(self._values):
+                raise IndexError("record index out of range")
+            return self._load(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self._values)):
+            yield self._load(i)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (LazyRow, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def keys(self) -> List[str]:
+        """Return the names of the columns of the record."""
+        return list(self._maker.names)
+
+    def _load(self, col: int) -> Any:
+        val = self._values[col]
+        if val is not _NOT_LOADED:
+            return val
+
+        assert self._pgresult is not None
+        data = self._pgresult.get_value(self._row, col)
+        if data is not None:
+            val = self._maker.loads[col](data)
+        else:
+            val = None
+        self._values[col] = val
+
+        # Release the result if nothing else is left to load.
+        self._to_load -= 1
+        if not self._to_load:
+            self._pgresult = None
+        return val
+
+
 def class_row(cls: Type[T]) -> BaseRowFactory[T]:
     r"""Generate a row factory to represent rows as instances of the class `!cls`.
 
@@ -248,6 +417,7 @@ def _get_nfields(res: "PGresult") -> Optional[int]:
     if (
         res.status == TUPLES_OK
         or res.status == SINGLE_TUPLE
+        or res.status == TUPLES_CHUNK
         # "describe" in named cursors
         or (res.status == COMMAND_OK and nfields)
     ):
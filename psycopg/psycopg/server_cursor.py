@@ -5,7 +5,7 @@ psycopg server-side cursor objects.
 # Copyright (C) 2020 The Psycopg Team
 
 from typing import Any, AsyncIterator, List, Iterable, Iterator
-from typing import Optional, TypeVar, TYPE_CHECKING, overload
+from typing import Optional, Sequence, Tuple, TypeVar, TYPE_CHECKING, overload
 from warnings import warn
 
 from . import pq
@@ -14,15 +14,19 @@ from . import errors as e
 from .abc import ConnectionType, Query, Params, PQGen
 from .rows import Row, RowFactory, AsyncRowFactory
 from .cursor import BaseCursor, Cursor
-from .generators import execute
+from .generators import execute, fetch_many, send
 from .cursor_async import AsyncCursor
 
 if TYPE_CHECKING:
+    from .pq.abc import PGresult
     from .connection import Connection
     from .connection_async import AsyncConnection
 
 DEFAULT_ITERSIZE = 100
 
+# Maximum number of records fetched in a batch when adapting to `iterbytes`.
+MAX_ITERSIZE = 100_000
+
 TEXT = pq.Format.TEXT
 BINARY = pq.Format.BINARY
 
@@ -36,7 +40,10 @@ INTRANS = pq.TransactionStatus.INTRANS
 class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
     """Mixin to add ServerCursor behaviour and implementation a BaseCursor."""
 
-    __slots__ = "_name _scrollable _withhold _described itersize _format".split()
+    __slots__ = """
+        _name _scrollable _withhold _described itersize iterbytes prefetch
+        _format _fetch_pending _fetch_stash
+    """.split()
 
     def __init__(
         self,
@@ -49,7 +56,11 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         self._withhold = withhold
         self._described = False
         self.itersize: int = DEFAULT_ITERSIZE
+        self.iterbytes: Optional[int] = None
+        self.prefetch: bool = False
         self._format = TEXT
+        self._fetch_pending = False
+        self._fetch_stash: Optional[List["PGresult"]] = None
 
     def __repr__(self) -> str:
         # Insert the name as the second word
@@ -132,6 +143,9 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         self._described = True
 
     def _close_gen(self) -> PQGen[None]:
+        # Discard the result of a FETCH sent ahead, if the iteration stopped.
+        yield from self._fetch_discard_gen()
+
         ts = self._conn.pgconn.transaction_status
 
         # if the connection is not in a sane state, don't even try
@@ -158,25 +172,116 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         yield from self._conn._exec_command(query)
 
     def _fetch_gen(self, num: Optional[int]) -> PQGen[List[Row]]:
+        res = yield from self._fetch_result_gen(num)
+        return self._tx.load_rows(0, res.ntuples, self._make_row)
+
+    def _fetch_columns_gen(self, num: Optional[int]) -> PQGen[List[Sequence[Any]]]:
+        res = yield from self._fetch_result_gen(num)
+        return self._tx.load_columns(0, res.ntuples)
+
+    def _fetch_result_gen(self, num: Optional[int]) -> PQGen["PGresult"]:
         if self.closed:
             raise e.InterfaceError("the cursor is closed")
+        if self._fetch_pending or self._fetch_stash is not None:
+            raise e.ProgrammingError(
+                "cannot fetch from a cursor being iterated with prefetch"
+            )
         # If we are stealing the cursor, make sure we know its shape
         if not self._described:
             yield from self._start_query()
             yield from self._describe_gen()
 
-        query = sql.SQL("FETCH FORWARD {} FROM {}").format(
-            sql.SQL("ALL") if num is None else sql.Literal(num),
-            sql.Identifier(self._name),
+        res = yield from self._conn._exec_command(
+            self._make_fetch_statement(num), result_format=self._format
         )
-        res = yield from self._conn._exec_command(query, result_format=self._format)
         # pipeline mode otherwise, unsupported here.
         assert res is not None
 
         self.pgresult = res
         self._tx.set_pgresult(res, set_loaders=False)
+        return res
+
+    def _prefetch_gen(self, num: int) -> PQGen[List[Row]]:
+        """
+        Return the next `!num` records, requesting the following ones in advance.
+
+        The FETCH for the following batch is sent before converting the
+        records to Python, so that the server roundtrip overlaps with the
+        processing of the current batch by the caller. Its result is received
+        by the connection before executing any other operation.
+        """
+        if self._fetch_pending:
+            yield from self._fetch_stash_gen()
+        if self._fetch_stash is None:
+            if self.closed:
+                raise e.InterfaceError("the cursor is closed")
+            if not self._described:
+                yield from self._start_query()
+                yield from self._describe_gen()
+            yield from self._fetch_send_gen(num)
+            yield from self._fetch_stash_gen()
+
+        results, self._fetch_stash = self._fetch_stash, None
+        assert results
+        res = results[-1]
+        if res.status != TUPLES_OK:
+            self._raise_for_result(res)
+
+        self.pgresult = res
+        self._tx.set_pgresult(res, set_loaders=False)
+        if res.ntuples == num:
+            yield from self._fetch_send_gen(self._next_itersize(num))
+
         return self._tx.load_rows(0, res.ntuples, self._make_row)
 
+    def _next_itersize(self, num: int) -> int:
+        """
+        Return the number of records to fetch after a batch of `!num` records.
+
+        If `iterbytes` is set, scale the number of records so that the next
+        batch size approaches it. The number changes at most by a factor of 2
+        per batch, and doesn't grow beyond `MAX_ITERSIZE`.
+        """
+        res = self.pgresult
+        if not (self.iterbytes and res and res.ntuples):
+            return num
+
+        try:
+            size = res.memory_size
+        except e.NotSupportedError:
+            # Old libpq: estimate from the first record and the libpq
+            # overhead per value.
+            nfields = res.nfields
+            row = (res.get_value(0, i) for i in range(nfields))
+            size = res.ntuples * sum(len(v) + 16 if v else 16 for v in row)
+
+        if size <= 0:
+            return num
+
+        rv = round(num * self.iterbytes / size)
+        rv = min(rv, num * 2, MAX_ITERSIZE)
+        return max(rv, num // 2, 1)
+
+    def _fetch_send_gen(self, num: int) -> PQGen[None]:
+        self._conn._check_connection_ok()
+        query = self._make_fetch_statement(num).as_bytes(self._conn)
+        self._pgconn.send_query_params(query, None, result_format=self._format)
+        self._fetch_pending = True
+        self._conn._prefetching = self
+        yield from send(self._pgconn)
+
+    def _fetch_stash_gen(self) -> PQGen[None]:
+        """Receive the result of the FETCH sent in advance, to use it later."""
+        if self._fetch_pending:
+            self._fetch_pending = False
+            if self._conn._prefetching is self:
+                self._conn._prefetching = None
+            self._fetch_stash = yield from fetch_many(self._pgconn)
+
+    def _fetch_discard_gen(self) -> PQGen[None]:
+        yield from self._fetch_stash_gen()
+        self._fetch_stash = None
+
     def _scroll_gen(self, value: int, mode: str) -> PQGen[None]:
         if mode not in ("relative", "absolute"):
             raise ValueError(f"bad mode: {mode}. It should be 'relative' or 'absolute'")
@@ -187,6 +292,12 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         )
         yield from self._conn._exec_command(query)
 
+    def _make_fetch_statement(self, num: Optional[int]) -> sql.Composed:
+        return sql.SQL("FETCH FORWARD {} FROM {}").format(
+            sql.SQL("ALL") if num is None else sql.Literal(num),
+            sql.Identifier(self._name),
+        )
+
     def _make_declare_statement(self, query: Query) -> sql.Composed:
         if isinstance(query, bytes):
             query = query.decode(self._encoding)
@@ -301,10 +412,22 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         params_seq: Iterable[Params],
         *,
         returning: bool = True,
+        strategy: Optional[str] = None,
+        batch_size: Optional[int] = None,
     ) -> None:
         """Method not implemented for server-side cursors."""
         raise e.NotSupportedError("executemany not supported on server-side cursors")
 
+    def execute_batch(
+        self: _Self,
+        statements: Iterable[Tuple[Query, Optional[Params]]],
+        *,
+        binary: Optional[bool] = None,
+        fail_fast: bool = True,
+    ) -> _Self:
+        """Method not implemented for server-side cursors."""
+        raise e.NotSupportedError("execute_batch not supported on server-side cursors")
+
     def fetchone(self) -> Optional[Row]:
         with self._conn.lock:
             recs = self._conn.wait(self._fetch_gen(1))
@@ -328,15 +451,39 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         self._pos += len(recs)
         return recs
 
+    def fetchmany_columns(self, size: int = 0) -> List[Sequence[Any]]:
+        if not size:
+            size = self.arraysize
+        with self._conn.lock:
+            cols = self._conn.wait(self._fetch_columns_gen(size))
+        assert self.pgresult
+        self._pos += self.pgresult.ntuples
+        return cols
+
+    def fetch_columns(self) -> List[Sequence[Any]]:
+        with self._conn.lock:
+            cols = self._conn.wait(self._fetch_columns_gen(None))
+        assert self.pgresult
+        self._pos += self.pgresult.ntuples
+        return cols
+
     def __iter__(self) -> Iterator[Row]:
-        while True:
-            with self._conn.lock:
-                recs = self._conn.wait(self._fetch_gen(self.itersize))
-            for rec in recs:
-                self._pos += 1
-                yield rec
-            if len(recs) < self.itersize:
-                break
+        num = self.itersize
+        gen = self._prefetch_gen if self.prefetch else self._fetch_gen
+        try:
+            while True:
+                with self._conn.lock:
+                    recs = self._conn.wait(gen(num))
+                for rec in recs:
+                    self._pos += 1
+                    yield rec
+                if len(recs) < num:
+                    break
+                num = self._next_itersize(num)
+        finally:
+            if self._fetch_pending or self._fetch_stash is not None:
+                with self._conn.lock:
+                    self._conn.wait(self._fetch_discard_gen())
 
     def scroll(self, value: int, mode: str = "relative") -> None:
         with self._conn.lock:
@@ -437,9 +584,20 @@ class AsyncServerCursor(
         params_seq: Iterable[Params],
         *,
         returning: bool = True,
+        strategy: Optional[str] = None,
+        batch_size: Optional[int] = None,
     ) -> None:
         raise e.NotSupportedError("executemany not supported on server-side cursors")
 
+    async def execute_batch(
+        self: _Self,
+        statements: Iterable[Tuple[Query, Optional[Params]]],
+        *,
+        binary: Optional[bool] = None,
+        fail_fast: bool = True,
+    ) -> _Self:
+        raise e.NotSupportedError("execute_batch not supported on server-side cursors")
+
     async def fetchone(self) -> Optional[Row]:
         async with self._conn.lock:
             recs = await self._conn.wait(self._fetch_gen(1))
@@ -463,15 +621,39 @@ class AsyncServerCursor(
         self._pos += len(recs)
         return recs
 
+    async def fetchmany_columns(self, size: int = 0) -> List[Sequence[Any]]:
+        if not size:
+            size = self.arraysize
+        async with self._conn.lock:
+            cols = await self._conn.wait(self._fetch_columns_gen(size))
+        assert self.pgresult
+        self._pos += self.pgresult.ntuples
+        return cols
+
+    async def fetch_columns(self) -> List[Sequence[Any]]:
+        async with self._conn.lock:
+            cols = await self._conn.wait(self._fetch_columns_gen(None))
+        assert self.pgresult
+        self._pos += self.pgresult.ntuples
+        return cols
+
     async def __aiter__(self) -> AsyncIterator[Row]:
-        while True:
-            async with self._conn.lock:
-                recs = await self._conn.wait(self._fetch_gen(self.itersize))
-            for rec in recs:
-                self._pos += 1
-                yield rec
-            if len(recs) < self.itersize:
-                break
+        num = self.itersize
+        gen = self._prefetch_gen if self.prefetch else self._fetch_gen
+        try:
+            while True:
+                async with self._conn.lock:
+                    recs = await self._conn.wait(gen(num))
+                for rec in recs:
+                    self._pos += 1
+                    yield rec
+                if len(recs) < num:
+                    break
+                num = self._next_itersize(num)
+        finally:
+            if self._fetch_pending or self._fetch_stash is not None:
+                async with self._conn.lock:
+                    await self._conn.wait(self._fetch_discard_gen())
 
     async def scroll(self, value: int, mode: str = "relative") -> None:
         async with self._conn.lock:
@@ -0,0 +1,125 @@
+"""
+Adapters for NumPy arrays
+"""
+
+# Copyright (C) 2023 The Psycopg Team
+
+from typing import Any, Dict, Optional
+
+from .. import postgres
+from .. import errors as e
+from ..abc import AdaptContext, Buffer, DumperKey
+from ..adapt import Dumper, RecursiveLoader, PyFormat
+from ..pq import Format
+from .._compat import prod
+from .array import _load_binary, _pack_head, _pack_dim, _unpack_head, _unpack_dim
+
+try:
+    import numpy as np
+
+except ImportError:
+    raise ImportError(
+        "The module psycopg.types.numpy requires the package 'numpy'" " to be installed"
+    )
+
+# The Postgres types that can be converted to and from a NumPy dtype, whose
+# binary representation is the dtype item in network byte order.
+_type_names: Dict[Any, str] = {
+    np.bool_: "bool",
+    np.int16: "int2",
+    np.int32: "int4",
+    np.int64: "int8",
+    np.float32: "float4",
+    np.float64: "float8",
+}
+
+_dtypes: Dict[int, "np.dtype[Any]"] = {
+    postgres.types[name].oid: np.dtype(type) for type, name in _type_names.items()
+}
+
+
+class NDArrayBinaryDumper(Dumper):
+    """
+    Dump a `numpy.ndarray` with a fixed-width dtype as a binary Postgres array.
+
+    The elements are converted to network byte order with a single vectorised
+    operation: no Python object is created for each element.
+    """
+
+    format = Format.BINARY
+    element_oid = 0
+
+    def get_key(self, obj: "np.ndarray[Any, Any]", format: PyFormat) -> DumperKey:
+        return (self.cls, obj.dtype.type)
+
+    def upgrade(self, obj: "np.ndarray[Any, Any]", format: PyFormat) -> Dumper:
+        name = _type_names.get(obj.dtype.type)
+        if not name:
+            raise e.DataError(f"cannot dump numpy arrays of dtype {obj.dtype}")
+
+        info = postgres.types[name]
+        dumper = type(self)(self.cls)
+        dumper.oid = info.array_oid
+        dumper.element_oid = info.oid
+        return dumper
+
+    def dump(self, obj: "np.ndarray[Any, Any]") -> Buffer:
+        if not obj.ndim:
+            raise e.DataError(
+                "cannot dump 0-dimensional numpy arrays: use item() to dump"
+                " the value, or reshape(1) to dump a 1-element array"
+            )
+        if not obj.size:
+            return _pack_head(0, 0, self.element_oid)
+
+        # Every element is preceded by its length, so pack them in a record.
+        dtype = obj.dtype.newbyteorder(">")
+        items = np.empty(obj.shape, dtype=[("len", ">i4"), ("val", dtype)])
+        items["len"] = dtype.itemsize
+        items["val"] = obj
+
+        head = [_pack_head(obj.ndim, 0, self.element_oid)]
+        head.extend(_pack_dim(dim, 1) for dim in obj.shape)
+        head.append(items.tobytes())
+        return b"".join(head)
+
+
+class NDArrayBinaryLoader(RecursiveLoader):
+    """
+    Load a binary Postgres array of a numeric type as a `numpy.ndarray`.
+
+    The values are copied in a single buffer with native byte order. Arrays
+    containing nulls, or of types not mapping to a NumPy dtype, are returned
+    as arrays of Python objects.
+    """
+
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> "np.ndarray[Any, Any]":
+        ndims, hasnull, oid = _unpack_head(data)
+        dtype = _dtypes.get(oid)
+        if hasnull or dtype is None:
+            return np.array(_load_binary(data, self._tx), dtype=object)
+
+        if not ndims:
+            return np.empty(0, dtype=dtype)
+
+        p = 12 + 8 * ndims
+        dims = [_unpack_dim(data, i)[0] for i in range(12, p, 8)]
+        items = np.frombuffer(
+            data,
+            dtype=[("len", ">i4"), ("val", dtype.newbyteorder(">"))],
+            count=prod(dims),
+            offset=p,
+        )
+        return items["val"].astype(dtype).reshape(dims)
+
+
+def register_numpy(context: Optional[AdaptContext] = None) -> None:
+    """Register the NumPy dumper and loaders."""
+    adapters = context.adapters if context else postgres.adapters
+
+    for name in _type_names.values():
+        adapters.register_loader(postgres.types[name].array_oid, NDArrayBinaryLoader)
+
+    adapters.register_dumper(np.ndarray, NDArrayBinaryDumper)
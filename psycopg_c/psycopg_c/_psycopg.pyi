@@ -7,7 +7,7 @@ information. Will submit a bug.
 
 # Copyright (C) 2020 The Psycopg Team
 
-from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
 from psycopg import pq
 from psycopg import abc
@@ -47,6 +47,7 @@ class Transformer(abc.AdaptContext):
     def get_dumper(self, obj: Any, format: PyFormat) -> abc.Dumper: ...
     def load_rows(self, row0: int, row1: int, make_row: RowMaker[Row]) -> List[Row]: ...
     def load_row(self, row: int, make_row: RowMaker[Row]) -> Optional[Row]: ...
+    def load_columns(self, row0: int, row1: int) -> List[Sequence[Any]]: ...
     def load_sequence(
         self, record: Sequence[Optional[abc.Buffer]]
     ) -> Tuple[Any, ...]: ...
@@ -61,6 +62,12 @@ def fetch(pgconn: PGconn) -> abc.PQGen[Optional[PGresult]]: ...
 def pipeline_communicate(
     pgconn: PGconn, commands: Deque[abc.PipelineCommand]
 ) -> abc.PQGen[List[List[PGresult]]]: ...
+def copy_from_into(
+    pgconn: PGconn, target: Union[int, Callable[[abc.Buffer], Any]]
+) -> abc.PQGen[Tuple[int, PGresult]]: ...
+def copy_from_many(
+    pgconn: PGconn, n: int
+) -> abc.PQGen[Tuple[List[abc.Buffer], Optional[PGresult]]]: ...
 def wait_c(
     gen: abc.PQGen[abc.RV], fileno: int, timeout: Optional[float] = None
 ) -> abc.RV: ...
@@ -74,6 +81,12 @@ def format_row_binary(
 ) -> bytearray: ...
 def parse_row_text(data: abc.Buffer, tx: abc.Transformer) -> Tuple[Any, ...]: ...
 def parse_row_binary(data: abc.Buffer, tx: abc.Transformer) -> Tuple[Any, ...]: ...
+def parse_rows_text(
+    blocks: List[abc.Buffer], tx: abc.Transformer
+) -> List[Tuple[Any, ...]]: ...
+def parse_rows_binary(
+    blocks: List[abc.Buffer], tx: abc.Transformer
+) -> List[Tuple[Any, ...]]: ...
 
 # Arrays optimization
 def array_load_text(
@@ -186,6 +186,14 @@ def format_row_text(
 
 
 def parse_row_binary(data, tx: Transformer) -> Tuple[Any, ...]:
+    return tx.load_sequence(_parse_fields_binary(data))
+
+
+def parse_rows_binary(blocks: list, tx: Transformer) -> List[Tuple[Any, ...]]:
+    return [tx.load_sequence(_parse_fields_binary(data)) for data in blocks]
+
+
+cdef list _parse_fields_binary(data):
     cdef unsigned char *ptr
     cdef Py_ssize_t bufsize
     _buffer_as_string_and_size(data, <char **>&ptr, &bufsize)
@@ -216,16 +224,24 @@ def parse_row_binary(data, tx: Transformer) -> Tuple[Any, ...]:
         Py_INCREF(field)
         PyList_SET_ITEM(row, col, field)
 
-    return tx.load_sequence(row)
+    return row
 
 
 def parse_row_text(data, tx: Transformer) -> Tuple[Any, ...]:
+    # politely assume that the number of fields will be what in the result
+    return tx.load_sequence(_parse_fields_text(data, tx._nfields))
+
+
+def parse_rows_text(blocks: list, tx: Transformer) -> List[Tuple[Any, ...]]:
+    cdef int nfields = tx._nfields
+    return [tx.load_sequence(_parse_fields_text(data, nfields)) for data in blocks]
+
+
+cdef list _parse_fields_text(data, int nfields):
     cdef unsigned char *fstart
     cdef Py_ssize_t size
     _buffer_as_string_and_size(data, <char **>&fstart, &size)
 
-    # politely assume that the number of fields will be what in the result
-    cdef int nfields = tx._nfields
     cdef list row = PyList_New(nfields)
 
     cdef unsigned char *fend
@@ -287,8 +303,7 @@ def parse_row_text(data, tx: Transformer) -> Tuple[Any, ...]:
         # Start of the field
         fstart = fend + 1
 
-    # Convert the array of buffers into Python objects
-    return tx.load_sequence(row)
+    return row
 
 
 cdef extern from *:
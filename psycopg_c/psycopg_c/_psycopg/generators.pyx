@@ -4,7 +4,12 @@ C implementation of generators for the communication protocols with the libpq
 
 # Copyright (C) 2020 The Psycopg Team
 
+from libc.errno cimport errno, EINTR
+from libc.string cimport memcpy
+from cpython.exc cimport PyErr_SetFromErrno
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from cpython.object cimport PyObject_CallFunctionObjArgs
+from cpython.memoryview cimport PyMemoryView_FromObject
 
 from typing import List
 
@@ -13,7 +18,19 @@ from psycopg.pq import abc, error_message
 from psycopg.abc import PipelineCommand, PQGen
 from psycopg._enums import Wait, Ready
 from psycopg._compat import Deque
-from psycopg._encodings import conninfo_encoding
+from psycopg._encodings import conninfo_encoding, pgconn_encoding
+
+cdef extern from * nogil:
+    """
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+#include <io.h>
+#define psyco_write(fd, buf, n) _write((fd), (buf), (unsigned int)(n))
+#else
+#include <unistd.h>
+#define psyco_write(fd, buf, n) write((fd), (buf), (n))
+#endif
+    """
+    Py_ssize_t psyco_write(int fd, const char *buf, Py_ssize_t n)
 
 cdef object WAIT_W = Wait.W
 cdef object WAIT_R = Wait.R
@@ -25,6 +42,9 @@ cdef int READY_R = Ready.R
 cdef int READY_W = Ready.W
 cdef int READY_RW = Ready.RW
 
+# Size of the blocks written to file by copy_from_into()
+cdef Py_ssize_t COPY_INTO_BUFFER_SIZE = 64 * 1024
+
 def connect(conninfo: str) -> PQGenConn[abc.PGconn]:
     """
     Generator to create a database connection without blocking.
@@ -252,6 +272,159 @@ def pipeline_communicate(
     return results
 
 
+def copy_from_into(pq.PGconn pgconn, target) -> PQGen[Tuple[int, PGresult]]:
+    """
+    Generator passing all the data of a :sql:`COPY TO` operation to `!target`.
+
+    `!target` can be a file descriptor or a function to call with every block
+    of data received. The data for a file descriptor is accumulated and
+    written in large blocks, without creating Python objects.
+
+    Return the number of bytes received and the final result of the operation.
+    """
+    cdef libpq.PGconn *pgconn_ptr = pgconn._pgconn_ptr
+    cdef char *data
+    cdef char *buf = NULL
+    cdef Py_ssize_t buflen = 0
+    cdef Py_ssize_t nbytes = 0
+    cdef int size, cires
+    cdef int fd = -1
+    cdef int rv = 0
+
+    if isinstance(target, int):
+        fd = target
+        buf = <char *>PyMem_Malloc(COPY_INTO_BUFFER_SIZE)
+        if buf is NULL:
+            raise MemoryError()
+
+    try:
+        while True:
+            with nogil:
+                size = libpq.PQgetCopyData(pgconn_ptr, &data, 1)
+
+            if size > 0:
+                nbytes += size
+                if fd < 0:
+                    target(PyMemoryView_FromObject(
+                        pq.PQBuffer._from_buffer(<unsigned char *>data, size)))
+                    continue
+
+                with nogil:
+                    if buflen + size > COPY_INTO_BUFFER_SIZE:
+                        rv = _write_all(fd, buf, buflen)
+                        buflen = 0
+                    if rv == 0:
+                        if size > COPY_INTO_BUFFER_SIZE:
+                            rv = _write_all(fd, data, size)
+                        else:
+                            memcpy(buf + buflen, data, size)
+                            buflen += size
+                    libpq.PQfreemem(data)
+                if rv < 0:
+                    PyErr_SetFromErrno(OSError)
+
+            elif size == 0:
+                # would block
+                yield WAIT_R
+                with nogil:
+                    cires = libpq.PQconsumeInput(pgconn_ptr)
+                if 1 != cires:
+                    raise e.OperationalError(
+                        f"consuming input failed: {error_message(pgconn)}")
+
+            elif size == -1:
+                break
+
+            else:
+                raise e.OperationalError(
+                    f"receiving copy data failed: {error_message(pgconn)}")
+
+        if buflen:
+            with nogil:
+                rv = _write_all(fd, buf, buflen)
+            if rv < 0:
+                PyErr_SetFromErrno(OSError)
+
+    finally:
+        PyMem_Free(buf)
+
+    return nbytes, (yield from _copy_out_result(pgconn))
+
+
+def copy_from_many(
+    pq.PGconn pgconn, int n
+) -> PQGen[Tuple[List[Buffer], Optional[PGresult]]]:
+    """
+    Generator reading up to `!n` blocks of data of a :sql:`COPY TO` operation.
+
+    Return the blocks read and, if the operation is finished, its final result.
+    Fewer than `!n` blocks are returned only if the operation is finished.
+    """
+    cdef libpq.PGconn *pgconn_ptr = pgconn._pgconn_ptr
+    cdef char *data
+    cdef int size, cires
+    cdef list blocks = []
+
+    while len(blocks) < n:
+        with nogil:
+            size = libpq.PQgetCopyData(pgconn_ptr, &data, 1)
+
+        if size > 0:
+            blocks.append(PyMemoryView_FromObject(
+                pq.PQBuffer._from_buffer(<unsigned char *>data, size)))
+
+        elif size == 0:
+            # would block
+            yield WAIT_R
+            with nogil:
+                cires = libpq.PQconsumeInput(pgconn_ptr)
+            if 1 != cires:
+                raise e.OperationalError(
+                    f"consuming input failed: {error_message(pgconn)}")
+
+        elif size == -1:
+            return blocks, (yield from _copy_out_result(pgconn))
+
+        else:
+            raise e.OperationalError(
+                f"receiving copy data failed: {error_message(pgconn)}")
+
+    return blocks, None
+
+
+def _copy_out_result(pq.PGconn pgconn) -> PQGen[PGresult]:
+    """
+    Retrieve the final result of a :sql:`COPY TO` once the data is finished.
+    """
+    results = yield from fetch_many(pgconn)
+    if len(results) > 1:
+        raise e.ProgrammingError("you cannot mix COPY with other operations")
+    result = results[0]
+    if result.status != libpq.PGRES_COMMAND_OK:
+        encoding = pgconn_encoding(pgconn)
+        raise e.error_from_result(result, encoding=encoding)
+
+    return result
+
+
+cdef int _write_all(int fd, const char *buf, Py_ssize_t length) nogil:
+    """
+    Write a buffer entirely to a file descriptor.
+
+    Return -1, with errno set, in case of error.
+    """
+    cdef Py_ssize_t rv
+    while length > 0:
+        rv = psyco_write(fd, buf, length)
+        if rv < 0:
+            if errno == EINTR:
+                continue
+            return -1
+        buf += rv
+        length -= rv
+    return 0
+
+
 cdef int _consume_notifies(pq.PGconn pgconn) except -1:
     cdef object notify_handler = pgconn.notify_handler
     cdef libpq.PGconn *pgconn_ptr
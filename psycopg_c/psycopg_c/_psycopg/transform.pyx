@@ -9,9 +9,12 @@ too many temporary Python objects and performing less memory copying.
 # Copyright (C) 2020 The Psycopg Team
 
 cimport cython
+from libc.string cimport strcmp
+from libc.stdint cimport uint16_t, uint32_t, uint64_t
+from cpython cimport array as carray
 from cpython.ref cimport Py_INCREF, Py_DECREF
 from cpython.set cimport PySet_Add, PySet_Contains
-from cpython.dict cimport PyDict_GetItem, PyDict_SetItem
+from cpython.dict cimport PyDict_New, PyDict_GetItem, PyDict_SetItem
 from cpython.list cimport (
     PyList_New, PyList_CheckExact,
     PyList_GET_ITEM, PyList_SET_ITEM, PyList_GET_SIZE)
@@ -20,14 +23,24 @@ from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
 from cpython.object cimport PyObject, PyObject_CallFunctionObjArgs
 
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from weakref import proxy
 
+from psycopg_c._psycopg cimport endian
 from psycopg import errors as e
 from psycopg.pq import Format as PqFormat
-from psycopg.rows import Row, RowMaker
+from psycopg.rows import Row, RowMaker, LazyRowMaker
+from psycopg.rows import DictRowMaker, NamedTupleRowMaker
+from psycopg._column import ColumnArray
 from psycopg._encodings import pgconn_encoding
 
 NoneType = type(None)
 
+cdef libpq.Oid RECORD_ARRAY_OID = 2287
+
+# Connection parameters the loaders may depend on.
+cdef tuple LOADERS_PARAMS = (
+    b"client_encoding", b"DateStyle", b"IntervalStyle", b"TimeZone")
+
 # internal structure: you are not supposed to know this. But it's worth some
 # 10% of the innermost loop, so I'm willing to ask for forgiveness later...
 
@@ -44,6 +57,94 @@ ctypedef struct pg_result_int:
     # ...more members, which we ignore
 
 
+cdef object _load_binary_column(
+    pg_result_int *ires, int col, int row0, int row1, str typecode
+):
+    """
+    Return an array filled with a fixed-size binary column, converted in place.
+
+    Return None if the values in the result don't match the array item size.
+    """
+    cdef carray.array arr = carray.clone(
+        ColumnArray(typecode), row1 - row0, zero=False)
+    cdef int itemsize = arr.ob_descr.itemsize
+    cdef char *data = arr.data.as_chars
+    cdef PGresAttValue *attval
+    cdef int row
+
+    for row in range(row0, row1):
+        attval = &(ires.tuples[row][col])
+        if attval.len != itemsize:
+            return None
+
+        if itemsize == 1:
+            data[0] = 1 if attval.value[0] else 0
+        elif itemsize == 2:
+            (<uint16_t *>data)[0] = endian.be16toh((<uint16_t *>attval.value)[0])
+        elif itemsize == 4:
+            (<uint32_t *>data)[0] = endian.be32toh((<uint32_t *>attval.value)[0])
+        elif itemsize == 8:
+            (<uint64_t *>data)[0] = endian.be64toh((<uint64_t *>attval.value)[0])
+        else:
+            return None
+
+        data += itemsize
+
+    return arr
+
+
+cdef carray.array _mask_template = carray.array("b")
+
+cdef object _make_column_array(str typecode, list values, int has_nulls):
+    """
+    Return a ColumnArray from a list of loaded values, possibly containing None.
+
+    The None are replaced by 0 and their position is recorded in the mask.
+    """
+    if not has_nulls:
+        return ColumnArray(typecode, values)
+
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = len(values)
+    cdef carray.array mask = carray.clone(_mask_template, n, zero=True)
+    for i in range(n):
+        if values[i] is None:
+            mask.data.as_chars[i] = 1
+            values[i] = 0
+
+    rv = ColumnArray(typecode, values)
+    rv.mask = mask
+    return rv
+
+
+cdef object _array_typecodes = None
+
+cdef object _get_array_typecodes():
+    """
+    Return the `array` typecode to use to load a column, by loader and oid.
+
+    Only the builtin loaders are mapped: a column using a custom loader is
+    returned as a list of objects.
+    """
+    global _array_typecodes
+    if _array_typecodes is None:
+        _array_typecodes = {
+            (IntLoader, oids.INT2_OID): "h",
+            (IntLoader, oids.INT4_OID): "i",
+            (IntLoader, oids.INT8_OID): "q",
+            (Int2BinaryLoader, oids.INT2_OID): "h",
+            (Int4BinaryLoader, oids.INT4_OID): "i",
+            (Int8BinaryLoader, oids.INT8_OID): "q",
+            (FloatLoader, oids.FLOAT4_OID): "f",
+            (FloatLoader, oids.FLOAT8_OID): "d",
+            (Float4BinaryLoader, oids.FLOAT4_OID): "f",
+            (Float8BinaryLoader, oids.FLOAT8_OID): "d",
+            (BoolLoader, oids.BOOL_OID): "b",
+            (BoolBinaryLoader, oids.BOOL_OID): "b",
+        }
+    return _array_typecodes
+
+
 @cython.freelist(16)
 cdef class RowLoader:
     cdef CLoader cloader
@@ -158,18 +259,62 @@ cdef class Transformer:
         if format is None:
             format = libpq.PQfformat(res, 0)
 
-        cdef list loaders = PyList_New(self._nfields)
-        cdef PyObject *row_loader
+        cdef tuple types = PyTuple_New(self._nfields)
+        cdef libpq.Oid ftype
         cdef object oid
+        cdef bint cacheable = True
 
         cdef int i
         for i in range(self._nfields):
-            oid = libpq.PQftype(res, i)
-            row_loader = self._c_get_loader(<PyObject *>oid, <PyObject *>format)
+            ftype = libpq.PQftype(res, i)
+            if ftype == oids.RECORD_OID or ftype == RECORD_ARRAY_OID:
+                cacheable = False
+            oid = ftype
+            Py_INCREF(oid)
+            PyTuple_SET_ITEM(types, i, oid)
+
+        self._row_loaders = self._c_row_loaders(types, format, cacheable)
+
+    cdef list _c_row_loaders(self, tuple types, object fmt, bint cacheable):
+        """
+        Return the row loaders for a result with columns of the given types.
+
+        The loaders are looked up in the connection cache, so that results of
+        the same shape don't need to create their loaders again.
+        """
+        cdef pq.PGconn pgconn
+        cdef _LoadersCache cache
+        conn = self.connection
+
+        # Records loaders configure themselves on the first value, so they
+        # can't be shared by results of different queries.
+        if conn is not None and cacheable:
+            pgconn = conn.pgconn
+            if (
+                pgconn._pgconn_ptr is not NULL
+                and libpq.PQstatus(pgconn._pgconn_ptr) == libpq.CONNECTION_OK
+            ):
+                cache = conn._loaders_cache
+                if (
+                    cache is None
+                    or cache.loaders[fmt] is not self.adapters._loaders[fmt]
+                    or not cache.check_params(pgconn._pgconn_ptr)
+                ):
+                    cache = _LoadersCache(self, pgconn)
+                    conn._loaders_cache = cache
+
+                return cache.get_row_loaders(types, fmt)
+
+        cdef Py_ssize_t ntypes = len(types)
+        cdef list loaders = PyList_New(ntypes)
+        cdef PyObject *row_loader
+        for i in range(ntypes):
+            row_loader = self._c_get_loader(
+                <PyObject *>types[i], <PyObject *>fmt)
             Py_INCREF(<object>row_loader)
             PyList_SET_ITEM(loaders, i, <object>row_loader)
 
-        self._row_loaders = loaders
+        return loaders
 
     def set_dumper_types(self, types: Sequence[int], format: Format) -> None:
         cdef Py_ssize_t ntypes = len(types)
@@ -433,6 +578,10 @@ cdef class Transformer:
                 f"rows must be included between 0 and {self._ntuples}"
             )
 
+        if type(make_row) is LazyRowMaker:
+            return [make_row.make_lazy(self._pgresult, row)
+                for row in range(row0, row1)]
+
         cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
         # cheeky access to the internal PGresult structure
         cdef pg_result_int *ires = <pg_result_int*>res
@@ -442,9 +591,16 @@ cdef class Transformer:
         cdef PGresAttValue *attval
         cdef object record  # not 'tuple' as it would check on assignment
 
+        # If the rows are dicts, fill them directly instead of tuples.
+        cdef list names = self._dict_row_names(make_row)
+        cdef object name = None
+
         cdef object records = PyList_New(row1 - row0)
         for row in range(row0, row1):
-            record = PyTuple_New(self._nfields)
+            if names is None:
+                record = PyTuple_New(self._nfields)
+            else:
+                record = PyDict_New()
             Py_INCREF(record)
             PyList_SET_ITEM(records, row - row0, record)
 
@@ -454,6 +610,9 @@ cdef class Transformer:
 
         for col in range(self._nfields):
             loader = PyList_GET_ITEM(row_loaders, col)
+            if names is not None:
+                name = <object>PyList_GET_ITEM(names, col)
+
             if (<RowLoader>loader).cloader is not None:
                 for row in range(row0, row1):
                     brecord = PyList_GET_ITEM(records, row - row0)
@@ -464,8 +623,11 @@ cdef class Transformer:
                         pyval = (<RowLoader>loader).cloader.cload(
                             attval.value, attval.len)
 
-                    Py_INCREF(pyval)
-                    PyTuple_SET_ITEM(<object>brecord, col, pyval)
+                    if names is None:
+                        Py_INCREF(pyval)
+                        PyTuple_SET_ITEM(<object>brecord, col, pyval)
+                    else:
+                        PyDict_SetItem(<object>brecord, name, pyval)
 
             else:
                 for row in range(row0, row1):
@@ -481,17 +643,29 @@ cdef class Transformer:
                         pyval = PyObject_CallFunctionObjArgs(
                             (<RowLoader>loader).loadfunc, <PyObject *>b, NULL)
 
-                    Py_INCREF(pyval)
-                    PyTuple_SET_ITEM(<object>brecord, col, pyval)
+                    if names is None:
+                        Py_INCREF(pyval)
+                        PyTuple_SET_ITEM(<object>brecord, col, pyval)
+                    else:
+                        PyDict_SetItem(<object>brecord, name, pyval)
+
+        if names is not None or make_row is tuple:
+            return records
 
-        if make_row is not tuple:
-            for i in range(row1 - row0):
-                brecord = PyList_GET_ITEM(records, i)
+        cdef object nt = None
+        if type(make_row) is NamedTupleRowMaker:
+            nt = make_row.cls
+
+        for i in range(row1 - row0):
+            brecord = PyList_GET_ITEM(records, i)
+            if nt is not None:
+                record = tuple.__new__(nt, <object>brecord)
+            else:
                 record = PyObject_CallFunctionObjArgs(
                     make_row, <PyObject *>brecord, NULL)
-                Py_INCREF(record)
-                PyList_SET_ITEM(records, i, record)
-                Py_DECREF(<object>brecord)
+            Py_INCREF(record)
+            PyList_SET_ITEM(records, i, record)
+            Py_DECREF(<object>brecord)
         return records
 
     def load_row(self, int row, object make_row) -> Optional[Row]:
@@ -501,6 +675,9 @@ cdef class Transformer:
         if not 0 <= row < self._ntuples:
             return None
 
+        if type(make_row) is LazyRowMaker:
+            return make_row.make_lazy(self._pgresult, row)
+
         cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
         # cheeky access to the internal PGresult structure
         cdef pg_result_int *ires = <pg_result_int*>res
@@ -510,7 +687,12 @@ cdef class Transformer:
         cdef PGresAttValue *attval
         cdef object record  # not 'tuple' as it would check on assignment
 
-        record = PyTuple_New(self._nfields)
+        cdef list names = self._dict_row_names(make_row)
+        if names is None:
+            record = PyTuple_New(self._nfields)
+        else:
+            record = PyDict_New()
+
         row_loaders = self._row_loaders  # avoid an incref/decref per item
 
         for col in range(self._nfields):
@@ -530,13 +712,112 @@ cdef class Transformer:
                     pyval = PyObject_CallFunctionObjArgs(
                         (<RowLoader>loader).loadfunc, <PyObject *>b, NULL)
 
+            if names is None:
+                Py_INCREF(pyval)
+                PyTuple_SET_ITEM(record, col, pyval)
+            else:
+                PyDict_SetItem(record, <object>PyList_GET_ITEM(names, col), pyval)
+
+        if names is not None or make_row is tuple:
+            return record
+
+        if type(make_row) is NamedTupleRowMaker:
+            return tuple.__new__(make_row.cls, record)
+        else:
+            return PyObject_CallFunctionObjArgs(make_row, <PyObject *>record, NULL)
+
+    cdef list _dict_row_names(self, object make_row):
+        """
+        Return the keys of the records if *make_row* creates dicts, else None.
+        """
+        if type(make_row) is not DictRowMaker:
+            return None
+
+        cdef list names = make_row.names
+        if len(names) != self._nfields:
+            return None
+        return names
+
+    def load_columns(self, int row0, int row1) -> List[Sequence[Any]]:
+        if self._pgresult is None:
+            raise e.InterfaceError("result not set")
+
+        if not (0 <= row0 <= self._ntuples and 0 <= row1 <= self._ntuples):
+            raise e.InterfaceError(
+                f"rows must be included between 0 and {self._ntuples}"
+            )
+
+        cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
+        # cheeky access to the internal PGresult structure
+        cdef pg_result_int *ires = <pg_result_int*>res
+
+        cdef int row
+        cdef int col
+        cdef int has_nulls
+        cdef PyObject *loader  # borrowed RowLoader
+        cdef list columns = PyList_New(self._nfields)
+        cdef object column
+
+        typecodes = _get_array_typecodes()
+        row_loaders = self._row_loaders  # avoid an incref/decref per item
+
+        for col in range(self._nfields):
+            loader = PyList_GET_ITEM(row_loaders, col)
+
+            has_nulls = 0
+            for row in range(row0, row1):
+                if ires.tuples[row][col].len == -1:  # NULL_LEN
+                    has_nulls = 1
+                    break
+
+            # Use a compact array for the builtin numeric loaders, whether or
+            # not the column contains nulls, so that the type returned only
+            # depends on the column type.
+            column = None
+            typecode = typecodes.get(
+                (type((<RowLoader>loader).pyloader), libpq.PQftype(res, col)))
+            if (
+                typecode is not None
+                and not has_nulls
+                and libpq.PQfformat(res, col) == 1
+            ):
+                column = _load_binary_column(ires, col, row0, row1, typecode)
+
+            if column is None:
+                column = self._c_load_column(ires, <RowLoader>loader, col, row0, row1)
+                if typecode is not None:
+                    column = _make_column_array(typecode, column, has_nulls)
+
+            Py_INCREF(column)
+            PyList_SET_ITEM(columns, col, column)
+
+        return columns
+
+    cdef list _c_load_column(
+        self, pg_result_int *ires, RowLoader loader, int col, int row0, int row1
+    ):
+        cdef int row
+        cdef PGresAttValue *attval
+        cdef list values = PyList_New(row1 - row0)
+
+        for row in range(row0, row1):
+            attval = &(ires.tuples[row][col])
+            if attval.len == -1:  # NULL_LEN
+                pyval = None
+            elif loader.cloader is not None:
+                pyval = loader.cloader.cload(attval.value, attval.len)
+            else:
+                b = PyMemoryView_FromObject(
+                    ViewBuffer._from_buffer(
+                        self._pgresult,
+                        <unsigned char *>attval.value, attval.len))
+                pyval = PyObject_CallFunctionObjArgs(
+                    loader.loadfunc, <PyObject *>b, NULL)
+
             Py_INCREF(pyval)
-            PyTuple_SET_ITEM(record, col, pyval)
+            PyList_SET_ITEM(values, row - row0, pyval)
 
-        if make_row is not tuple:
-            record = PyObject_CallFunctionObjArgs(
-                make_row, <PyObject *>record, NULL)
-        return record
+        return values
 
     cpdef object load_sequence(self, record: Sequence[Optional[Buffer]]):
         cdef Py_ssize_t nfields = len(record)
@@ -619,6 +900,80 @@ cdef class Transformer:
         return <PyObject *>row_loader
 
 
+cdef class _LoadersCache:
+    """
+    The loaders of the results already received by a connection.
+
+    The object is stored on the connection, and it is used as the adaptation
+    context of the loaders it creates. It is valid as long as the connection
+    uses the same loaders maps and parameters seen upon creation.
+    """
+
+    cdef readonly object adapters
+    cdef readonly object connection
+    cdef list loaders
+    cdef tuple params
+    cdef Transformer _tx
+
+    # mapping oids -> row loaders (text, binary)
+    cdef dict _text_plans
+    cdef dict _binary_plans
+
+    MAXSIZE = 128
+
+    def __cinit__(self, Transformer context, pq.PGconn pgconn):
+        from psycopg.adapt import AdaptersMap
+
+        # Copying the map makes the current loaders maps read-only.
+        self.adapters = AdaptersMap(context.adapters)
+        self.loaders = self.adapters._loaders[:]
+        self.params = tuple(map(pgconn.parameter_status, LOADERS_PARAMS))
+
+        # Use a proxy to avoid a loop between the connection and its loaders.
+        self.connection = proxy(context.connection)
+
+        self._tx = Transformer(self)
+        self._text_plans = {}
+        self._binary_plans = {}
+
+    cdef bint check_params(self, libpq.PGconn *pgconn_ptr):
+        """Return True if the connection parameters didn't change."""
+        cdef const char *value
+        cdef object seen
+        cdef int i
+        for i in range(len(LOADERS_PARAMS)):
+            value = libpq.PQparameterStatus(
+                pgconn_ptr, PyBytes_AS_STRING(LOADERS_PARAMS[i]))
+            seen = self.params[i]
+            if value is NULL or seen is None:
+                if value is not NULL or seen is not None:
+                    return False
+            elif strcmp(value, PyBytes_AS_STRING(seen)) != 0:
+                return False
+
+        return True
+
+    cdef list get_row_loaders(self, tuple types, object fmt):
+        cdef dict plans = self._binary_plans if fmt else self._text_plans
+        cdef PyObject *ptr = PyDict_GetItem(plans, types)
+        if ptr != NULL:
+            return <list>ptr
+
+        cdef Py_ssize_t ntypes = len(types)
+        cdef list loaders = PyList_New(ntypes)
+        cdef PyObject *row_loader
+        for i in range(ntypes):
+            row_loader = self._tx._c_get_loader(
+                <PyObject *>types[i], <PyObject *>fmt)
+            Py_INCREF(<object>row_loader)
+            PyList_SET_ITEM(loaders, i, <object>row_loader)
+
+        if len(plans) >= self.MAXSIZE:
+            del plans[next(iter(plans))]
+        plans[types] = loaders
+        return loaders
+
+
 cdef object _as_row_dumper(object dumper):
     cdef RowDumper row_dumper = RowDumper()
 
@@ -102,6 +102,7 @@ cdef extern from "libpq-fe.h":
         PGRES_SINGLE_TUPLE
         PGRES_PIPELINE_SYNC
         PGRES_PIPELINE_ABORT
+        PGRES_TUPLES_CHUNK
 
     # 33.1. Database Connection Control Functions
     PGconn *PQconnectdb(const char *conninfo)
@@ -181,6 +182,7 @@ cdef extern from "libpq-fe.h":
     int PQfmod(const PGresult *res, int column_number)
     int PQfsize(const PGresult *res, int column_number)
     int PQbinaryTuples(const PGresult *res)
+    size_t PQresultMemorySize(const PGresult *res)
     char *PQgetvalue(const PGresult *res, int row_number, int column_number)
     int PQgetisnull(const PGresult *res, int row_number, int column_number)
     int PQgetlength(const PGresult *res, int row_number, int column_number)
@@ -243,6 +245,7 @@ cdef extern from "libpq-fe.h":
 
     # 33.5. Retrieving Query Results Row-by-Row
     int PQsetSingleRowMode(PGconn *conn)
+    int PQsetChunkedRowsMode(PGconn *conn, int chunkSize)
 
     # 33.6. Canceling Queries in Progress
     PGcancel *PQgetCancel(PGconn *conn)
@@ -301,6 +304,7 @@ cdef extern from *:
 
 #if PG_VERSION_NUM < 120000
 #define PQhostaddr(conn) NULL
+#define PQresultMemorySize(res) 0
 #endif
 
 #if PG_VERSION_NUM < 140000
@@ -318,4 +322,9 @@ typedef enum {
 #define PQsendFlushRequest(conn) 0
 #define PQsetTraceFlags(conn, stream) do {} while (0)
 #endif
+
+#if PG_VERSION_NUM < 170000
+#define PGRES_TUPLES_CHUNK 12
+#define PQsetChunkedRowsMode(conn, chunkSize) 0
+#endif
 """
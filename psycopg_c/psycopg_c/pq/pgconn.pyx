@@ -20,6 +20,7 @@ cdef extern from * nogil:
 from libc.stdio cimport fdopen
 from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from cpython.bytes cimport PyBytes_AsString
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
 from cpython.memoryview cimport PyMemoryView_FromObject
 
 import sys
@@ -458,6 +459,15 @@ cdef class PGconn:
         if not libpq.PQsetSingleRowMode(self._pgconn_ptr):
             raise e.OperationalError("setting single row mode failed")
 
+    def set_chunked_rows_mode(self, size: int) -> None:
+        if libpq.PG_VERSION_NUM < 170000:
+            raise e.NotSupportedError(
+                f"PQsetChunkedRowsMode requires libpq from PostgreSQL 17,"
+                f" {libpq.PG_VERSION_NUM} available instead"
+            )
+        if not libpq.PQsetChunkedRowsMode(self._pgconn_ptr, size):
+            raise e.OperationalError("setting chunked rows mode failed")
+
     def get_cancel(self) -> PGcancel:
         cdef libpq.PGcancel *ptr = libpq.PQgetCancel(self._pgconn_ptr)
         if not ptr:
@@ -477,11 +487,19 @@ cdef class PGconn:
 
     def put_copy_data(self, buffer) -> int:
         cdef int rv
-        cdef char *cbuffer
-        cdef Py_ssize_t length
+        cdef Py_buffer buf
+
+        # Hold the buffer until the data is copied: it can't be resized or
+        # released by other threads while we run without the GIL.
+        PyObject_GetBuffer(buffer, &buf, PyBUF_SIMPLE)
+        try:
+            with nogil:
+                rv = libpq.PQputCopyData(
+                    self._pgconn_ptr, <const char *>buf.buf, <int>buf.len
+                )
+        finally:
+            PyBuffer_Release(&buf)
 
-        _buffer_as_string_and_size(buffer, &cbuffer, &length)
-        rv = libpq.PQputCopyData(self._pgconn_ptr, cbuffer, <int>length)
         if rv < 0:
             raise e.OperationalError(f"sending copy data failed: {error_message(self)}")
         return rv
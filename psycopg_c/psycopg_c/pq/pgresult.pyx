@@ -94,6 +94,15 @@ cdef class PGresult:
     def binary_tuples(self) -> int:
         return libpq.PQbinaryTuples(self._pgresult_ptr)
 
+    @property
+    def memory_size(self) -> int:
+        if libpq.PG_VERSION_NUM < 120000:
+            raise e.NotSupportedError(
+                f"PQresultMemorySize requires libpq from PostgreSQL 12,"
+                f" {libpq.PG_VERSION_NUM} available instead"
+            )
+        return libpq.PQresultMemorySize(self._pgresult_ptr)
+
     def get_value(self, int row_number, int column_number) -> Optional[bytes]:
         cdef int crow = row_number
         cdef int ccol = column_number
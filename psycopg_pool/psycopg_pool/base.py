@@ -6,8 +6,11 @@ psycopg connection pool base class and functionalities.
 
 from time import monotonic
 from random import random
-from typing import Any, Callable, Dict, Generic, Optional, Tuple
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List
+from typing import Optional, Sequence, Tuple, Union
+from itertools import islice
 
+from psycopg import sql
 from psycopg import errors as e
 from psycopg.abc import ConnectionType
 
@@ -191,6 +194,76 @@ class BasePool(Generic[ConnectionType]):
         """
         return value * (1.0 + ((max_pc - min_pc) * random()) + min_pc)
 
+    # Interval to check if a copy_in() worker blocks the ones still loading.
+    _COPY_IN_CHECK_INTERVAL = 1.0
+
+    # Return the processes, among the ones specified, waiting for a lock held
+    # by the current transaction.
+    _COPY_IN_BLOCKED_QUERY = (
+        "SELECT pid FROM unnest(%s::int[]) AS pid"
+        " WHERE pg_backend_pid() = ANY(pg_blocking_pids(pid))"
+    )
+
+    def _check_copy_in(self, workers: int, batch_size: int) -> int:
+        """
+        Validate the `!copy_in()` parameters and return the workers to use.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        # Workers exceeding the connections would wait for each other
+        # (a max_size of 0 means unlimited in null pools).
+        if self._max_size:
+            workers = min(workers, self._max_size)
+        return workers
+
+    @staticmethod
+    def _copy_in_statements(
+        table: Union[str, sql.Composable], columns: Optional[Sequence[str]]
+    ) -> Tuple[sql.Composed, sql.Composed]:
+        """
+        Return the queries to describe the columns to load and to copy them.
+        """
+        if isinstance(table, str):
+            table = sql.Identifier(table)
+
+        if columns:
+            cols = sql.SQL(", ").join(map(sql.Identifier, columns))
+            describe = sql.SQL("SELECT {} FROM {} LIMIT 0").format(cols, table)
+            copy = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)")
+            return describe, copy.format(table, cols)
+        else:
+            describe = sql.SQL("SELECT * FROM {} LIMIT 0").format(table)
+            copy = sql.SQL("COPY {} FROM STDIN (FORMAT BINARY)")
+            return describe, copy.format(table)
+
+    @staticmethod
+    def _batches(
+        rows: Iterable[Sequence[Any]], batch_size: int
+    ) -> Iterator[List[Sequence[Any]]]:
+        """
+        Split the records to load in lists of *batch_size* items.
+        """
+        it = iter(rows)
+        while True:
+            batch = list(islice(it, batch_size))
+            if not batch:
+                break
+            yield batch
+
+    @staticmethod
+    def _copy_in_deadlock(pid: int, blocked: int) -> e.DeadlockDetected:
+        """
+        Return the error of a `!copy_in()` worker blocking one still loading.
+        """
+        return e.DeadlockDetected(
+            f"copy_in() workers deadlocked: process {blocked} is waiting for"
+            f" the transaction of process {pid}, which is waiting for the"
+            " others to finish loading (are they loading the same keys?)"
+        )
+
     def _set_connection_expiry_date(self, conn: ConnectionType) -> None:
         """Set an expiry date on a connection.
 
@@ -227,3 +300,7 @@ class ConnectionAttempt:
     def time_to_give_up(self, now: float) -> bool:
         """Return True if we are tired of trying to connect. Meh."""
         return self.give_up_at > 0.0 and now >= self.give_up_at
+
+
+class CopyInAborted(Exception):
+    """Raised in the `!copy_in()` workers to discard the data loaded."""
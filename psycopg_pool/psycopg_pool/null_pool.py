@@ -6,7 +6,7 @@ Psycopg null connection pools
 
 import logging
 import threading
-from typing import Any, Callable, Dict, Optional, Tuple, Type
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TYPE_CHECKING
 
 from psycopg import Connection
 from psycopg.pq import TransactionStatus
@@ -16,6 +16,9 @@ from .pool import ConnectionPool, AddConnection
 from .errors import PoolTimeout, TooManyRequests
 from ._compat import ConnectionTimeout
 
+if TYPE_CHECKING:
+    from psycopg import PreparedRegistry
+
 logger = logging.getLogger("psycopg.pool")
 
 
@@ -62,6 +65,7 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: Optional[Callable[[BasePool[Connection[Any]]], None]] = None,
         num_workers: int = 3,
+        prepared_registry: Optional["PreparedRegistry"] = None,
     ):
         super().__init__(
             conninfo,
@@ -80,6 +84,7 @@ class NullConnectionPool(_BaseNullConnectionPool, ConnectionPool):
             reconnect_timeout=reconnect_timeout,
             reconnect_failed=reconnect_failed,
             num_workers=num_workers,
+            prepared_registry=prepared_registry,
         )
 
     def wait(self, timeout: float = 30.0) -> None:
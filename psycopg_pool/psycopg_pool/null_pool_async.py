@@ -7,6 +7,7 @@ psycopg asynchronous null connection pool
 import asyncio
 import logging
 from typing import Any, Awaitable, Callable, Dict, Optional, Type
+from typing import TYPE_CHECKING
 
 from psycopg import AsyncConnection
 from psycopg.pq import TransactionStatus
@@ -17,6 +18,9 @@ from ._compat import ConnectionTimeout
 from .null_pool import _BaseNullConnectionPool
 from .pool_async import AsyncConnectionPool, AddConnection
 
+if TYPE_CHECKING:
+    from psycopg import PreparedRegistry
+
 logger = logging.getLogger("psycopg.pool")
 
 
@@ -43,6 +47,7 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool):
             Callable[[BasePool[AsyncConnection[None]]], None]
         ] = None,
         num_workers: int = 3,
+        prepared_registry: Optional["PreparedRegistry"] = None,
     ):
         super().__init__(
             conninfo,
@@ -61,6 +66,7 @@ class AsyncNullConnectionPool(_BaseNullConnectionPool, AsyncConnectionPool):
             reconnect_timeout=reconnect_timeout,
             reconnect_failed=reconnect_failed,
             num_workers=num_workers,
+            prepared_registry=prepared_registry,
         )
 
     async def wait(self, timeout: float = 30.0) -> None:
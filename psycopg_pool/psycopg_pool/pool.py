@@ -10,20 +10,24 @@ from abc import ABC, abstractmethod
 from time import monotonic
 from queue import Queue, Empty
 from types import TracebackType
-from typing import Any, Callable, Dict, Iterator, List
-from typing import Optional, Sequence, Type
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+from typing import Optional, Sequence, Type, Union, TYPE_CHECKING
 from weakref import ref
 from contextlib import contextmanager
 
+from psycopg import sql
 from psycopg import errors as e
 from psycopg import Connection
 from psycopg.pq import TransactionStatus
 
-from .base import ConnectionAttempt, BasePool
+from .base import ConnectionAttempt, BasePool, CopyInAborted
 from .sched import Scheduler
 from .errors import PoolClosed, PoolTimeout, TooManyRequests
 from ._compat import Deque
 
+if TYPE_CHECKING:
+    from psycopg import PreparedRegistry
+
 logger = logging.getLogger("psycopg.pool")
 
 
@@ -47,10 +51,12 @@ class ConnectionPool(BasePool[Connection[Any]]):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: Optional[Callable[[BasePool[Connection[Any]]], None]] = None,
         num_workers: int = 3,
+        prepared_registry: Optional["PreparedRegistry"] = None,
     ):
         self.connection_class = connection_class
         self._configure = configure
         self._reset = reset
+        self.prepared_registry = prepared_registry
 
         self._lock = threading.RLock()
         self._waiting = Deque["WaitingClient"]()
@@ -145,6 +151,132 @@ class ConnectionPool(BasePool[Connection[Any]]):
             self._stats[self._USAGE_MS] += int(1000.0 * (t1 - t0))
             self.putconn(conn)
 
+    def copy_in(
+        self,
+        table: Union[str, sql.Composable],
+        rows: Iterable[Sequence[Any]],
+        *,
+        columns: Optional[Sequence[str]] = None,
+        workers: int = 2,
+        batch_size: int = 1000,
+        timeout: Optional[float] = None,
+    ) -> int:
+        """Load records into a table using :sql:`COPY` on several connections.
+
+        :param table: The table to load: a name or a `~psycopg.sql.Composable`,
+            for instance a schema-qualified `~psycopg.sql.Identifier`.
+        :param rows: The records to load, as sequences of values.
+        :param columns: The names of the columns to load. If not specified,
+            load all the columns of the table.
+        :param workers: The number of connections loading the data in
+            parallel. It is limited to `max_size`.
+        :param batch_size: The number of records handed to a worker at time.
+        :param timeout: The time to wait to obtain every connection, as in
+            `connection()`.
+        :return: The number of records loaded.
+
+        Every connection loads its share of the records in binary format, in
+        a separate transaction. If any worker fails before the records are
+        completely loaded, all the transactions are rolled back and the first
+        error is raised. The transactions are then committed independently:
+        if a commit fails, the records loaded by the other workers may be
+        committed anyway.
+
+        If two workers load the same key of a unique index, the second waits
+        for the transaction of the first, which waits for the second to finish
+        loading: the operation fails with `~psycopg.errors.DeadlockDetected`.
+
+        The workers which cannot obtain a connection within `!timeout` leave
+        the records to the ones connected: the operation fails only if no
+        connection can be obtained.
+        """
+        workers = self._check_copy_in(workers, batch_size)
+        state = CopyInState(workers, *self._copy_in_statements(table, columns))
+
+        threads = [
+            threading.Thread(
+                target=self._copy_in_worker,
+                args=(state, timeout),
+                name=f"{self.name}-copy-{i}",
+                daemon=True,
+            )
+            for i in range(workers)
+        ]
+        for t in threads:
+            t.start()
+
+        try:
+            for batch in self._batches(rows, batch_size):
+                if state.errors:
+                    break
+                state.queue.put(batch)
+        except BaseException as ex:
+            state.fail(ex)
+            raise
+        finally:
+            for t in threads:
+                state.queue.put(None)
+            for t in threads:
+                t.join()
+
+        if state.errors:
+            raise state.errors[0]
+        return state.nrows
+
+    def _copy_in_worker(self, state: "CopyInState", timeout: Optional[float]) -> None:
+        """Load the records received by a `copy_in()` call."""
+        connected = done = arrived = False
+        try:
+            with self.connection(timeout) as conn:
+                connected = True
+                state.connect(conn.info.backend_pid)
+                with conn.cursor() as cur:
+                    cur.execute(state.describe)
+                    types = [col.type_code for col in cur.description or ()]
+                    with cur.copy(state.copy) as copy:
+                        copy.set_types(types)
+                        while True:
+                            batch = state.queue.get()
+                            if batch is None:
+                                done = True
+                                break
+                            if state.errors:
+                                break
+                            for row in batch:
+                                copy.write_row(row)
+                            state.add_rows(len(batch))
+
+                # Commit only if the other workers were successful too. Raise
+                # out of the copy block, which would report the exception to
+                # the server as an error, but in the connection block, which
+                # rolls back the transaction.
+                arrived = True
+                state.arrive()
+                while not state.wait_loaded(self._COPY_IN_CHECK_INTERVAL):
+                    # A worker loading the same key would wait for this
+                    # transaction to finish, and never finish loading.
+                    cur = conn.execute(self._COPY_IN_BLOCKED_QUERY, [state.pids])
+                    blocked = cur.fetchone()
+                    if blocked:
+                        # Report the error before the rollback unblocks the
+                        # other worker, which might commit otherwise.
+                        pid = conn.info.backend_pid
+                        state.fail(self._copy_in_deadlock(pid, blocked[0]))
+                        raise CopyInAborted()
+                if state.errors:
+                    raise CopyInAborted()
+
+        except BaseException as ex:
+            if isinstance(ex, PoolTimeout) and not connected and state.connected:
+                # The pool is busy: leave the records to the workers connected.
+                return
+            state.fail(ex)
+            if connected and not arrived:
+                state.arrive()
+            # Consume the remaining records to avoid blocking the producer.
+            while not done:
+                done = state.queue.get() is None
+
     def getconn(self, timeout: Optional[float] = None) -> Connection[Any]:
         """Obtain a connection from the pool.
 
@@ -514,6 +646,8 @@ class ConnectionPool(BasePool[Connection[Any]]):
             self._stats[self._CONNECTIONS_MS] += int(1000.0 * (t1 - t0))
 
         conn._pool = self
+        if self.prepared_registry is not None:
+            conn.prepared_registry = self.prepared_registry
 
         if self._configure:
             self._configure(conn)
@@ -525,6 +659,10 @@ class ConnectionPool(BasePool[Connection[Any]]):
                     f" {self._configure}: discarded"
                 )
 
+        # Prepare in advance the statements prepared by the other connections
+        if self.prepared_registry:
+            conn._preload_prepared()
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
@@ -770,6 +908,59 @@ class WaitingClient:
             return True
 
 
+class CopyInState:
+    """The state shared by the workers of a `ConnectionPool.copy_in()` call."""
+
+    __slots__ = """
+        describe copy queue nrows errors connected pids _loading _lock
+        """.split()
+
+    def __init__(self, workers: int, describe: sql.Composed, copy: sql.Composed):
+        self.describe = describe
+        self.copy = copy
+        self.queue: "Queue[Optional[List[Sequence[Any]]]]" = Queue(maxsize=2 * workers)
+        self.nrows = 0
+        self.errors: List[BaseException] = []
+
+        # Number of workers which obtained a connection, their backend pids,
+        # number of the ones still loading, and condition to wait for them.
+        self.connected = 0
+        self.pids: List[int] = []
+        self._loading = 0
+        self._lock = threading.Condition()
+
+    def add_rows(self, nrows: int) -> None:
+        with self._lock:
+            self.nrows += nrows
+
+    def fail(self, error: BaseException) -> None:
+        if isinstance(error, CopyInAborted):
+            return
+        with self._lock:
+            if self.errors:
+                logger.warning("error in copy_in() worker: %s", error)
+            self.errors.append(error)
+
+    def connect(self, pid: int) -> None:
+        """Signal that a worker obtained a connection and started loading."""
+        with self._lock:
+            self.connected += 1
+            self.pids.append(pid)
+            self._loading += 1
+
+    def arrive(self) -> None:
+        """Signal that a worker finished loading."""
+        with self._lock:
+            self._loading -= 1
+            if not self._loading:
+                self._lock.notify_all()
+
+    def wait_loaded(self, timeout: float) -> bool:
+        """Wait for the workers still loading; return False on timeout."""
+        with self._lock:
+            return self._lock.wait_for(lambda: not self._loading, timeout)
+
+
 class MaintenanceTask(ABC):
     """A task to run asynchronously to maintain the pool state."""
 
@@ -9,20 +9,24 @@ import logging
 from abc import ABC, abstractmethod
 from time import monotonic
 from types import TracebackType
-from typing import Any, AsyncIterator, Awaitable, Callable
-from typing import Dict, List, Optional, Sequence, Type
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
+from typing import Dict, List, Optional, Sequence, Type, Union, TYPE_CHECKING
 from weakref import ref
 from contextlib import asynccontextmanager
 
+from psycopg import sql
 from psycopg import errors as e
 from psycopg import AsyncConnection
 from psycopg.pq import TransactionStatus
 
-from .base import ConnectionAttempt, BasePool
+from .base import ConnectionAttempt, BasePool, CopyInAborted
 from .sched import AsyncScheduler
 from .errors import PoolClosed, PoolTimeout, TooManyRequests
 from ._compat import Task, create_task, Deque
 
+if TYPE_CHECKING:
+    from psycopg import PreparedRegistry
+
 logger = logging.getLogger("psycopg.pool")
 
 
@@ -48,10 +52,12 @@ class AsyncConnectionPool(BasePool[AsyncConnection[Any]]):
             Callable[[BasePool[AsyncConnection[Any]]], None]
         ] = None,
         num_workers: int = 3,
+        prepared_registry: Optional["PreparedRegistry"] = None,
     ):
         self.connection_class = connection_class
         self._configure = configure
         self._reset = reset
+        self.prepared_registry = prepared_registry
 
         # asyncio objects, created on open to attach them to the right loop.
         self._lock: asyncio.Lock
@@ -123,6 +129,101 @@ class AsyncConnectionPool(BasePool[AsyncConnection[Any]]):
             self._stats[self._USAGE_MS] += int(1000.0 * (t1 - t0))
             await self.putconn(conn)
 
+    async def copy_in(
+        self,
+        table: Union[str, sql.Composable],
+        rows: Iterable[Sequence[Any]],
+        *,
+        columns: Optional[Sequence[str]] = None,
+        workers: int = 2,
+        batch_size: int = 1000,
+        timeout: Optional[float] = None,
+    ) -> int:
+        workers = self._check_copy_in(workers, batch_size)
+        state = AsyncCopyInState(workers, *self._copy_in_statements(table, columns))
+
+        tasks = [
+            create_task(
+                self._copy_in_worker(state, timeout), name=f"{self.name}-copy-{i}"
+            )
+            for i in range(workers)
+        ]
+
+        try:
+            for batch in self._batches(rows, batch_size):
+                if state.errors:
+                    break
+                await state.queue.put(batch)
+        except BaseException as ex:
+            state.fail(ex)
+            raise
+        finally:
+            for t in tasks:
+                await state.queue.put(None)
+            await asyncio.gather(*tasks)
+
+        if state.errors:
+            raise state.errors[0]
+        return state.nrows
+
+    async def _copy_in_worker(
+        self, state: "AsyncCopyInState", timeout: Optional[float]
+    ) -> None:
+        connected = done = arrived = False
+        try:
+            async with self.connection(timeout) as conn:
+                connected = True
+                await state.connect(conn.info.backend_pid)
+                async with conn.cursor() as cur:
+                    await cur.execute(state.describe)
+                    types = [col.type_code for col in cur.description or ()]
+                    async with cur.copy(state.copy) as copy:
+                        copy.set_types(types)
+                        while True:
+                            batch = await state.queue.get()
+                            if batch is None:
+                                done = True
+                                break
+                            if state.errors:
+                                break
+                            for row in batch:
+                                await copy.write_row(row)
+                            state.nrows += len(batch)
+                            # Writing seldom blocks: let the other workers
+                            # take the next batch.
+                            await asyncio.sleep(0)
+
+                # Commit only if the other workers were successful too. Raise
+                # out of the copy block, which would report the exception to
+                # the server as an error, but in the connection block, which
+                # rolls back the transaction.
+                arrived = True
+                await state.arrive()
+                while not await state.wait_loaded(self._COPY_IN_CHECK_INTERVAL):
+                    # A worker loading the same key would wait for this
+                    # transaction to finish, and never finish loading.
+                    cur = await conn.execute(self._COPY_IN_BLOCKED_QUERY, [state.pids])
+                    blocked = await cur.fetchone()
+                    if blocked:
+                        # Report the error before the rollback unblocks the
+                        # other worker, which might commit otherwise.
+                        pid = conn.info.backend_pid
+                        state.fail(self._copy_in_deadlock(pid, blocked[0]))
+                        raise CopyInAborted()
+                if state.errors:
+                    raise CopyInAborted()
+
+        except BaseException as ex:
+            if isinstance(ex, PoolTimeout) and not connected and state.connected:
+                # The pool is busy: leave the records to the workers connected.
+                return
+            state.fail(ex)
+            if connected and not arrived:
+                await state.arrive()
+            # Consume the remaining records to avoid blocking the producer.
+            while not done:
+                done = await state.queue.get() is None
+
     async def getconn(self, timeout: Optional[float] = None) -> AsyncConnection[Any]:
         logger.info("connection requested from %r", self.name)
         self._stats[self._REQUESTS_NUM] += 1
@@ -440,6 +541,8 @@ class AsyncConnectionPool(BasePool[AsyncConnection[Any]]):
             self._stats[self._CONNECTIONS_MS] += int(1000.0 * (t1 - t0))
 
         conn._pool = self
+        if self.prepared_registry is not None:
+            conn.prepared_registry = self.prepared_registry
 
         if self._configure:
             await self._configure(conn)
@@ -451,6 +554,10 @@ class AsyncConnectionPool(BasePool[AsyncConnection[Any]]):
                     f" {self._configure}: discarded"
                 )
 
+        # Prepare in advance the statements prepared by the other connections
+        if self.prepared_registry:
+            await conn._preload_prepared()
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
@@ -698,6 +805,61 @@ class AsyncClient:
             return True
 
 
+class AsyncCopyInState:
+    """The state shared by the workers of a `AsyncConnectionPool.copy_in()`."""
+
+    __slots__ = """
+        describe copy queue nrows errors connected pids _loading _cond
+        """.split()
+
+    def __init__(self, workers: int, describe: sql.Composed, copy: sql.Composed):
+        self.describe = describe
+        self.copy = copy
+        self.queue: "asyncio.Queue[Optional[List[Sequence[Any]]]]"
+        self.queue = asyncio.Queue(maxsize=2 * workers)
+        self.nrows = 0
+        self.errors: List[BaseException] = []
+
+        # Number of workers which obtained a connection, their backend pids,
+        # number of the ones still loading, and condition to wait for them.
+        self.connected = 0
+        self.pids: List[int] = []
+        self._loading = 0
+        self._cond = asyncio.Condition()
+
+    def fail(self, error: BaseException) -> None:
+        if isinstance(error, CopyInAborted):
+            return
+        if self.errors:
+            logger.warning("error in copy_in() worker: %s", error)
+        self.errors.append(error)
+
+    async def connect(self, pid: int) -> None:
+        """Signal that a worker obtained a connection and started loading."""
+        async with self._cond:
+            self.connected += 1
+            self.pids.append(pid)
+            self._loading += 1
+
+    async def arrive(self) -> None:
+        """Signal that a worker finished loading."""
+        async with self._cond:
+            self._loading -= 1
+            if not self._loading:
+                self._cond.notify_all()
+
+    async def wait_loaded(self, timeout: float) -> bool:
+        """Wait for the workers still loading; return False on timeout."""
+        async with self._cond:
+            try:
+                await asyncio.wait_for(
+                    self._cond.wait_for(lambda: not self._loading), timeout
+                )
+            except asyncio.TimeoutError:
+                return False
+            return True
+
+
 class MaintenanceTask(ABC):
     """A task to run asynchronously to maintain the pool state."""
 
@@ -185,6 +185,160 @@ def test_configure(dsn):
             assert res.fetchone()[0] == "on"  # type: ignore[index]
 
 
+def test_prepared_registry(dsn):
+    reg = psycopg.PreparedRegistry()
+
+    def configure(conn):
+        conn.prepare_threshold = 0
+
+    with pool.ConnectionPool(
+        dsn, min_size=1, configure=configure, prepared_registry=reg
+    ) as p:
+        with p.connection() as conn:
+            assert conn.prepared_registry is reg
+            conn.execute("select %s::int", [1])
+            assert len(reg) == 1
+            conn.close()
+
+        with p.connection() as conn:
+            assert len(conn._prepared._names) == 1
+            cur = conn.execute(
+                "select count(*) from pg_prepared_statements", prepare=False
+            )
+            assert cur.fetchone() == (1,)
+
+
+@pytest.fixture
+def copy_table(svcconn):
+    svcconn.execute("drop table if exists test_copy_in")
+    svcconn.execute("create table test_copy_in (id int primary key, data text)")
+    yield "test_copy_in"
+    svcconn.execute("drop table test_copy_in")
+
+
+def test_copy_in(dsn, svcconn, copy_table):
+    with pool.ConnectionPool(dsn, min_size=3) as p:
+        rows = ((i, f"data{i}") for i in range(1000))
+        assert p.copy_in(copy_table, rows, workers=3, batch_size=10) == 1000
+
+    cur = svcconn.execute("select count(*), sum(id) from test_copy_in")
+    assert cur.fetchone() == (1000, sum(range(1000)))
+
+
+def test_copy_in_columns(dsn, svcconn, copy_table):
+    with pool.ConnectionPool(dsn, min_size=1, max_size=2) as p:
+        table = psycopg.sql.Identifier("public", copy_table)
+        rows = [(i,) for i in range(10)]
+        assert p.copy_in(table, rows, columns=["id"], workers=4) == 10
+
+    cur = svcconn.execute("select count(*), count(data) from test_copy_in")
+    assert cur.fetchone() == (10, 0)
+
+
+def test_copy_in_error(dsn, svcconn, copy_table):
+    with pool.ConnectionPool(dsn, min_size=2) as p:
+        # The duplicates are in the same batch
+        rows = [(i // 2, None) for i in range(1000)]
+        with pytest.raises(psycopg.errors.UniqueViolation):
+            p.copy_in(copy_table, rows, workers=2, batch_size=10)
+
+        # The pool is still usable
+        with p.connection() as conn:
+            conn.execute("select 1")
+
+    cur = svcconn.execute("select count(*) from test_copy_in")
+    assert cur.fetchone() == (0,)
+
+
+def test_copy_in_conflict(dsn, svcconn, copy_table, monkeypatch):
+    monkeypatch.setattr(pool.ConnectionPool, "_COPY_IN_CHECK_INTERVAL", 0.1)
+
+    def rows():
+        # Let the workers receive one of the duplicates each
+        sleep(0.1)
+        yield (1, None)
+        sleep(0.1)
+        yield (1, None)
+
+    with pool.ConnectionPool(dsn, min_size=2) as p:
+        p.wait()
+        for i in range(10):
+            t0 = time()
+            try:
+                p.copy_in(copy_table, rows(), workers=2, batch_size=1)
+            except psycopg.errors.UniqueViolation:
+                # A worker received both the records: try again
+                continue
+            except psycopg.errors.DeadlockDetected:
+                break
+        else:
+            pytest.fail("the workers didn't conflict")
+        assert time() - t0 < 1.0
+
+    cur = svcconn.execute("select count(*) from test_copy_in")
+    assert cur.fetchone() == (0,)
+
+
+def test_copy_in_error_no_warning(dsn, svcconn, copy_table, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg.pool")
+
+    def rows():
+        for i in range(1000):
+            yield (i, None)
+        1 / 0
+
+    with pool.ConnectionPool(dsn, min_size=3) as p:
+        # The workers receiving records after the error stop quietly.
+        with pytest.raises(ZeroDivisionError):
+            p.copy_in(copy_table, rows(), workers=3, batch_size=1)
+
+    assert not caplog.records
+    cur = svcconn.execute("select count(*) from test_copy_in")
+    assert cur.fetchone() == (0,)
+
+
+def test_copy_in_rows_error(dsn, svcconn, copy_table):
+    def rows():
+        for i in range(100):
+            yield (i, None)
+        1 / 0
+
+    with pool.ConnectionPool(dsn, min_size=2) as p:
+        with pytest.raises(ZeroDivisionError):
+            p.copy_in(copy_table, rows(), batch_size=10)
+
+    cur = svcconn.execute("select count(*) from test_copy_in")
+    assert cur.fetchone() == (0,)
+
+
+def test_copy_in_busy(dsn, svcconn, copy_table):
+    with pool.ConnectionPool(dsn, min_size=2) as p:
+        with p.connection():
+            # Only a worker obtains a connection: it loads all the records.
+            rows = [(i, None) for i in range(100)]
+            assert p.copy_in(copy_table, rows, batch_size=10, timeout=0.5) == 100
+
+    cur = svcconn.execute("select count(*) from test_copy_in")
+    assert cur.fetchone() == (100,)
+
+
+def test_copy_in_no_connection(dsn, svcconn, copy_table):
+    with pool.ConnectionPool(dsn, min_size=1) as p:
+        with p.connection():
+            with pytest.raises(pool.PoolTimeout):
+                p.copy_in(copy_table, [(1, None)], timeout=0.2)
+
+    cur = svcconn.execute("select count(*) from test_copy_in")
+    assert cur.fetchone() == (0,)
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"batch_size": 0}])
+def test_copy_in_bad_params(dsn, kwargs):
+    with pool.ConnectionPool(dsn, min_size=1) as p:
+        with pytest.raises(ValueError):
+            p.copy_in("test_copy_in", [], **kwargs)
+
+
 @pytest.mark.slow
 def test_configure_badstate(dsn, caplog):
     caplog.set_level(logging.WARNING, logger="psycopg.pool")
@@ -106,6 +106,32 @@ def test_single_row_mode(pgconn):
     assert res.ntuples == 0
 
 
+@pytest.mark.libpq(">= 17")
+def test_chunked_rows_mode(pgconn):
+    pgconn.send_query_params(b"select generate_series(1,5)", None)
+    pgconn.set_chunked_rows_mode(2)
+
+    results = execute_wait(pgconn)
+    assert len(results) == 4
+
+    assert [res.status for res in results[:3]] == [pq.ExecStatus.TUPLES_CHUNK] * 3
+    assert [res.ntuples for res in results[:3]] == [2, 2, 1]
+    assert results[2].get_value(0, 0) == b"5"
+
+    res = results[3]
+    assert res.status == pq.ExecStatus.TUPLES_OK
+    assert res.ntuples == 0
+
+
+@pytest.mark.libpq("< 17")
+def test_chunked_rows_mode_not_supported(pgconn):
+    pgconn.send_query_params(b"select generate_series(1,5)", None)
+    with pytest.raises(psycopg.NotSupportedError):
+        pgconn.set_chunked_rows_mode(2)
+
+    execute_wait(pgconn)
+
+
 def test_send_query_params(pgconn):
     pgconn.send_query_params(b"select $1::int + $2", [b"5", b"3"])
     (res,) = execute_wait(pgconn)
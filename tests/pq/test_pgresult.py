@@ -1,6 +1,7 @@
 import ctypes
 import pytest
 
+import psycopg
 from psycopg import pq
 
 
@@ -166,6 +167,25 @@ def test_get_value(pgconn):
     assert res.get_value(0, 0) is None
 
 
+@pytest.mark.libpq(">= 12")
+def test_memory_size(pgconn):
+    res1 = pgconn.exec_(b"select 1")
+    assert res1.status == pq.ExecStatus.TUPLES_OK, res1.error_message
+    res2 = pgconn.exec_(b"select repeat('x', 100000) from generate_series(1, 10)")
+    assert res2.status == pq.ExecStatus.TUPLES_OK, res2.error_message
+    assert 0 < res1.memory_size < res2.memory_size
+    assert res2.memory_size > 1000000
+    res2.clear()
+    assert res2.memory_size == 0
+
+
+@pytest.mark.libpq("< 12")
+def test_memory_size_not_supported(pgconn):
+    res = pgconn.exec_(b"select 1")
+    with pytest.raises(psycopg.NotSupportedError):
+        res.memory_size
+
+
 def test_nparams_types(pgconn):
     res = pgconn.prepare(b"", b"select $1::int4, $2::text")
     assert res.status == pq.ExecStatus.COMMAND_OK, res.error_message
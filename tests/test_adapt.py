@@ -1,3 +1,4 @@
+import weakref
 import datetime as dt
 from types import ModuleType
 from typing import Any, List
@@ -272,6 +273,73 @@ def test_cow_loaders(conn):
     assert cur2.execute("select 'hello2'::text").fetchone() == ("hello2c2",)
 
 
+@pytest.mark.parametrize("fmt_out", pq.Format)
+def test_loaders_cache(conn, fmt_out):
+    inits = []
+
+    class CountingLoader(Loader):
+        format = fmt_out
+
+        def __init__(self, oid, context):
+            super().__init__(oid, context)
+            inits.append(oid)
+
+        def load(self, data):
+            return bytes(data).decode() + "c"
+
+    conn.adapters.register_loader("text", CountingLoader)
+    binary = fmt_out == pq.Format.BINARY
+    for i in range(3):
+        cur = conn.execute("select 'hello'::text, 'world'::text", binary=binary)
+        assert cur.fetchone() == ("helloc", "worldc")
+    assert len(inits) == 1
+
+    # The cache is invalidated by registering new loaders.
+    conn.adapters.register_loader("text", CountingLoader)
+    cur = conn.execute("select 'hello'::text", binary=binary)
+    assert cur.fetchone() == ("helloc",)
+    assert len(inits) == 2
+
+
+def test_loaders_cache_no_loop(conn_cls, dsn):
+    conn = conn_cls.connect(dsn)
+    conn.execute("select 'hello'::text, now(), array[1]").fetchone()
+    assert conn._loaders_cache is not None
+
+    w = weakref.ref(conn)
+    conn.close()
+    del conn
+    assert w() is None
+
+
+@pytest.mark.parametrize("fmt_out", pq.Format)
+def test_loaders_cache_params(conn, fmt_out):
+    binary = fmt_out == pq.Format.BINARY
+    query = "select '2000-01-01 00:00Z'::timestamptz"
+    conn.execute("set timezone to 'Europe/Rome'")
+    (got,) = conn.execute(query, binary=binary).fetchone()
+    assert got.utcoffset() == dt.timedelta(hours=1)
+
+    conn.execute("set timezone to 'America/New_York'")
+    (got,) = conn.execute(query, binary=binary).fetchone()
+    assert got.utcoffset() == dt.timedelta(hours=-5)
+
+
+@pytest.mark.parametrize("fmt_out", pq.Format)
+def test_loaders_cache_record(conn, fmt_out):
+    # Text records are loaded as strings.
+    binary = fmt_out == pq.Format.BINARY
+    one, two = (1, 2) if binary else ("1", "2")
+    cur = conn.execute("select row(1, 'a'::text)", binary=binary)
+    assert cur.fetchone()[0] == (one, "a")
+    cur = conn.execute("select row('b'::text, 2)", binary=binary)
+    assert cur.fetchone()[0] == ("b", two)
+    cur = conn.execute("select array[row(1, 'a'::text)]", binary=binary)
+    assert cur.fetchone()[0] == [(one, "a")]
+    cur = conn.execute("select array[row('b'::text, 2)]", binary=binary)
+    assert cur.fetchone()[0] == [("b", two)]
+
+
 @pytest.mark.parametrize(
     "sql, obj",
     [("'{hello}'::text[]", ["helloc"]), ("row('hello'::text)", ("helloc",))],
@@ -13,6 +13,7 @@ from psycopg.types import TypeInfo
 
 from .utils import gc_collect, gc_count
 from .test_cursor import my_row_factory
+from .test_cursor import batch_pipeline  # noqa: F401
 from .fix_crdb import is_crdb, crdb_encoding, crdb_time_precision
 
 
@@ -244,6 +245,21 @@ def test_execute_binary(conn):
         cur.execute("select %s, %s", [1, None], binary=True)
 
 
+def test_execute_batch(conn, batch_pipeline):  # noqa: F811
+    cur = conn.cursor()
+    cur.execute_batch([("select %s::int", [1]), ("select %s", ["a"])])
+    assert cur.fetchone() == (1,)
+    assert cur.nextset()
+    assert cur.fetchone() == ("a",)
+    assert not conn._prepared._names
+
+
+def test_execute_batch_binary(conn, batch_pipeline):  # noqa: F811
+    cur = conn.cursor()
+    with pytest.raises(psycopg.NotSupportedError):
+        cur.execute_batch([("select %s", [1])], binary=True)
+
+
 def test_binary_cursor_text_override(conn):
     cur = conn.cursor(binary=True)
     cur.execute("select %s, %s", [1, None], binary=False)
@@ -1,3 +1,7 @@
+import bz2
+import gzip
+import mmap
+import zlib
 import string
 import struct
 import hashlib
@@ -70,6 +74,120 @@ def test_copy_out_read(conn, format):
     assert conn.info.transaction_status == conn.TransactionStatus.INTRANS
 
 
+@pytest.mark.parametrize("format", Format)
+@pytest.mark.parametrize("target", ["path", "str", "fd", "file"])
+def test_read_into(conn, format, target, tmp_path):
+    want = sample_text if format == pq.Format.TEXT else sample_binary
+    path = tmp_path / "copy.dat"
+
+    cur = conn.cursor()
+    with cur.copy(f"copy ({sample_values}) to stdout (format {format.name})") as copy:
+        if target == "path":
+            nbytes = copy.read_into(path)
+        elif target == "str":
+            nbytes = copy.read_into(str(path))
+        elif target == "fd":
+            with path.open("wb") as f:
+                nbytes = copy.read_into(f.fileno())
+        else:
+            with path.open("wb") as f:
+                nbytes = copy.read_into(f)
+
+        assert copy.read() == b""
+        assert copy.read_into(tmp_path / "empty.dat") == 0
+
+    assert nbytes == len(want)
+    assert path.read_bytes() == want
+    assert cur.rowcount == len(sample_records)
+    assert conn.info.transaction_status == conn.TransactionStatus.INTRANS
+
+
+@pytest.mark.parametrize("target", ["path", "file"])
+def test_read_into_big(conn, target, tmp_path):
+    query = "copy (select i, repeat('x', i % 1000) from generate_series(1, 20000) i)"
+    cur = conn.cursor()
+    with cur.copy(f"{query} to stdout") as copy:
+        want = b"".join(copy)
+
+    path = tmp_path / "copy.dat"
+    with cur.copy(f"{query} to stdout") as copy:
+        if target == "path":
+            nbytes = copy.read_into(path)
+        else:
+            with path.open("wb") as f:
+                nbytes = copy.read_into(f)
+
+    assert nbytes == len(want)
+    assert path.read_bytes() == want
+    assert cur.rowcount == 20000
+
+
+@pytest.mark.parametrize("compress", ["gzip", "zlib", "bz2"])
+def test_read_into_compress(conn, compress, tmp_path):
+    query = "copy (select i, repeat('x', i % 1000) from generate_series(1, 20000) i)"
+    cur = conn.cursor()
+    with cur.copy(f"{query} to stdout") as copy:
+        want = b"".join(copy)
+
+    path = tmp_path / "copy.dat"
+    with cur.copy(f"{query} to stdout") as copy:
+        if compress == "gzip":
+            nbytes = copy.read_into(path, compress="gzip")
+        elif compress == "zlib":
+            nbytes = copy.read_into(path, compress=zlib.compressobj())
+        else:
+            nbytes = copy.read_into(path, compress=bz2.BZ2Compressor())
+
+    assert nbytes == len(want)
+    data = path.read_bytes()
+    if compress == "gzip":
+        assert gzip.decompress(data) == want
+    elif compress == "zlib":
+        assert zlib.decompress(data) == want
+    else:
+        assert bz2.decompress(data) == want
+
+
+def test_read_into_bad_compress(conn, tmp_path):
+    cur = conn.cursor()
+    with cur.copy(f"copy ({sample_values}) to stdout") as copy:
+        with pytest.raises(ValueError):
+            copy.read_into(tmp_path / "copy.dat", compress="wat")
+
+    assert not (tmp_path / "copy.dat").exists()
+
+
+def test_read_into_pg_error(conn, tmp_path):
+    cur = conn.cursor()
+    with pytest.raises(e.DivisionByZero):
+        with cur.copy(
+            "copy (select 1 / (100000 - i) from generate_series(1, 200000) i)"
+            " to stdout"
+        ) as copy:
+            copy.read_into(tmp_path / "copy.dat", compress="gzip")
+
+    assert conn.info.transaction_status == conn.TransactionStatus.INERROR
+
+
+def test_read_into_compress_error(conn, tmp_path):
+    class BadCompressor:
+        def compress(self, data):
+            1 / 0
+
+        def flush(self):
+            return b""
+
+    cur = conn.cursor()
+    with pytest.raises(ZeroDivisionError):
+        with cur.copy(
+            "copy (select repeat('x', 1000) from generate_series(1, 10000))"
+            " to stdout"
+        ) as copy:
+            copy.read_into(tmp_path / "copy.dat", compress=BadCompressor())
+
+    assert conn.info.transaction_status == conn.TransactionStatus.INERROR
+
+
 @pytest.mark.parametrize("format", Format)
 @pytest.mark.parametrize("row_factory", ["tuple_row", "dict_row", "namedtuple_row"])
 def test_copy_out_iter(conn, format, row_factory):
@@ -136,6 +254,64 @@ def test_rows(conn, format):
     assert conn.info.transaction_status == conn.TransactionStatus.INTRANS
 
 
+@pytest.mark.parametrize("format", Format)
+@pytest.mark.parametrize("n", [1, 2, 3, 10])
+def test_read_rows_batch(conn, format, n):
+    cur = conn.cursor()
+    with cur.copy(f"copy ({sample_values}) to stdout (format {format.name})") as copy:
+        copy.set_types(["int4", "int4", "text"])
+        rows = copy.read_rows(n)
+        if n < len(sample_records):
+            rows += copy.read_rows(n)
+        assert copy.read_rows(n) == []
+        assert copy.read_rows(n) == []
+
+    assert rows == sample_records
+    assert cur.rowcount == len(sample_records)
+    assert conn.info.transaction_status == conn.TransactionStatus.INTRANS
+
+
+@pytest.mark.parametrize("format", Format)
+def test_read_rows_empty(conn, format):
+    cur = conn.cursor()
+    with cur.copy(
+        f"copy (select 1 where false) to stdout (format {format.name})"
+    ) as copy:
+        assert copy.read_rows(10) == []
+
+    assert cur.rowcount == 0
+    assert conn.info.transaction_status == conn.TransactionStatus.INTRANS
+
+
+def test_read_rows_bad_n(conn):
+    cur = conn.cursor()
+    with cur.copy(f"copy ({sample_values}) to stdout") as copy:
+        with pytest.raises(ValueError):
+            copy.read_rows(0)
+        assert len(copy.read_rows(10)) == len(sample_records)
+
+
+@pytest.mark.parametrize("format", Format)
+@pytest.mark.parametrize("batch", [1, 100, 1000])
+def test_rows_batch(conn, format, batch):
+    query = (
+        "copy (select i, repeat('x', i % 10), '{1,2}'::int[]"
+        f" from generate_series(1, 1000) i) to stdout (format {format.name})"
+    )
+    cur = conn.cursor()
+    with cur.copy(query) as copy:
+        copy.set_types(["int4", "text", "int4[]"])
+        want = list(copy.rows())
+
+    with cur.copy(query) as copy:
+        copy.set_types(["int4", "text", "int4[]"])
+        rows = list(copy.rows(batch=batch))
+
+    assert rows == want
+    assert len(rows) == 1000
+    assert conn.info.transaction_status == conn.TransactionStatus.INTRANS
+
+
 def test_set_custom_type(conn, hstore):
     command = """copy (select '"a"=>"1", "b"=>"2"'::hstore) to stdout"""
     cur = conn.cursor()
@@ -315,6 +491,99 @@ def test_copy_big_size_block(conn, pytype):
     assert cur.fetchone()[0] == data
 
 
+@pytest.mark.parametrize(
+    "format, buffer",
+    [(Format.TEXT, "sample_text"), (Format.BINARY, "sample_binary")],
+)
+@pytest.mark.parametrize("source", ["path", "str", "file", "bytesio"])
+def test_copy_in_file(conn, format, buffer, source, tmp_path):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    path = tmp_path / "copy.dat"
+    path.write_bytes(globals()[buffer])
+
+    with cur.copy(f"copy copy_in from stdin (format {format.name})") as copy:
+        if source == "path":
+            copy.write_file(path)
+        elif source == "str":
+            copy.write_file(str(path))
+        elif source == "file":
+            with path.open("rb") as f:
+                copy.write_file(f)
+                assert f.read() == b""
+        else:
+            copy.write_file(BytesIO(globals()[buffer]))
+
+    data = cur.execute("select * from copy_in order by 1").fetchall()
+    assert data == sample_records
+
+
+@pytest.mark.parametrize("mapped", [True, False])
+def test_copy_in_file_position(conn, mapped, tmp_path):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    header = b"col1\tcol2\tdata\n"
+    path = tmp_path / "copy.dat"
+    path.write_bytes(header + sample_text)
+
+    with cur.copy("copy copy_in from stdin") as copy:
+        with path.open("rb") as f:
+            f.readline()
+            copy.write_file(f if mapped else BytesIO(f.read()))
+
+    data = cur.execute("select * from copy_in order by 1").fetchall()
+    assert data == sample_records
+
+
+def test_copy_in_file_empty(conn, tmp_path):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    path = tmp_path / "copy.dat"
+    path.write_bytes(b"")
+    with cur.copy("copy copy_in from stdin") as copy:
+        copy.write_file(path)
+
+    assert cur.rowcount == 0
+
+
+@pytest.mark.parametrize("writer", [LibpqWriter, QueuedLibpqDriver])
+def test_copy_in_file_writer(conn, writer, tmp_path):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    path = tmp_path / "copy.dat"
+    nrows = 50_000
+    with path.open("wb") as f:
+        for i in range(nrows):
+            f.write(b"%d\t%d\thello\n" % (i, i))
+
+    with cur.copy("copy copy_in from stdin", writer=writer(cur)) as copy:
+        copy.write_file(path)
+
+    assert cur.rowcount == nrows
+    cur.execute("select count(*), sum(col2) from copy_in")
+    assert cur.fetchone() == (nrows, sum(range(nrows)))
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("method", ["write_file", "write_mmap"])
+def test_copy_big_size_file(conn, method, tmp_path):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    data = "".join(choice(string.ascii_letters) for i in range(10 * 1024 * 1024))
+    path = tmp_path / "copy.dat"
+    path.write_bytes(data.encode() + b"\n")
+
+    with cur.copy("copy copy_in (data) from stdin") as copy:
+        if method == "write_file":
+            copy.write_file(path)
+        else:
+            with path.open("rb") as f:
+                copy.write(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    cur.execute("select data from copy_in limit 1")
+    assert cur.fetchone()[0] == data
+
+
 @pytest.mark.parametrize("format", Format)
 def test_subclass_adapter(conn, format):
     if format == Format.TEXT:
@@ -512,6 +781,84 @@ def test_file_writer(conn, format, buffer):
     assert got == want
 
 
+@pytest.mark.parametrize("format", Format)
+def test_pipe(conn, conn_cls, dsn, format):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with conn_cls.connect(dsn) as src_conn:
+        nrecs = psycopg.copy.pipe(
+            src_conn.cursor(),
+            "copy (select i, i * 2, 'hello ' || i from generate_series(1, %s) i)"
+            f" to stdout (format {format.name})",
+            cur,
+            f"copy copy_in from stdin (format {format.name})",
+            src_params=[10000],
+        )
+
+    assert nrecs == 10000
+    cur.execute("select count(*), sum(col2), max(data) from copy_in")
+    assert cur.fetchone() == (10000, 10000 * 10001, "hello 9999")
+
+
+def test_pipe_composed(conn, conn_cls, dsn):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with conn_cls.connect(dsn) as src_conn:
+        nrecs = psycopg.copy.pipe(
+            src_conn.cursor(),
+            f"copy ({sample_values}) to stdout",
+            cur,
+            sql.SQL("copy {} from stdin").format(sql.Identifier("copy_in")),
+        )
+
+    assert nrecs == len(sample_records)
+    assert cur.execute("select * from copy_in order by 1").fetchall() == sample_records
+
+
+def test_pipe_same_connection(conn):
+    with pytest.raises(e.ProgrammingError):
+        psycopg.copy.pipe(
+            conn.cursor(),
+            f"copy ({sample_values}) to stdout",
+            conn.cursor(),
+            "copy copy_in from stdin",
+        )
+
+
+def test_pipe_src_error(conn, conn_cls, dsn):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    with conn_cls.connect(dsn) as src_conn:
+        with pytest.raises(e.QueryCanceled) as exc:
+            psycopg.copy.pipe(
+                src_conn.cursor(),
+                "copy (select i, 1 / (50000 - i), 'x'"
+                " from generate_series(1, 100000) i) to stdout",
+                cur,
+                "copy copy_in from stdin",
+            )
+
+        assert "DivisionByZero" in str(exc.value)
+        assert src_conn.info.transaction_status == conn.TransactionStatus.INERROR
+
+    assert conn.info.transaction_status == conn.TransactionStatus.INERROR
+
+
+def test_pipe_dst_error(conn, conn_cls, dsn):
+    cur = conn.cursor()
+    ensure_table(cur, "col1 int primary key, col2 int check (col2 < 5000), data text")
+    with conn_cls.connect(dsn) as src_conn:
+        with pytest.raises(e.CheckViolation):
+            psycopg.copy.pipe(
+                src_conn.cursor(),
+                "copy (select i, i, 'x' from generate_series(1, 10000) i)" " to stdout",
+                cur,
+                "copy copy_in from stdin",
+            )
+
+    assert conn.info.transaction_status == conn.TransactionStatus.INERROR
+
+
 @pytest.mark.slow
 def test_copy_from_to(conn):
     # Roundtrip from file to database to file blockwise
@@ -669,6 +1016,36 @@ def test_worker_error_propagated(conn, monkeypatch):
             copy.write("a,b")
 
 
+@pytest.mark.parametrize("method", ["clear", "overwrite"])
+def test_worker_reuse_buffer(conn, method):
+    cur = conn.cursor()
+    ensure_table(cur, sample_tabledef)
+    nbatches = 5
+    nrows = 20_000  # more than MAX_BUFFER_SIZE per batch
+    batches = [
+        b"".join(
+            b"%06d\t%06d\thello\n" % (j, j) for j in range(i * nrows, (i + 1) * nrows)
+        )
+        for i in range(nbatches)
+    ]
+    assert len(batches[0]) > psycopg.copy.MAX_BUFFER_SIZE
+    buf = bytearray()
+    with cur.copy("copy copy_in from stdin", writer=QueuedLibpqDriver(cur)) as copy:
+        for i, batch in enumerate(batches):
+            if method == "clear":
+                buf.clear()
+                buf.extend(batch)
+            elif i == 0:
+                buf.extend(batch)
+            else:
+                buf[:] = batch  # same size: changed in place
+            copy.write(buf)
+
+    cur.execute("select count(*), sum(col2) from copy_in")
+    total = nbatches * nrows
+    assert cur.fetchone() == (total, sum(range(total)))
+
+
 @pytest.mark.parametrize(
     "format, buffer", [(Format.TEXT, "sample_text"), (Format.BINARY, "sample_binary")]
 )
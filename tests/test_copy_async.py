@@ -1,3 +1,9 @@
+import bz2
+import gzip
+import time
+import asyncio
+import mmap
+import zlib
 import string
 import hashlib
 from io import BytesIO, StringIO
@@ -51,6 +57,153 @@ async def test_copy_out_read(aconn, format):
     assert aconn.info.transaction_status == aconn.TransactionStatus.INTRANS
 
 
+@pytest.mark.parametrize("format", Format)
+@pytest.mark.parametrize("target", ["path", "str", "fd", "file"])
+async def test_read_into(aconn, format, target, tmp_path):
+    want = sample_text if format == pq.Format.TEXT else sample_binary
+    path = tmp_path / "copy.dat"
+
+    cur = aconn.cursor()
+    async with cur.copy(
+        f"copy ({sample_values}) to stdout (format {format.name})"
+    ) as copy:
+        if target == "path":
+            nbytes = await copy.read_into(path)
+        elif target == "str":
+            nbytes = await copy.read_into(str(path))
+        elif target == "fd":
+            with path.open("wb") as f:
+                nbytes = await copy.read_into(f.fileno())
+        else:
+            with path.open("wb") as f:
+                nbytes = await copy.read_into(f)
+
+        assert await copy.read() == b""
+        assert await copy.read_into(tmp_path / "empty.dat") == 0
+
+    assert nbytes == len(want)
+    assert path.read_bytes() == want
+    assert cur.rowcount == len(sample_records)
+    assert aconn.info.transaction_status == aconn.TransactionStatus.INTRANS
+
+
+@pytest.mark.parametrize("target", ["path", "file"])
+async def test_read_into_big(aconn, target, tmp_path):
+    query = "copy (select i, repeat('x', i % 1000) from generate_series(1, 20000) i)"
+    cur = aconn.cursor()
+    async with cur.copy(f"{query} to stdout") as copy:
+        want = b"".join(await alist(copy))
+
+    path = tmp_path / "copy.dat"
+    async with cur.copy(f"{query} to stdout") as copy:
+        if target == "path":
+            nbytes = await copy.read_into(path)
+        else:
+            with path.open("wb") as f:
+                nbytes = await copy.read_into(f)
+
+    assert nbytes == len(want)
+    assert path.read_bytes() == want
+    assert cur.rowcount == 20000
+
+
+@pytest.mark.parametrize("compress", ["gzip", "zlib", "bz2"])
+async def test_read_into_compress(aconn, compress, tmp_path):
+    query = "copy (select i, repeat('x', i % 1000) from generate_series(1, 20000) i)"
+    cur = aconn.cursor()
+    async with cur.copy(f"{query} to stdout") as copy:
+        want = b"".join(await alist(copy))
+
+    path = tmp_path / "copy.dat"
+    async with cur.copy(f"{query} to stdout") as copy:
+        if compress == "gzip":
+            nbytes = await copy.read_into(path, compress="gzip")
+        elif compress == "zlib":
+            nbytes = await copy.read_into(path, compress=zlib.compressobj())
+        else:
+            nbytes = await copy.read_into(path, compress=bz2.BZ2Compressor())
+
+    assert nbytes == len(want)
+    data = path.read_bytes()
+    if compress == "gzip":
+        assert gzip.decompress(data) == want
+    elif compress == "zlib":
+        assert zlib.decompress(data) == want
+    else:
+        assert bz2.decompress(data) == want
+
+
+@pytest.mark.parametrize("compress", [None, "gzip"])
+async def test_read_into_no_block(aconn, compress):
+    class SlowFile(BytesIO):
+        def write(self, data):
+            time.sleep(0.2)
+            return super().write(data)
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    f = SlowFile()
+    cur = aconn.cursor()
+    t = asyncio.create_task(ticker())
+    try:
+        async with cur.copy(f"copy ({sample_values}) to stdout") as copy:
+            nbytes = await copy.read_into(f, compress=compress)
+    finally:
+        t.cancel()
+
+    assert nbytes == len(sample_text)
+    data = f.getvalue()
+    assert (gzip.decompress(data) if compress else data) == sample_text
+    # The event loop kept on running while the file was written.
+    assert ticks >= 5
+
+
+async def test_read_into_bad_compress(aconn, tmp_path):
+    cur = aconn.cursor()
+    async with cur.copy(f"copy ({sample_values}) to stdout") as copy:
+        with pytest.raises(ValueError):
+            await copy.read_into(tmp_path / "copy.dat", compress="wat")
+
+    assert not (tmp_path / "copy.dat").exists()
+
+
+async def test_read_into_pg_error(aconn, tmp_path):
+    cur = aconn.cursor()
+    with pytest.raises(e.DivisionByZero):
+        async with cur.copy(
+            "copy (select 1 / (100000 - i) from generate_series(1, 200000) i)"
+            " to stdout"
+        ) as copy:
+            await copy.read_into(tmp_path / "copy.dat", compress="gzip")
+
+    assert aconn.info.transaction_status == aconn.TransactionStatus.INERROR
+
+
+async def test_read_into_compress_error(aconn, tmp_path):
+    class BadCompressor:
+        def compress(self, data):
+            1 / 0
+
+        def flush(self):
+            return b""
+
+    cur = aconn.cursor()
+    with pytest.raises(ZeroDivisionError):
+        async with cur.copy(
+            "copy (select repeat('x', 1000) from generate_series(1, 10000))"
+            " to stdout"
+        ) as copy:
+            await copy.read_into(tmp_path / "copy.dat", compress=BadCompressor())
+
+    assert aconn.info.transaction_status == aconn.TransactionStatus.INERROR
+
+
 @pytest.mark.parametrize("format", Format)
 @pytest.mark.parametrize("row_factory", ["tuple_row", "dict_row", "namedtuple_row"])
 async def test_copy_out_iter(aconn, format, row_factory):
@@ -121,6 +274,66 @@ async def test_rows(aconn, format):
     assert aconn.info.transaction_status == aconn.TransactionStatus.INTRANS
 
 
+@pytest.mark.parametrize("format", Format)
+@pytest.mark.parametrize("n", [1, 2, 3, 10])
+async def test_read_rows_batch(aconn, format, n):
+    cur = aconn.cursor()
+    async with cur.copy(
+        f"copy ({sample_values}) to stdout (format {format.name})"
+    ) as copy:
+        copy.set_types(["int4", "int4", "text"])
+        rows = await copy.read_rows(n)
+        if n < len(sample_records):
+            rows += await copy.read_rows(n)
+        assert await copy.read_rows(n) == []
+        assert await copy.read_rows(n) == []
+
+    assert rows == sample_records
+    assert cur.rowcount == len(sample_records)
+    assert aconn.info.transaction_status == aconn.TransactionStatus.INTRANS
+
+
+@pytest.mark.parametrize("format", Format)
+async def test_read_rows_empty(aconn, format):
+    cur = aconn.cursor()
+    async with cur.copy(
+        f"copy (select 1 where false) to stdout (format {format.name})"
+    ) as copy:
+        assert await copy.read_rows(10) == []
+
+    assert cur.rowcount == 0
+    assert aconn.info.transaction_status == aconn.TransactionStatus.INTRANS
+
+
+async def test_read_rows_bad_n(aconn):
+    cur = aconn.cursor()
+    async with cur.copy(f"copy ({sample_values}) to stdout") as copy:
+        with pytest.raises(ValueError):
+            await copy.read_rows(0)
+        assert len(await copy.read_rows(10)) == len(sample_records)
+
+
+@pytest.mark.parametrize("format", Format)
+@pytest.mark.parametrize("batch", [1, 100, 1000])
+async def test_rows_batch(aconn, format, batch):
+    query = (
+        "copy (select i, repeat('x', i % 10), '{1,2}'::int[]"
+        f" from generate_series(1, 1000) i) to stdout (format {format.name})"
+    )
+    cur = aconn.cursor()
+    async with cur.copy(query) as copy:
+        copy.set_types(["int4", "text", "int4[]"])
+        want = await alist(copy.rows())
+
+    async with cur.copy(query) as copy:
+        copy.set_types(["int4", "text", "int4[]"])
+        rows = await alist(copy.rows(batch=batch))
+
+    assert rows == want
+    assert len(rows) == 1000
+    assert aconn.info.transaction_status == aconn.TransactionStatus.INTRANS
+
+
 async def test_set_custom_type(aconn, hstore):
     command = """copy (select '"a"=>"1", "b"=>"2"'::hstore) to stdout"""
     cur = aconn.cursor()
@@ -307,6 +520,101 @@ async def test_copy_big_size_block(aconn, pytype):
     assert await cur.fetchone() == (data,)
 
 
+@pytest.mark.parametrize(
+    "format, buffer",
+    [(Format.TEXT, "sample_text"), (Format.BINARY, "sample_binary")],
+)
+@pytest.mark.parametrize("source", ["path", "str", "file", "bytesio"])
+async def test_copy_in_file(aconn, format, buffer, source, tmp_path):
+    cur = aconn.cursor()
+    await ensure_table(cur, sample_tabledef)
+    path = tmp_path / "copy.dat"
+    path.write_bytes(globals()[buffer])
+
+    async with cur.copy(f"copy copy_in from stdin (format {format.name})") as copy:
+        if source == "path":
+            await copy.write_file(path)
+        elif source == "str":
+            await copy.write_file(str(path))
+        elif source == "file":
+            with path.open("rb") as f:
+                await copy.write_file(f)
+                assert f.read() == b""
+        else:
+            await copy.write_file(BytesIO(globals()[buffer]))
+
+    await cur.execute("select * from copy_in order by 1")
+    data = await cur.fetchall()
+    assert data == sample_records
+
+
+@pytest.mark.parametrize("mapped", [True, False])
+async def test_copy_in_file_position(aconn, mapped, tmp_path):
+    cur = aconn.cursor()
+    await ensure_table(cur, sample_tabledef)
+    header = b"col1\tcol2\tdata\n"
+    path = tmp_path / "copy.dat"
+    path.write_bytes(header + sample_text)
+
+    async with cur.copy("copy copy_in from stdin") as copy:
+        with path.open("rb") as f:
+            f.readline()
+            await copy.write_file(f if mapped else BytesIO(f.read()))
+
+    await cur.execute("select * from copy_in order by 1")
+    data = await cur.fetchall()
+    assert data == sample_records
+
+
+async def test_copy_in_file_empty(aconn, tmp_path):
+    cur = aconn.cursor()
+    await ensure_table(cur, sample_tabledef)
+    path = tmp_path / "copy.dat"
+    path.write_bytes(b"")
+    async with cur.copy("copy copy_in from stdin") as copy:
+        await copy.write_file(path)
+
+    assert cur.rowcount == 0
+
+
+@pytest.mark.parametrize("writer", [AsyncLibpqWriter, AsyncQueuedLibpqWriter])
+async def test_copy_in_file_writer(aconn, writer, tmp_path):
+    cur = aconn.cursor()
+    await ensure_table(cur, sample_tabledef)
+    path = tmp_path / "copy.dat"
+    nrows = 50_000
+    with path.open("wb") as f:
+        for i in range(nrows):
+            f.write(b"%d\t%d\thello\n" % (i, i))
+
+    async with cur.copy("copy copy_in from stdin", writer=writer(cur)) as copy:
+        await copy.write_file(path)
+
+    assert cur.rowcount == nrows
+    await cur.execute("select count(*), sum(col2) from copy_in")
+    assert await cur.fetchone() == (nrows, sum(range(nrows)))
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("method", ["write_file", "write_mmap"])
+async def test_copy_big_size_file(aconn, method, tmp_path):
+    cur = aconn.cursor()
+    await ensure_table(cur, sample_tabledef)
+    data = "".join(choice(string.ascii_letters) for i in range(10 * 1024 * 1024))
+    path = tmp_path / "copy.dat"
+    path.write_bytes(data.encode() + b"\n")
+
+    async with cur.copy("copy copy_in (data) from stdin") as copy:
+        if method == "write_file":
+            await copy.write_file(path)
+        else:
+            with path.open("rb") as f:
+                await copy.write(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    await cur.execute("select data from copy_in limit 1")
+    assert await cur.fetchone() == (data,)
+
+
 @pytest.mark.parametrize("format", Format)
 async def test_subclass_adapter(aconn, format):
     if format == Format.TEXT:
@@ -513,6 +821,87 @@ async def test_file_writer(aconn, format, buffer):
     assert got == want
 
 
+@pytest.mark.parametrize("format", Format)
+async def test_pipe(aconn, aconn_cls, dsn, format):
+    cur = aconn.cursor()
+    await ensure_table(cur, sample_tabledef)
+    async with await aconn_cls.connect(dsn) as src_conn:
+        nrecs = await psycopg.copy.pipe_async(
+            src_conn.cursor(),
+            "copy (select i, i * 2, 'hello ' || i from generate_series(1, %s) i)"
+            f" to stdout (format {format.name})",
+            cur,
+            f"copy copy_in from stdin (format {format.name})",
+            src_params=[10000],
+        )
+
+    assert nrecs == 10000
+    await cur.execute("select count(*), sum(col2), max(data) from copy_in")
+    assert await cur.fetchone() == (10000, 10000 * 10001, "hello 9999")
+
+
+async def test_pipe_composed(aconn, aconn_cls, dsn):
+    cur = aconn.cursor()
+    await ensure_table(cur, sample_tabledef)
+    async with await aconn_cls.connect(dsn) as src_conn:
+        nrecs = await psycopg.copy.pipe_async(
+            src_conn.cursor(),
+            f"copy ({sample_values}) to stdout",
+            cur,
+            sql.SQL("copy {} from stdin").format(sql.Identifier("copy_in")),
+        )
+
+    assert nrecs == len(sample_records)
+    await cur.execute("select * from copy_in order by 1")
+    assert await cur.fetchall() == sample_records
+
+
+async def test_pipe_same_connection(aconn):
+    with pytest.raises(e.ProgrammingError):
+        await psycopg.copy.pipe_async(
+            aconn.cursor(),
+            f"copy ({sample_values}) to stdout",
+            aconn.cursor(),
+            "copy copy_in from stdin",
+        )
+
+
+async def test_pipe_src_error(aconn, aconn_cls, dsn):
+    cur = aconn.cursor()
+    await ensure_table(cur, sample_tabledef)
+    async with await aconn_cls.connect(dsn) as src_conn:
+        with pytest.raises(e.QueryCanceled) as exc:
+            await psycopg.copy.pipe_async(
+                src_conn.cursor(),
+                "copy (select i, 1 / (50000 - i), 'x'"
+                " from generate_series(1, 100000) i) to stdout",
+                cur,
+                "copy copy_in from stdin",
+            )
+
+        assert "DivisionByZero" in str(exc.value)
+        assert src_conn.info.transaction_status == aconn.TransactionStatus.INERROR
+
+    assert aconn.info.transaction_status == aconn.TransactionStatus.INERROR
+
+
+async def test_pipe_dst_error(aconn, aconn_cls, dsn):
+    cur = aconn.cursor()
+    await ensure_table(
+        cur, "col1 int primary key, col2 int check (col2 < 5000), data text"
+    )
+    async with await aconn_cls.connect(dsn) as src_conn:
+        with pytest.raises(e.CheckViolation):
+            await psycopg.copy.pipe_async(
+                src_conn.cursor(),
+                "copy (select i, i, 'x' from generate_series(1, 10000) i)" " to stdout",
+                cur,
+                "copy copy_in from stdin",
+            )
+
+    assert aconn.info.transaction_status == aconn.TransactionStatus.INERROR
+
+
 @pytest.mark.slow
 async def test_copy_from_to(aconn):
     # Roundtrip from file to database to file blockwise
@@ -674,6 +1063,38 @@ async def test_worker_error_propagated(aconn, monkeypatch):
             await copy.write("a,b")
 
 
+@pytest.mark.parametrize("method", ["clear", "overwrite"])
+async def test_worker_reuse_buffer(aconn, method):
+    cur = aconn.cursor()
+    await ensure_table(cur, sample_tabledef)
+    nbatches = 5
+    nrows = 20_000  # more than MAX_BUFFER_SIZE per batch
+    batches = [
+        b"".join(
+            b"%06d\t%06d\thello\n" % (j, j) for j in range(i * nrows, (i + 1) * nrows)
+        )
+        for i in range(nbatches)
+    ]
+    assert len(batches[0]) > psycopg.copy.MAX_BUFFER_SIZE
+    buf = bytearray()
+    async with cur.copy(
+        "copy copy_in from stdin", writer=AsyncQueuedLibpqWriter(cur)
+    ) as copy:
+        for i, batch in enumerate(batches):
+            if method == "clear":
+                buf.clear()
+                buf.extend(batch)
+            elif i == 0:
+                buf.extend(batch)
+            else:
+                buf[:] = batch  # same size: changed in place
+            await copy.write(buf)
+
+    await cur.execute("select count(*), sum(col2) from copy_in")
+    total = nbatches * nrows
+    assert await cur.fetchone() == (total, sum(range(total)))
+
+
 @pytest.mark.parametrize(
     "format, buffer", [(Format.TEXT, "sample_text"), (Format.BINARY, "sample_binary")]
 )
@@ -1,6 +1,7 @@
 import pickle
 import weakref
 import datetime as dt
+from array import array
 from typing import List, Union
 from contextlib import closing
 
@@ -209,6 +210,83 @@ def test_fetchone(conn):
     assert row is None
 
 
+@pytest.mark.parametrize("fmt_out", pq.Format)
+def test_fetch_columns(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out)
+    cur.execute(
+        """
+        select x::int2, x::int4, x::int8, (x / 2.0)::float4, (x / 4.0)::float8,
+            x % 2 = 0, x::text, nullif(x, 2)
+        from generate_series(1, 3) x
+        """
+    )
+    cols = cur.fetch_columns()
+    assert len(cols) == 8
+    for col, typecode in zip(cols, "hiqfdb"):
+        assert isinstance(col, array)
+        assert col.typecode == typecode
+    assert list(cols[0]) == list(cols[1]) == list(cols[2]) == [1, 2, 3]
+    assert list(cols[3]) == [0.5, 1.0, 1.5]
+    assert list(cols[4]) == [0.25, 0.5, 0.75]
+    assert list(cols[5]) == [0, 1, 0]
+    assert cols[6] == ["1", "2", "3"]
+    assert isinstance(cols[7], psycopg.ColumnArray)
+    assert cols[7].typecode == "i"
+    assert list(cols[7]) == [1, 0, 3]
+    assert cols[7].mask == array("b", [0, 1, 0])
+    for col in cols[:6]:
+        assert isinstance(col, psycopg.ColumnArray)
+        assert col.mask is None
+
+    cols = cur.fetch_columns()
+    assert cols == [array(tc) for tc in "hiqfdb"] + [[], array("i")]
+    assert isinstance(cols[7], psycopg.ColumnArray)
+    assert cols[7].mask is None
+
+
+def test_fetchmany_columns(conn):
+    cur = conn.cursor()
+    cur.execute("select x, x::text from generate_series(1, 5) x")
+    assert cur.fetchone() == (1, "1")
+    cols = cur.fetchmany_columns(3)
+    assert cols == [array("i", [2, 3, 4]), ["2", "3", "4"]]
+    assert cur.rownumber == 4
+    cols = cur.fetchmany_columns(3)
+    assert cols == [array("i", [5]), ["5"]]
+    cols = cur.fetchmany_columns(3)
+    assert cols == [array("i"), []]
+
+
+@pytest.mark.parametrize("fmt_out", pq.Format)
+def test_fetchmany_columns_nulls(conn, fmt_out):
+    cur = conn.cursor(binary=fmt_out)
+    cur.execute("select nullif(x, 5) from generate_series(1, 6) x")
+    cols = cur.fetchmany_columns(3)
+    assert cols == [array("i", [1, 2, 3])]
+    assert isinstance(cols[0], psycopg.ColumnArray)
+    assert cols[0].mask is None
+    cols = cur.fetchmany_columns(3)
+    assert cols == [array("i", [4, 0, 6])]
+    assert isinstance(cols[0], psycopg.ColumnArray)
+    assert cols[0].mask == array("b", [0, 1, 0])
+
+
+def test_fetch_columns_custom_loader(conn):
+    conn.adapters.register_loader("int4", psycopg.types.string.TextLoader)
+    cur = conn.cursor()
+    cur.execute("select 1, 2::int8")
+    assert cur.fetch_columns() == [["1"], array("q", [2])]
+
+
+def test_fetch_columns_no_result(conn):
+    cur = conn.cursor()
+    with pytest.raises(psycopg.ProgrammingError):
+        cur.fetch_columns()
+    cur.execute("create temp table test_fetch_columns (id int)")
+    with pytest.raises(psycopg.ProgrammingError):
+        cur.fetch_columns()
+
+
 def test_binary_cursor_execute(conn):
     cur = conn.cursor(binary=True)
     cur.execute("select %s, %s", [1, None])
@@ -386,6 +464,399 @@ def test_executemany_null_first(conn, fmt_in):
         )
 
 
+def test_executemany_unnest(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)",
+        [(10, "hello"), (100000, None), (None, "world")],
+        strategy="unnest",
+    )
+    assert b"unnest" in cur._query.query
+    assert cur.rowcount == 3
+    cur.execute("select num, data from execmany order by id")
+    assert cur.fetchall() == [(10, "hello"), (100000, None), (None, "world")]
+
+
+def test_executemany_unnest_name(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into execmany(num, data) values (%(num)s, %(data)s || %(data)s)",
+        ({"num": i, "data": str(i)} for i in range(3)),
+        strategy="unnest",
+    )
+    assert b"unnest" in cur._query.query
+    cur.execute("select num, data from execmany order by id")
+    assert cur.fetchall() == [(0, "00"), (1, "11"), (2, "22")]
+
+
+def test_executemany_unnest_update(conn, execmany):
+    cur = conn.cursor()
+    cur.execute("insert into execmany (num) select generate_series(1, 5)")
+    cur.executemany(
+        "update execmany set data = %s where num = %s",
+        [("a", 1), ("b", 3), ("c", 10)],
+        strategy="unnest",
+    )
+    assert b"unnest" in cur._query.query
+    assert cur.rowcount == 2
+    cur.executemany(
+        "delete from execmany where num = %s", [(2,), (3,)], strategy="unnest"
+    )
+    assert b"unnest" in cur._query.query
+    assert cur.rowcount == 2
+    cur.execute("select num, data from execmany order by num")
+    assert cur.fetchall() == [(1, "a"), (4, None), (5, None)]
+
+
+@pytest.mark.parametrize(
+    "query, params, rowcount",
+    [
+        ("insert into execmany(num, data) values (%s, %s), (1, 'x')", [(1, "a")], 2),
+        ("insert into execmany(num, data) select %s, %s", [(1, "a")], 1),
+        # the unnest strategy only takes values of the exact type
+        ("insert into execmany(num, data) values (%s, %s)", [(1, "a"), ("2", 3)], 2),
+    ],
+)
+def test_executemany_unnest_fallback(conn, execmany, query, params, rowcount):
+    cur = conn.cursor()
+    cur.executemany(query, params, strategy="unnest")
+    assert b"unnest" not in cur._query.query
+    assert cur.rowcount == rowcount
+
+
+def test_executemany_unnest_upsert(conn, execmany):
+    # ON CONFLICT DO UPDATE would fail if two records hit the same row
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into execmany(id, num) values (%s, %s)"
+        " on conflict (id) do update set num = excluded.num",
+        [(1, 10), (1, 20)],
+        strategy="unnest",
+    )
+    assert b"unnest" not in cur._query.query
+    assert cur.rowcount == 2
+    cur.execute("select id, num from execmany")
+    assert cur.fetchall() == [(1, 20)]
+
+
+def test_executemany_unnest_returning(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into execmany(num, data) values (%s, %s) returning num",
+        [(10, "hello"), (20, "world")],
+        returning=True,
+        strategy="unnest",
+    )
+    assert cur.fetchone() == (10,)
+    assert cur.nextset()
+    assert cur.fetchone() == (20,)
+
+
+def test_executemany_unnest_no_data(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)", [], strategy="unnest"
+    )
+    assert cur.rowcount == 0
+
+
+def test_executemany_unnest_error(conn, execmany):
+    cur = conn.cursor()
+    with pytest.raises(psycopg.errors.UndefinedTable):
+        cur.executemany(
+            "insert into nosuchtable values (%s, %s)",
+            [(10, "hello")],
+            strategy="unnest",
+        )
+
+
+def test_executemany_copy(conn, execmany):
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)",
+        [(10, "hello"), (100000, None), (None, "world")],
+        strategy="copy",
+    )
+    assert cur._query.query.startswith(b"COPY")
+    assert cur.rowcount == 3
+    cur.execute("select num, data from execmany order by id")
+    assert cur.fetchall() == [(10, "hello"), (100000, None), (None, "world")]
+
+
+@pytest.mark.parametrize("strategy", ["unnest", "copy"])
+def test_executemany_batch_size(conn, execmany, strategy):
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)",
+        [(i, str(i)) for i in range(10)],
+        strategy=strategy,
+        batch_size=3,
+    )
+    assert cur.rowcount == 10
+    cur.execute("select num, data from execmany order by id")
+    assert cur.fetchall() == [(i, str(i)) for i in range(10)]
+
+
+@pytest.mark.parametrize("strategy", ["unnest", "copy"])
+def test_executemany_batch_fallback(conn, execmany, strategy):
+    cur = conn.cursor()
+    # The third batch can't be dumped: the records left are inserted normally.
+    cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)",
+        [(1, "a"), (2, "b"), (3, "c"), (4, "d"), ("5", "e"), (6, "f")],
+        strategy=strategy,
+        batch_size=2,
+    )
+    assert cur.rowcount == 6
+    cur.execute("select num, data from execmany order by id")
+    assert cur.fetchall() == [
+        (1, "a"),
+        (2, "b"),
+        (3, "c"),
+        (4, "d"),
+        (5, "e"),
+        (6, "f"),
+    ]
+
+
+@pytest.mark.parametrize("target", ["view", "rule"])
+def test_executemany_copy_target_fallback(conn, execmany, target):
+    # COPY can't load views and doesn't apply rules: insert the records normally
+    cur = conn.cursor()
+    cur.execute("create temp table execmany_log (num int)")
+    if target == "view":
+        cur.execute(
+            "create temp view execmany_target as select num, data from execmany"
+        )
+    else:
+        cur.execute("create temp table execmany_target (num int, data text)")
+        cur.execute(
+            "create rule execmany_log as on insert to execmany_target"
+            " do also insert into execmany_log values (new.num)"
+        )
+    cur.executemany(
+        "insert into execmany_target (num, data) values (%s, %s)",
+        [(1, "a"), (2, "b")],
+        strategy="copy",
+    )
+    assert not cur._query.query.startswith(b"COPY")
+    cur.execute("select num, data from execmany_target order by num")
+    assert cur.fetchall() == [(1, "a"), (2, "b")]
+    if target == "rule":
+        cur.execute("select num from execmany_log order by num")
+        assert cur.fetchall() == [(1,), (2,)]
+
+
+def test_executemany_copy_default_batch(conn, execmany, monkeypatch):
+    monkeypatch.setattr(psycopg.cursor, "COPY_BATCH_SIZE", 2)
+    cur = conn.cursor()
+    cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)",
+        [(1, "a"), (2, "b"), ("3", "c"), (4, "d"), (5, "e")],
+        strategy="copy",
+    )
+    # The second batch can't be dumped: the records left are inserted normally.
+    assert not cur._query.query.startswith(b"COPY")
+    assert cur.rowcount == 5
+    cur.execute("select num, data from execmany order by id")
+    assert cur.fetchall() == [(1, "a"), (2, "b"), (3, "c"), (4, "d"), (5, "e")]
+
+
+@pytest.mark.parametrize(
+    "query, params, rowcount",
+    [
+        ("insert into execmany values (default, %s, %s)", [(1, "a")], 1),
+        ("insert into execmany(num, data) values (%s, %s || 'x')", [(1, "a")], 1),
+        (
+            "insert into execmany(num, data) values (%s, %s) on conflict do nothing",
+            [(1, "a")],
+            1,
+        ),
+        ("insert into execmany(num, data) values (%s, %s)", [(1, "a"), ("2", 3)], 2),
+    ],
+)
+def test_executemany_copy_fallback(conn, execmany, query, params, rowcount):
+    cur = conn.cursor()
+    cur.executemany(query, params, strategy="copy")
+    assert not cur._query.query.startswith(b"COPY")
+    assert cur.rowcount == rowcount
+
+
+def test_executemany_copy_error(conn, execmany):
+    cur = conn.cursor()
+    with pytest.raises(psycopg.errors.NotNullViolation):
+        cur.executemany(
+            "insert into execmany(id, num) values (%s, %s)",
+            [(1, 10), (None, 20)],
+            strategy="copy",
+        )
+
+
+def test_executemany_bad_batch_size(conn, execmany):
+    cur = conn.cursor()
+    with pytest.raises(ValueError):
+        cur.executemany(
+            "insert into execmany(num) values (%s)",
+            [(10,)],
+            strategy="copy",
+            batch_size=0,
+        )
+
+
+def test_executemany_bad_strategy(conn, execmany):
+    cur = conn.cursor()
+    with pytest.raises(ValueError):
+        cur.executemany(
+            "insert into execmany(num) values (%s)", [(10,)], strategy="wat"
+        )
+
+
+@pytest.fixture(params=[True, False], ids=["pipeline=on", "pipeline=off"])
+def batch_pipeline(request, monkeypatch):
+    if request.param:
+        if not psycopg.Pipeline.is_supported():
+            pytest.skip(psycopg.Pipeline._not_supported_reason())
+    else:
+        monkeypatch.setattr(psycopg._pipeline.BasePipeline, "_is_supported", False)
+
+
+def test_execute_batch(conn, execmany, batch_pipeline):
+    cur = conn.cursor()
+    rv = cur.execute_batch(
+        [
+            ("insert into execmany (num, data) values (%s, %s)", (10, "hello")),
+            ("select %s::int, %s::text", (1, "a")),
+            ("update execmany set num = num + 1", None),
+            ("select num, data from execmany", None),
+        ]
+    )
+    assert rv is cur
+    assert cur.statusmessage == "INSERT 0 1"
+    assert cur.nextset()
+    assert cur.fetchall() == [(1, "a")]
+    assert cur.nextset()
+    assert cur.rowcount == 1
+    assert cur.statusmessage == "UPDATE 1"
+    assert cur.nextset()
+    assert cur.fetchall() == [(11, "hello")]
+    assert not cur.nextset()
+
+
+def test_execute_batch_empty(conn, batch_pipeline):
+    cur = conn.cursor()
+    cur.execute_batch([])
+    assert cur.pgresult is None
+
+
+def test_execute_batch_binary(conn, batch_pipeline):
+    cur = conn.cursor()
+    cur.execute_batch([("select %s::int", (1,)), ("select 2", None)], binary=True)
+    assert cur.pgresult.fformat(0) == pq.Format.BINARY
+    assert cur.fetchall() == [(1,)]
+    assert cur.nextset()
+    assert cur.fetchall() == [(2,)]
+
+
+def test_execute_batch_fail_fast(conn, execmany, batch_pipeline):
+    conn.autocommit = True
+    cur = conn.cursor()
+    with pytest.raises(psycopg.errors.UniqueViolation):
+        cur.execute_batch(
+            [
+                ("insert into execmany (id, num) values (%s, %s)", (1, 10)),
+                ("insert into execmany (id, num) values (%s, %s)", (1, 20)),
+                ("insert into execmany (id, num) values (%s, %s)", (2, 30)),
+            ]
+        )
+    assert cur.statusmessage == "INSERT 0 1"
+    assert not cur.nextset()
+
+    # The statements are executed in the same transaction
+    cur.execute("select count(*) from execmany")
+    assert cur.fetchone() == (0,)
+
+
+def test_execute_batch_adapt_error(conn, execmany, batch_pipeline):
+    conn.autocommit = True
+    cur = conn.cursor()
+    with pytest.raises(psycopg.ProgrammingError):
+        cur.execute_batch(
+            [
+                ("insert into execmany (num) values (%s)", (10,)),
+                ("select %s", (object(),)),
+            ]
+        )
+    assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+    cur.execute("select count(*) from execmany")
+    assert cur.fetchone() == (0,)
+
+
+def test_execute_batch_collect_errors(conn, execmany, batch_pipeline):
+    conn.autocommit = True
+    cur = conn.cursor()
+    cur.execute_batch(
+        [
+            ("insert into execmany (id, num) values (%s, %s)", (1, 10)),
+            ("insert into execmany (id, num) values (%s, %s)", (1, 20)),
+            ("select num from execmany where id = %s", (1,)),
+        ],
+        fail_fast=False,
+    )
+    assert cur.statusmessage == "INSERT 0 1"
+    assert cur.nextset()
+    assert cur.pgresult.status == pq.ExecStatus.FATAL_ERROR
+    with pytest.raises(psycopg.errors.UniqueViolation):
+        cur.fetchone()
+    assert cur.nextset()
+    assert cur.fetchall() == [(10,)]
+
+
+def test_execute_batch_comments(conn, batch_pipeline):
+    cur = conn.cursor()
+    cur.execute_batch([("select 1 -- one", None), ("select 2 -- two", None)])
+    assert cur.fetchall() == [(1,)]
+    assert cur.nextset()
+    assert cur.fetchall() == [(2,)]
+    assert not cur.nextset()
+
+
+def test_execute_batch_server_binding(conn, batch_pipeline):
+    cur = conn.cursor()
+    cur.execute_batch(
+        [("select %s, %s", (1, "a")), ("select %b", (b"\x00",)), ("select 1", None)]
+    )
+    assert cur.fetchall() == [(1, "a")]
+    assert cur.nextset()
+    assert cur.fetchall() == [(b"\x00",)]
+    assert cur.pgresult.ftype(0) == builtins["bytea"].oid
+    assert type(cur._query) is psycopg._queries.PostgresQuery
+
+
+def test_execute_batch_in_pipeline(conn, execmany):
+    if not psycopg.Pipeline.is_supported():
+        pytest.skip(psycopg.Pipeline._not_supported_reason())
+
+    cur = conn.cursor()
+    with conn.pipeline():
+        cur1 = conn.execute("select 1")
+        cur.execute_batch([("select 2", None), ("select 3", None)])
+        assert cur1.fetchone() == (1,)
+        assert cur.fetchone() == (2,)
+        assert cur.nextset()
+        assert cur.fetchone() == (3,)
+
+
+def test_execute_batch_prepared(conn, batch_pipeline):
+    conn.prepare_threshold = 0
+    cur = conn.cursor()
+    for i in range(2):
+        cur.execute_batch([("select %s::int", (i,)), ("select %s::text", ("a",))])
+        assert cur.fetchone() == (i,)
+
+    if psycopg.Pipeline.is_supported():
+        assert len(conn._prepared._names) == 2
+
+
 def test_rowcount(conn):
     cur = conn.cursor()
 
@@ -623,6 +1094,34 @@ def test_stream_sql(conn):
     assert recs == [(1, dt.date(2021, 1, 2)), (2, dt.date(2021, 1, 3))]
 
 
+@pytest.mark.parametrize("size", [1, 2, 3, 10])
+def test_stream_chunked(conn, size):
+    cur = conn.cursor()
+    recs = list(cur.stream("select generate_series(1, %s) as a", [5], size=size))
+    assert recs == [(1,), (2,), (3,), (4,), (5,)]
+
+
+def test_stream_chunked_row_factory(conn):
+    cur = conn.cursor(row_factory=rows.dict_row)
+    recs = list(cur.stream("select generate_series(1, 3) as a", size=2))
+    assert recs == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+
+def test_stream_chunked_description(conn):
+    cur = conn.cursor(row_factory=rows.namedtuple_row)
+    for rec in cur.stream("select generate_series(1, 3) as a, 'x' as b", size=2):
+        assert cur.description is not None
+        assert [c.name for c in cur.description] == ["a", "b"]
+        assert rec.b == "x"
+
+
+@pytest.mark.parametrize("size", [0, -2])
+def test_stream_chunked_invalid_size(conn, size):
+    cur = conn.cursor()
+    with pytest.raises(ValueError, match="size must be >= 1"):
+        next(cur.stream("select 1", size=size))
+
+
 def test_stream_row_factory(conn):
     cur = conn.cursor(row_factory=rows.dict_row)
     it = iter(cur.stream("select generate_series(1,2) as a"))
@@ -1,18 +1,22 @@
 import pytest
 import weakref
 import datetime as dt
+from array import array
 from typing import List
 
 import psycopg
 from psycopg import pq, sql, rows
 from psycopg.adapt import PyFormat
+from psycopg.postgres import types as builtins
 
 from .utils import gc_collect, gc_count
 from .test_cursor import my_row_factory
 from .test_cursor import execmany, _execmany  # noqa: F401
+from .test_cursor import batch_pipeline  # noqa: F401
 from .fix_crdb import crdb_encoding
 
 execmany = execmany  # avoid F811 underneath
+batch_pipeline = batch_pipeline
 
 
 async def test_init(aconn):
@@ -209,6 +213,67 @@ async def test_fetchone(aconn):
     assert row is None
 
 
+@pytest.mark.parametrize("fmt_out", pq.Format)
+async def test_fetch_columns(aconn, fmt_out):
+    cur = aconn.cursor(binary=fmt_out)
+    await cur.execute(
+        """
+        select x::int2, x::int4, x::int8, (x / 2.0)::float4, (x / 4.0)::float8,
+            x % 2 = 0, x::text, nullif(x, 2)
+        from generate_series(1, 3) x
+        """
+    )
+    cols = await cur.fetch_columns()
+    assert len(cols) == 8
+    for col, typecode in zip(cols, "hiqfdb"):
+        assert isinstance(col, array)
+        assert col.typecode == typecode
+    assert list(cols[0]) == list(cols[1]) == list(cols[2]) == [1, 2, 3]
+    assert list(cols[3]) == [0.5, 1.0, 1.5]
+    assert list(cols[4]) == [0.25, 0.5, 0.75]
+    assert list(cols[5]) == [0, 1, 0]
+    assert cols[6] == ["1", "2", "3"]
+    assert isinstance(cols[7], psycopg.ColumnArray)
+    assert cols[7].typecode == "i"
+    assert list(cols[7]) == [1, 0, 3]
+    assert cols[7].mask == array("b", [0, 1, 0])
+    for col in cols[:6]:
+        assert isinstance(col, psycopg.ColumnArray)
+        assert col.mask is None
+
+    cols = await cur.fetch_columns()
+    assert cols == [array(tc) for tc in "hiqfdb"] + [[], array("i")]
+    assert isinstance(cols[7], psycopg.ColumnArray)
+    assert cols[7].mask is None
+
+
+async def test_fetchmany_columns(aconn):
+    cur = aconn.cursor()
+    await cur.execute("select x, x::text from generate_series(1, 5) x")
+    assert await cur.fetchone() == (1, "1")
+    cols = await cur.fetchmany_columns(3)
+    assert cols == [array("i", [2, 3, 4]), ["2", "3", "4"]]
+    assert cur.rownumber == 4
+    cols = await cur.fetchmany_columns(3)
+    assert cols == [array("i", [5]), ["5"]]
+    cols = await cur.fetchmany_columns(3)
+    assert cols == [array("i"), []]
+
+
+@pytest.mark.parametrize("fmt_out", pq.Format)
+async def test_fetchmany_columns_nulls(aconn, fmt_out):
+    cur = aconn.cursor(binary=fmt_out)
+    await cur.execute("select nullif(x, 5) from generate_series(1, 6) x")
+    cols = await cur.fetchmany_columns(3)
+    assert cols == [array("i", [1, 2, 3])]
+    assert isinstance(cols[0], psycopg.ColumnArray)
+    assert cols[0].mask is None
+    cols = await cur.fetchmany_columns(3)
+    assert cols == [array("i", [4, 0, 6])]
+    assert isinstance(cols[0], psycopg.ColumnArray)
+    assert cols[0].mask == array("b", [0, 1, 0])
+
+
 async def test_binary_cursor_execute(aconn):
     cur = aconn.cursor(binary=True)
     await cur.execute("select %s, %s", [1, None])
@@ -374,6 +439,283 @@ async def test_executemany_null_first(aconn, fmt_in):
         )
 
 
+async def test_executemany_unnest(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)",
+        [(10, "hello"), (100000, None), (None, "world")],
+        strategy="unnest",
+    )
+    assert b"unnest" in cur._query.query
+    assert cur.rowcount == 3
+    await cur.execute("select num, data from execmany order by id")
+    assert await cur.fetchall() == [(10, "hello"), (100000, None), (None, "world")]
+
+
+async def test_executemany_unnest_update(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.execute("insert into execmany (num) select generate_series(1, 5)")
+    await cur.executemany(
+        "update execmany set data = %s where num = %s",
+        [("a", 1), ("b", 3), ("c", 10)],
+        strategy="unnest",
+    )
+    assert cur.rowcount == 2
+    await cur.execute("select num, data from execmany where data is not null")
+    assert sorted(await cur.fetchall()) == [(1, "a"), (3, "b")]
+
+
+async def test_executemany_unnest_fallback(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        "insert into execmany(num, data) select %s, %s",
+        [(1, "a"), (2, "b")],
+        strategy="unnest",
+    )
+    assert b"unnest" not in cur._query.query
+    assert cur.rowcount == 2
+
+
+async def test_executemany_copy(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)",
+        [(10, "hello"), (100000, None), (None, "world")],
+        strategy="copy",
+    )
+    assert cur._query.query.startswith(b"COPY")
+    assert cur.rowcount == 3
+    await cur.execute("select num, data from execmany order by id")
+    assert await cur.fetchall() == [(10, "hello"), (100000, None), (None, "world")]
+
+
+async def test_executemany_unnest_upsert(aconn, execmany):
+    # ON CONFLICT DO UPDATE would fail if two records hit the same row
+    cur = aconn.cursor()
+    await cur.executemany(
+        "insert into execmany(id, num) values (%s, %s)"
+        " on conflict (id) do update set num = excluded.num",
+        [(1, 10), (1, 20)],
+        strategy="unnest",
+    )
+    assert b"unnest" not in cur._query.query
+    assert cur.rowcount == 2
+    await cur.execute("select id, num from execmany")
+    assert await cur.fetchall() == [(1, 20)]
+
+
+@pytest.mark.parametrize("strategy", ["unnest", "copy"])
+async def test_executemany_batch_fallback(aconn, execmany, strategy):
+    cur = aconn.cursor()
+    await cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)",
+        [(1, "a"), (2, "b"), (3, "c"), (4, "d"), ("5", "e"), (6, "f")],
+        strategy=strategy,
+        batch_size=2,
+    )
+    assert cur.rowcount == 6
+    await cur.execute("select num, data from execmany order by id")
+    assert await cur.fetchall() == [
+        (1, "a"),
+        (2, "b"),
+        (3, "c"),
+        (4, "d"),
+        (5, "e"),
+        (6, "f"),
+    ]
+
+
+@pytest.mark.parametrize("target", ["view", "rule"])
+async def test_executemany_copy_target_fallback(aconn, execmany, target):
+    # COPY can't load views and doesn't apply rules: insert the records normally
+    cur = aconn.cursor()
+    await cur.execute("create temp table execmany_log (num int)")
+    if target == "view":
+        await cur.execute(
+            "create temp view execmany_target as select num, data from execmany"
+        )
+    else:
+        await cur.execute("create temp table execmany_target (num int, data text)")
+        await cur.execute(
+            "create rule execmany_log as on insert to execmany_target"
+            " do also insert into execmany_log values (new.num)"
+        )
+    await cur.executemany(
+        "insert into execmany_target (num, data) values (%s, %s)",
+        [(1, "a"), (2, "b")],
+        strategy="copy",
+    )
+    assert not cur._query.query.startswith(b"COPY")
+    await cur.execute("select num, data from execmany_target order by num")
+    assert await cur.fetchall() == [(1, "a"), (2, "b")]
+    if target == "rule":
+        await cur.execute("select num from execmany_log order by num")
+        assert await cur.fetchall() == [(1,), (2,)]
+
+
+async def test_executemany_copy_default_batch(aconn, execmany, monkeypatch):
+    monkeypatch.setattr(psycopg.cursor, "COPY_BATCH_SIZE", 2)
+    cur = aconn.cursor()
+    await cur.executemany(
+        "insert into execmany(num, data) values (%s, %s)",
+        [(1, "a"), (2, "b"), ("3", "c"), (4, "d"), (5, "e")],
+        strategy="copy",
+    )
+    # The second batch can't be dumped: the records left are inserted normally.
+    assert not cur._query.query.startswith(b"COPY")
+    assert cur.rowcount == 5
+    await cur.execute("select num, data from execmany order by id")
+    assert await cur.fetchall() == [(1, "a"), (2, "b"), (3, "c"), (4, "d"), (5, "e")]
+
+
+async def test_executemany_copy_fallback(aconn, execmany):
+    cur = aconn.cursor()
+    await cur.executemany(
+        "insert into execmany values (default, %s, %s)",
+        [(1, "a"), (2, "b")],
+        strategy="copy",
+    )
+    assert not cur._query.query.startswith(b"COPY")
+    assert cur.rowcount == 2
+
+
+async def test_execute_batch(aconn, execmany, batch_pipeline):
+    cur = aconn.cursor()
+    rv = await cur.execute_batch(
+        [
+            ("insert into execmany (num, data) values (%s, %s)", (10, "hello")),
+            ("select %s::int, %s::text", (1, "a")),
+            ("update execmany set num = num + 1", None),
+            ("select num, data from execmany", None),
+        ]
+    )
+    assert rv is cur
+    assert cur.statusmessage == "INSERT 0 1"
+    assert cur.nextset()
+    assert await cur.fetchall() == [(1, "a")]
+    assert cur.nextset()
+    assert cur.rowcount == 1
+    assert cur.statusmessage == "UPDATE 1"
+    assert cur.nextset()
+    assert await cur.fetchall() == [(11, "hello")]
+    assert not cur.nextset()
+
+
+async def test_execute_batch_empty(aconn, batch_pipeline):
+    cur = aconn.cursor()
+    await cur.execute_batch([])
+    assert cur.pgresult is None
+
+
+async def test_execute_batch_binary(aconn, batch_pipeline):
+    cur = aconn.cursor()
+    await cur.execute_batch([("select %s::int", (1,)), ("select 2", None)], binary=True)
+    assert cur.pgresult.fformat(0) == pq.Format.BINARY
+    assert await cur.fetchall() == [(1,)]
+    assert cur.nextset()
+    assert await cur.fetchall() == [(2,)]
+
+
+async def test_execute_batch_fail_fast(aconn, execmany, batch_pipeline):
+    await aconn.set_autocommit(True)
+    cur = aconn.cursor()
+    with pytest.raises(psycopg.errors.UniqueViolation):
+        await cur.execute_batch(
+            [
+                ("insert into execmany (id, num) values (%s, %s)", (1, 10)),
+                ("insert into execmany (id, num) values (%s, %s)", (1, 20)),
+                ("insert into execmany (id, num) values (%s, %s)", (2, 30)),
+            ]
+        )
+    assert cur.statusmessage == "INSERT 0 1"
+    assert not cur.nextset()
+
+    # The statements are executed in the same transaction
+    await cur.execute("select count(*) from execmany")
+    assert await cur.fetchone() == (0,)
+
+
+async def test_execute_batch_adapt_error(aconn, execmany, batch_pipeline):
+    await aconn.set_autocommit(True)
+    cur = aconn.cursor()
+    with pytest.raises(psycopg.ProgrammingError):
+        await cur.execute_batch(
+            [
+                ("insert into execmany (num) values (%s)", (10,)),
+                ("select %s", (object(),)),
+            ]
+        )
+    assert aconn.info.transaction_status == pq.TransactionStatus.IDLE
+    await cur.execute("select count(*) from execmany")
+    assert await cur.fetchone() == (0,)
+
+
+async def test_execute_batch_collect_errors(aconn, execmany, batch_pipeline):
+    await aconn.set_autocommit(True)
+    cur = aconn.cursor()
+    await cur.execute_batch(
+        [
+            ("insert into execmany (id, num) values (%s, %s)", (1, 10)),
+            ("insert into execmany (id, num) values (%s, %s)", (1, 20)),
+            ("select num from execmany where id = %s", (1,)),
+        ],
+        fail_fast=False,
+    )
+    assert cur.statusmessage == "INSERT 0 1"
+    assert cur.nextset()
+    assert cur.pgresult.status == pq.ExecStatus.FATAL_ERROR
+    with pytest.raises(psycopg.errors.UniqueViolation):
+        await cur.fetchone()
+    assert cur.nextset()
+    assert await cur.fetchall() == [(10,)]
+
+
+async def test_execute_batch_comments(aconn, batch_pipeline):
+    cur = aconn.cursor()
+    await cur.execute_batch([("select 1 -- one", None), ("select 2 -- two", None)])
+    assert await cur.fetchall() == [(1,)]
+    assert cur.nextset()
+    assert await cur.fetchall() == [(2,)]
+    assert not cur.nextset()
+
+
+async def test_execute_batch_server_binding(aconn, batch_pipeline):
+    cur = aconn.cursor()
+    await cur.execute_batch(
+        [("select %s, %s", (1, "a")), ("select %b", (b"\x00",)), ("select 1", None)]
+    )
+    assert await cur.fetchall() == [(1, "a")]
+    assert cur.nextset()
+    assert await cur.fetchall() == [(b"\x00",)]
+    assert cur.pgresult.ftype(0) == builtins["bytea"].oid
+    assert type(cur._query) is psycopg._queries.PostgresQuery
+
+
+async def test_execute_batch_in_pipeline(aconn, execmany):
+    if not psycopg.Pipeline.is_supported():
+        pytest.skip(psycopg.Pipeline._not_supported_reason())
+
+    cur = aconn.cursor()
+    async with aconn.pipeline():
+        cur1 = await aconn.execute("select 1")
+        await cur.execute_batch([("select 2", None), ("select 3", None)])
+        assert await cur1.fetchone() == (1,)
+        assert await cur.fetchone() == (2,)
+        assert cur.nextset()
+        assert await cur.fetchone() == (3,)
+
+
+async def test_execute_batch_prepared(aconn, batch_pipeline):
+    aconn.prepare_threshold = 0
+    cur = aconn.cursor()
+    for i in range(2):
+        await cur.execute_batch([("select %s::int", (i,)), ("select %s::text", ("a",))])
+        assert await cur.fetchone() == (i,)
+
+    if psycopg.Pipeline.is_supported():
+        assert len(aconn._prepared._names) == 2
+
+
 async def test_rowcount(aconn):
     cur = aconn.cursor()
 
@@ -613,6 +955,38 @@ async def test_stream_sql(aconn):
     assert recs == [(1, dt.date(2021, 1, 2)), (2, dt.date(2021, 1, 3))]
 
 
+@pytest.mark.parametrize("size", [1, 2, 3, 10])
+async def test_stream_chunked(aconn, size):
+    cur = aconn.cursor()
+    recs = []
+    async for rec in cur.stream("select generate_series(1, %s) as a", [5], size=size):
+        recs.append(rec)
+    assert recs == [(1,), (2,), (3,), (4,), (5,)]
+
+
+async def test_stream_chunked_row_factory(aconn):
+    cur = aconn.cursor(row_factory=rows.dict_row)
+    recs = []
+    async for rec in cur.stream("select generate_series(1, 3) as a", size=2):
+        recs.append(rec)
+    assert recs == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+
+async def test_stream_chunked_description(aconn):
+    cur = aconn.cursor(row_factory=rows.namedtuple_row)
+    async for rec in cur.stream("select generate_series(1, 3) as a, 'x' as b", size=2):
+        assert cur.description is not None
+        assert [c.name for c in cur.description] == ["a", "b"]
+        assert rec.b == "x"
+
+
+@pytest.mark.parametrize("size", [0, -2])
+async def test_stream_chunked_invalid_size(aconn, size):
+    cur = aconn.cursor()
+    with pytest.raises(ValueError, match="size must be >= 1"):
+        await cur.stream("select 1", size=size).__anext__()
+
+
 async def test_stream_row_factory(aconn):
     cur = aconn.cursor(row_factory=rows.dict_row)
     ait = cur.stream("select generate_series(1,2) as a")
@@ -1,3 +1,6 @@
+import os
+import time
+import select
 import logging
 import concurrent.futures
 from typing import Any
@@ -8,6 +11,7 @@ import pytest
 
 import psycopg
 from psycopg import pq
+from psycopg import waiting
 from psycopg import errors as e
 
 pytestmark = [
@@ -220,6 +224,62 @@ def test_sync_syncs_errors(conn):
             p.sync()
 
 
+def test_max_pending(conn):
+    conn.autocommit = True
+    with conn.pipeline(max_pending=3) as p:
+        assert p.max_pending == 3
+        curs = []
+        for i in range(10):
+            curs.append(conn.execute("select %s::int", [i]))
+            assert len(p.result_queue) < 3
+        # The results of the synced queries are available.
+        assert curs[0].statusmessage == "SELECT 1"
+        assert curs[-1].statusmessage is None
+
+    assert [cur.fetchone() for cur in curs] == [(i,) for i in range(10)]
+
+
+def test_max_pending_errors(conn):
+    conn.autocommit = True
+    executed = []
+    with pytest.raises(e.UndefinedTable):
+        with conn.pipeline(max_pending=2):
+            conn.execute("select 1 from nosuchtable")
+            conn.execute("select 1")
+            executed.append(True)
+
+    assert not executed
+
+
+def test_max_bytes(conn):
+    conn.autocommit = True
+    with conn.pipeline(max_bytes=1000) as p:
+        cur1 = conn.execute("select length(%s)", ["x" * 500])
+        assert cur1.statusmessage is None
+        cur2 = conn.execute("select length(%s)", ["x" * 500])
+        assert cur1.statusmessage == "SELECT 1"
+        assert cur2.statusmessage == "SELECT 1"
+        assert not p.result_queue
+        assert p._pending_bytes == 0
+
+
+def test_max_pending_nested(conn):
+    with conn.pipeline() as p:
+        assert p.max_pending is None
+        with conn.pipeline(max_pending=10, max_bytes=100) as p2:
+            assert p2 is p
+            assert p.max_pending == 10
+            assert p.max_bytes == 100
+
+
+@pytest.mark.parametrize("param", ["max_pending", "max_bytes"])
+def test_max_pending_bad(conn, param):
+    with pytest.raises(ValueError):
+        with conn.pipeline(**{param: 0}):
+            pass
+    assert conn._pipeline is None
+
+
 @pipeline_aborted
 def test_errors_raised_on_commit(conn):
     with conn.pipeline():
@@ -577,3 +637,355 @@ def test_concurrency(conn):
     assert s == sum(values)
     (after,) = conn.execute("select value from accessed").fetchone()
     assert after > before
+
+
+def test_multiplex(conn):
+    conn.autocommit = True
+
+    def worker(i):
+        cur = conn.execute("select %s::int, pg_sleep(0.01)", [i])
+        assert cur.statusmessage == "SELECT 1"
+        return cur.fetchone()[0]
+
+    with conn.pipeline(multiplex=True) as p:
+        assert p._multiplex
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as ex:
+            res = list(ex.map(worker, range(50), timeout=10))
+
+    assert res == list(range(50))
+    assert conn._pipeline is None
+
+
+def test_multiplex_high_fd(conn_cls, dsn, monkeypatch):
+    # select() doesn't support file descriptors beyond FD_SETSIZE (1024)
+    resource = pytest.importorskip("resource")
+    nofile = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    if nofile != resource.RLIM_INFINITY and nofile < 1100:
+        pytest.skip(f"can't open enough files: {nofile}")
+    if waiting.wait is waiting.wait_select:
+        # The default wait function has the same limit: use another one.
+        if not hasattr(select, "epoll"):
+            pytest.skip("epoll not available")
+        monkeypatch.setattr(waiting, "wait", waiting.wait_epoll)
+
+    fds = [os.open(os.devnull, os.O_RDONLY)]
+    try:
+        while fds[-1] < 1024:
+            fds.append(os.open(os.devnull, os.O_RDONLY))
+
+        with conn_cls.connect(dsn, autocommit=True) as conn:
+            assert conn.pgconn.socket > 1024
+
+            def worker(i):
+                cur = conn.execute("select %s::int, pg_sleep(0.01)", [i])
+                return cur.fetchone()[0]
+
+            with conn.pipeline(multiplex=True):
+                with concurrent.futures.ThreadPoolExecutor(max_workers=5) as ex:
+                    res = list(ex.map(worker, range(20), timeout=10))
+
+        assert res == list(range(20))
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+def test_multiplex_reader_woken(conn, monkeypatch):
+    wait_input_gen = psycopg._pipeline._wait_input_gen
+
+    def wait_input_gen_late():
+        # Let the main thread receive the data before waiting.
+        time.sleep(0.3)
+        return (yield from wait_input_gen())
+
+    monkeypatch.setattr(psycopg._pipeline, "_wait_input_gen", wait_input_gen_late)
+
+    conn.autocommit = True
+    with conn.pipeline(multiplex=True) as p:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
+            f = ex.submit(conn.execute, "select pg_sleep(0.2)")
+            time.sleep(0.1)
+            # Receive the results the thread is waiting for.
+            p.sync()
+            try:
+                cur = f.result(timeout=1)
+            finally:
+                if not f.done():
+                    # Send something to wake up the thread anyway.
+                    conn.execute("select 1")
+            assert cur.statusmessage == "SELECT 1"
+
+
+def test_multiplex_error(conn):
+    conn.autocommit = True
+
+    def worker(i):
+        if i % 3:
+            return conn.execute("select %s::int", [i]).fetchone()[0]
+        else:
+            with pytest.raises(e.UndefinedTable):
+                conn.execute("select * from nosuchtable")
+            return None
+
+    with conn.pipeline(multiplex=True):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as ex:
+            res = list(ex.map(worker, range(30), timeout=10))
+
+    assert res == [None if not i % 3 else i for i in range(30)]
+
+
+def test_multiplex_prepared(conn):
+    conn.autocommit = True
+    conn.prepare_threshold = 2
+
+    def worker(i):
+        return conn.execute("select %s::int", [i]).fetchone()[0]
+
+    with conn.pipeline(multiplex=True):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as ex:
+            res = list(ex.map(worker, range(30), timeout=10))
+
+    assert res == list(range(30))
+    assert len(conn._prepared._names) == 1
+
+
+def test_multiplex_executemany(conn):
+    conn.autocommit = True
+    conn.execute("create temp table mplex (id int)")
+
+    def worker(i):
+        cur = conn.cursor()
+        cur.executemany(
+            "insert into mplex (id) values (%s) returning id",
+            [(i,), (i + 100,)],
+            returning=True,
+        )
+        got = [cur.fetchone()[0]]
+        assert cur.nextset()
+        got.append(cur.fetchone()[0])
+        return got
+
+    with conn.pipeline(multiplex=True):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as ex:
+            res = list(ex.map(worker, range(10), timeout=10))
+
+    assert res == [[i, i + 100] for i in range(10)]
+    assert conn.execute("select count(*) from mplex").fetchone() == (20,)
+
+
+def test_multiplex_no_autocommit(conn):
+    with pytest.raises(e.ProgrammingError, match="autocommit"):
+        with conn.pipeline(multiplex=True):
+            pass
+    assert conn._pipeline is None
+
+
+def test_multiplex_nested(conn):
+    conn.autocommit = True
+    with conn.pipeline():
+        with pytest.raises(e.ProgrammingError, match="multiplexed"):
+            with conn.pipeline(multiplex=True):
+                pass
+
+    with conn.pipeline(multiplex=True) as p1:
+        with conn.pipeline() as p2:
+            assert p2 is p1
+            assert conn.execute("select 1").fetchone() == (1,)
+
+
+def test_multiplex_no_transaction(conn):
+    conn.autocommit = True
+    with conn.pipeline(multiplex=True):
+        with pytest.raises(e.ProgrammingError, match="transaction"):
+            with conn.transaction():
+                pass
+
+
+def test_multiplex_prepare_error(conn):
+    conn.autocommit = True
+    conn.prepare_threshold = 1
+    conn.execute("create temp table mplex (id int)")
+    with conn.pipeline(multiplex=True):
+        conn.execute("select * from mplex")
+        conn.execute("alter table mplex rename to mplex2")
+        # The statement preparation fails
+        with pytest.raises(e.UndefinedTable):
+            conn.execute("select * from mplex")
+        assert not conn._prepared._names
+
+        conn.execute("alter table mplex2 rename to mplex")
+        cur = conn.execute("select * from mplex")
+        assert cur.statusmessage == "SELECT 0"
+
+
+def test_prepare_error(conn):
+    # A failed preparation must not leave the statement name in the cache.
+    conn.autocommit = True
+    conn.execute("create temp table prepfail (id int)")
+    conn.execute("alter table prepfail rename to prepfail2")
+    conn.prepare_threshold = 0
+    with pytest.raises(e.UndefinedTable):
+        with conn.pipeline():
+            conn.execute("select * from prepfail")
+    assert not conn._prepared._names
+
+    conn.execute("alter table prepfail2 rename to prepfail")
+    with conn.pipeline():
+        cur = conn.execute("select * from prepfail")
+    assert cur.statusmessage == "SELECT 0"
+
+
+def test_submit(conn):
+    with conn.pipeline() as p:
+        results = [p.submit("select %s::int", [i]) for i in range(20)]
+        assert "psycopg.PipelineResult" in repr(results[-1])
+        assert results[10].result() == [(10,)]
+        assert results[0].done()
+        assert "[TUPLES_OK]" in repr(results[0])
+
+    assert all(r.done() for r in results)
+    assert [r.result() for r in results] == [[(i,)] for i in range(20)]
+
+
+def test_submit_row_factory(conn):
+    conn.row_factory = psycopg.rows.dict_row
+    with conn.pipeline() as p:
+        r1 = p.submit("select 1 as x")
+        r2 = p.submit("select 2 as y", row_factory=psycopg.rows.tuple_row)
+        r3 = p.submit("select %s as z", ["a"], binary=True)
+
+    assert r1.result() == [{"x": 1}]
+    assert r2.result() == [(2,)]
+    assert r3.result() == [{"z": "a"}]
+    assert r3.pgresult.fformat(0) == pq.Format.BINARY
+
+
+def test_submit_command(conn):
+    conn.execute("create temp table submitme (id int)")
+    with conn.pipeline() as p:
+        r = p.submit("insert into submitme select generate_series(1, 3)")
+
+    assert r.result() == []
+    assert r.pgresult.command_status == b"INSERT 0 3"
+
+
+def test_submit_error(conn):
+    with conn.pipeline() as p:
+        r1 = p.submit("select 1")
+        r2 = p.submit("select * from nosuchtable")
+        r3 = p.submit("select 3")
+        with pytest.raises(e.PipelineAborted):
+            r3.result()
+        p.sync()
+        r4 = p.submit("select 4")
+
+    assert r1.result() == [(1,)]
+    with pytest.raises(e.UndefinedTable):
+        r2.result()
+    # The queries are executed in the same transaction of the connection.
+    with pytest.raises(e.InFailedSqlTransaction):
+        r4.result()
+    assert conn.info.transaction_status == pq.TransactionStatus.INERROR
+    conn.rollback()
+
+
+def test_submit_error_autocommit(conn):
+    conn.autocommit = True
+    with conn.pipeline() as p:
+        r1 = p.submit("select 1")
+        r2 = p.submit("select * from nosuchtable")
+        p.sync()
+        r3 = p.submit("select 3")
+
+    assert r1.result() == [(1,)]
+    with pytest.raises(e.UndefinedTable):
+        r2.result()
+    assert r3.result() == [(3,)]
+
+
+def test_submit_rollback(conn):
+    conn.execute("create temp table submittx (id int)")
+    conn.commit()
+    with conn.pipeline() as p:
+        p.submit("insert into submittx values (1)")
+        r = p.submit("select count(*) from submittx")
+    assert r.result() == [(1,)]
+    assert conn.info.transaction_status == pq.TransactionStatus.INTRANS
+    conn.rollback()
+    assert conn.execute("select count(*) from submittx").fetchone() == (0,)
+
+
+@pipeline_aborted
+def test_submit_cursor_error(conn):
+    with conn.pipeline() as p:
+        r1 = p.submit("select 1")
+        # The error of the cursor is raised by the pipeline, as usual.
+        with pytest.raises(e.UndefinedTable):
+            conn.execute("select * from nosuchtable")
+            p.sync()
+        # Make sure the failed query is synced, whether it raised or not.
+        p.sync()
+        r2 = p.submit("select 2")
+
+    assert r1.result() == [(1,)]
+    with pytest.raises(e.InFailedSqlTransaction):
+        r2.result()
+    conn.rollback()
+
+
+def test_submit_prepared(conn):
+    with conn.pipeline() as p:
+        results = [p.submit("select %s::int", [i], prepare=True) for i in range(3)]
+
+    assert [r.result() for r in results] == [[(i,)] for i in range(3)]
+    assert len(conn._prepared._names) == 1
+
+
+def test_submit_prepare_error(conn):
+    conn.autocommit = True
+    conn.prepare_threshold = 0
+    with conn.pipeline() as p:
+        r1 = p.submit("select * from nosuchtable")
+        p.sync()
+        r2 = p.submit("select 1")
+
+    with pytest.raises(e.UndefinedTable):
+        r1.result()
+    assert r2.result() == [(1,)]
+    assert len(conn._prepared._names) == 1
+
+
+def test_submit_multiplex(conn):
+    conn.autocommit = True
+
+    def worker(p, i):
+        r = p.submit("select %s::int / %s", [i, i % 3])
+        try:
+            return r.result()[0][0]
+        except e.DivisionByZero:
+            return None
+
+    with conn.pipeline(multiplex=True) as p:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            res = list(executor.map(lambda i: worker(p, i), range(30)))
+
+    assert res == [None if not i % 3 else i // (i % 3) for i in range(30)]
+
+
+def test_multiplex_execute_batch(conn):
+    conn.autocommit = True
+
+    def worker(i):
+        cur = conn.cursor()
+        try:
+            cur.execute_batch([("select %s::int", [i]), ("select 1 / %s", [i % 3])])
+        except e.DivisionByZero:
+            return None
+        assert cur.nextset()
+        return i
+
+    with conn.pipeline(multiplex=True):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            res = list(executor.map(worker, range(30)))
+
+    assert res == [None if not i % 3 else i for i in range(30)]
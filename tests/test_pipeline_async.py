@@ -1,5 +1,7 @@
+import os
 import asyncio
 import logging
+from time import time
 from typing import Any
 from operator import attrgetter
 from itertools import groupby
@@ -220,6 +222,62 @@ async def test_sync_syncs_errors(aconn):
             await p.sync()
 
 
+async def test_max_pending(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline(max_pending=3) as p:
+        assert p.max_pending == 3
+        curs = []
+        for i in range(10):
+            curs.append(await aconn.execute("select %s::int", [i]))
+            assert len(p.result_queue) < 3
+        # The results of the synced queries are available.
+        assert curs[0].statusmessage == "SELECT 1"
+        assert curs[-1].statusmessage is None
+
+    assert [await cur.fetchone() for cur in curs] == [(i,) for i in range(10)]
+
+
+async def test_max_pending_errors(aconn):
+    await aconn.set_autocommit(True)
+    executed = []
+    with pytest.raises(e.UndefinedTable):
+        async with aconn.pipeline(max_pending=2):
+            await aconn.execute("select 1 from nosuchtable")
+            await aconn.execute("select 1")
+            executed.append(True)
+
+    assert not executed
+
+
+async def test_max_bytes(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline(max_bytes=1000) as p:
+        cur1 = await aconn.execute("select length(%s)", ["x" * 500])
+        assert cur1.statusmessage is None
+        cur2 = await aconn.execute("select length(%s)", ["x" * 500])
+        assert cur1.statusmessage == "SELECT 1"
+        assert cur2.statusmessage == "SELECT 1"
+        assert not p.result_queue
+        assert p._pending_bytes == 0
+
+
+async def test_max_pending_nested(aconn):
+    async with aconn.pipeline() as p:
+        assert p.max_pending is None
+        async with aconn.pipeline(max_pending=10, max_bytes=100) as p2:
+            assert p2 is p
+            assert p.max_pending == 10
+            assert p.max_bytes == 100
+
+
+@pytest.mark.parametrize("param", ["max_pending", "max_bytes"])
+async def test_max_pending_bad(aconn, param):
+    with pytest.raises(ValueError):
+        async with aconn.pipeline(**{param: 0}):
+            pass
+    assert aconn._pipeline is None
+
+
 @pipeline_aborted
 async def test_errors_raised_on_commit(aconn):
     async with aconn.pipeline():
@@ -585,3 +643,363 @@ async def test_concurrency(aconn):
     assert s == sum(values)
     (after,) = await (await aconn.execute("select value from accessed")).fetchone()
     assert after > before
+
+
+async def test_multiplex(aconn):
+    await aconn.set_autocommit(True)
+
+    async def worker(i):
+        cur = await aconn.execute("select %s::int, pg_sleep(0.01)", [i])
+        assert cur.statusmessage == "SELECT 1"
+        return (await cur.fetchone())[0]
+
+    async with aconn.pipeline(multiplex=True) as p:
+        assert p._multiplex
+        res = await asyncio.wait_for(
+            asyncio.gather(*[worker(i) for i in range(50)]), timeout=10
+        )
+
+    assert res == list(range(50))
+    assert aconn._pipeline is None
+
+
+async def test_multiplex_high_fd(aconn_cls, dsn):
+    # select() doesn't support file descriptors beyond FD_SETSIZE (1024)
+    resource = pytest.importorskip("resource")
+    nofile = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    if nofile != resource.RLIM_INFINITY and nofile < 1100:
+        pytest.skip(f"can't open enough files: {nofile}")
+
+    fds = [os.open(os.devnull, os.O_RDONLY)]
+    try:
+        while fds[-1] < 1024:
+            fds.append(os.open(os.devnull, os.O_RDONLY))
+
+        async with await aconn_cls.connect(dsn, autocommit=True) as aconn:
+            assert aconn.pgconn.socket > 1024
+
+            async def worker(i):
+                cur = await aconn.execute("select %s::int, pg_sleep(0.01)", [i])
+                return (await cur.fetchone())[0]
+
+            async with aconn.pipeline(multiplex=True):
+                res = await asyncio.wait_for(
+                    asyncio.gather(*[worker(i) for i in range(20)]), timeout=10
+                )
+
+        assert res == list(range(20))
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+async def test_multiplex_lock_released(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline(multiplex=True):
+        t = asyncio.create_task(aconn.execute("select pg_sleep(0.5)"))
+        await asyncio.sleep(0.1)
+        # The task waiting for the results doesn't hold the lock.
+        t0 = time()
+        async with aconn.lock:
+            pass
+        assert time() - t0 < 0.2
+
+        cur = await aconn.execute("select 1")
+        assert await cur.fetchone() == (1,)
+        cur = await t
+        assert cur.statusmessage == "SELECT 1"
+
+
+async def test_multiplex_reader_woken(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline(multiplex=True) as p:
+        t = asyncio.create_task(aconn.execute("select pg_sleep(0.2)"))
+        await asyncio.sleep(0.1)
+        # Receive the results the task is waiting for.
+        await p.sync()
+        try:
+            cur = await asyncio.wait_for(asyncio.shield(t), 1)
+        finally:
+            if not t.done():
+                # Send something to wake up the task anyway.
+                await aconn.execute("select 1")
+        assert cur.statusmessage == "SELECT 1"
+
+
+async def test_multiplex_error(aconn):
+    await aconn.set_autocommit(True)
+
+    async def worker(i):
+        if i % 3:
+            cur = await aconn.execute("select %s::int", [i])
+            return (await cur.fetchone())[0]
+        else:
+            with pytest.raises(e.UndefinedTable):
+                await aconn.execute("select * from nosuchtable")
+            return None
+
+    async with aconn.pipeline(multiplex=True):
+        res = await asyncio.gather(*[worker(i) for i in range(30)])
+
+    assert res == [None if not i % 3 else i for i in range(30)]
+
+
+async def test_multiplex_prepared(aconn):
+    await aconn.set_autocommit(True)
+    aconn.prepare_threshold = 2
+
+    async def worker(i):
+        cur = await aconn.execute("select %s::int", [i])
+        return (await cur.fetchone())[0]
+
+    async with aconn.pipeline(multiplex=True):
+        res = await asyncio.gather(*[worker(i) for i in range(30)])
+
+    assert res == list(range(30))
+    assert len(aconn._prepared._names) == 1
+
+
+async def test_multiplex_executemany(aconn):
+    await aconn.set_autocommit(True)
+    await aconn.execute("create temp table mplex (id int)")
+
+    async def worker(i):
+        cur = aconn.cursor()
+        await cur.executemany(
+            "insert into mplex (id) values (%s) returning id",
+            [(i,), (i + 100,)],
+            returning=True,
+        )
+        got = [(await cur.fetchone())[0]]
+        assert cur.nextset()
+        got.append((await cur.fetchone())[0])
+        return got
+
+    async with aconn.pipeline(multiplex=True):
+        res = await asyncio.gather(*[worker(i) for i in range(10)])
+
+    assert res == [[i, i + 100] for i in range(10)]
+    cur = await aconn.execute("select count(*) from mplex")
+    assert await cur.fetchone() == (20,)
+
+
+async def test_multiplex_no_autocommit(aconn):
+    with pytest.raises(e.ProgrammingError, match="autocommit"):
+        async with aconn.pipeline(multiplex=True):
+            pass
+    assert aconn._pipeline is None
+
+
+async def test_multiplex_nested(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline():
+        with pytest.raises(e.ProgrammingError, match="multiplexed"):
+            async with aconn.pipeline(multiplex=True):
+                pass
+
+    async with aconn.pipeline(multiplex=True) as p1:
+        async with aconn.pipeline() as p2:
+            assert p2 is p1
+            cur = await aconn.execute("select 1")
+            assert await cur.fetchone() == (1,)
+
+
+async def test_multiplex_no_transaction(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline(multiplex=True):
+        with pytest.raises(e.ProgrammingError, match="transaction"):
+            async with aconn.transaction():
+                pass
+
+
+async def test_multiplex_prepare_error(aconn):
+    await aconn.set_autocommit(True)
+    aconn.prepare_threshold = 1
+    await aconn.execute("create temp table mplex (id int)")
+    async with aconn.pipeline(multiplex=True):
+        await aconn.execute("select * from mplex")
+        await aconn.execute("alter table mplex rename to mplex2")
+        # The statement preparation fails
+        with pytest.raises(e.UndefinedTable):
+            await aconn.execute("select * from mplex")
+        assert not aconn._prepared._names
+
+        await aconn.execute("alter table mplex2 rename to mplex")
+        cur = await aconn.execute("select * from mplex")
+        assert cur.statusmessage == "SELECT 0"
+
+
+async def test_prepare_error(aconn):
+    # A failed preparation must not leave the statement name in the cache.
+    await aconn.set_autocommit(True)
+    await aconn.execute("create temp table prepfail (id int)")
+    await aconn.execute("alter table prepfail rename to prepfail2")
+    aconn.prepare_threshold = 0
+    with pytest.raises(e.UndefinedTable):
+        async with aconn.pipeline():
+            await aconn.execute("select * from prepfail")
+    assert not aconn._prepared._names
+
+    await aconn.execute("alter table prepfail2 rename to prepfail")
+    async with aconn.pipeline():
+        cur = await aconn.execute("select * from prepfail")
+    assert cur.statusmessage == "SELECT 0"
+
+
+async def test_submit(aconn):
+    async with aconn.pipeline() as p:
+        results = [await p.submit("select %s::int", [i]) for i in range(20)]
+        assert "psycopg.AsyncPipelineResult" in repr(results[-1])
+        assert await results[10].result() == [(10,)]
+        assert results[0].done()
+        assert "[TUPLES_OK]" in repr(results[0])
+
+    assert all(r.done() for r in results)
+    assert [await r.result() for r in results] == [[(i,)] for i in range(20)]
+
+
+async def test_submit_row_factory(aconn):
+    aconn.row_factory = psycopg.rows.dict_row
+    async with aconn.pipeline() as p:
+        r1 = await p.submit("select 1 as x")
+        r2 = await p.submit("select 2 as y", row_factory=psycopg.rows.tuple_row)
+        r3 = await p.submit("select %s as z", ["a"], binary=True)
+
+    assert await r1.result() == [{"x": 1}]
+    assert await r2.result() == [(2,)]
+    assert await r3.result() == [{"z": "a"}]
+    assert r3.pgresult.fformat(0) == pq.Format.BINARY
+
+
+async def test_submit_command(aconn):
+    await aconn.execute("create temp table submitme (id int)")
+    async with aconn.pipeline() as p:
+        r = await p.submit("insert into submitme select generate_series(1, 3)")
+
+    assert await r.result() == []
+    assert r.pgresult.command_status == b"INSERT 0 3"
+
+
+async def test_submit_error(aconn):
+    async with aconn.pipeline() as p:
+        r1 = await p.submit("select 1")
+        r2 = await p.submit("select * from nosuchtable")
+        r3 = await p.submit("select 3")
+        with pytest.raises(e.PipelineAborted):
+            await r3.result()
+        await p.sync()
+        r4 = await p.submit("select 4")
+
+    assert await r1.result() == [(1,)]
+    with pytest.raises(e.UndefinedTable):
+        await r2.result()
+    # The queries are executed in the same transaction of the connection.
+    with pytest.raises(e.InFailedSqlTransaction):
+        await r4.result()
+    assert aconn.info.transaction_status == pq.TransactionStatus.INERROR
+    await aconn.rollback()
+
+
+async def test_submit_error_autocommit(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline() as p:
+        r1 = await p.submit("select 1")
+        r2 = await p.submit("select * from nosuchtable")
+        await p.sync()
+        r3 = await p.submit("select 3")
+
+    assert await r1.result() == [(1,)]
+    with pytest.raises(e.UndefinedTable):
+        await r2.result()
+    assert await r3.result() == [(3,)]
+
+
+async def test_submit_rollback(aconn):
+    await aconn.execute("create temp table submittx (id int)")
+    await aconn.commit()
+    async with aconn.pipeline() as p:
+        await p.submit("insert into submittx values (1)")
+        r = await p.submit("select count(*) from submittx")
+    assert await r.result() == [(1,)]
+    assert aconn.info.transaction_status == pq.TransactionStatus.INTRANS
+    await aconn.rollback()
+    cur = await aconn.execute("select count(*) from submittx")
+    assert await cur.fetchone() == (0,)
+
+
+@pipeline_aborted
+async def test_submit_cursor_error(aconn):
+    async with aconn.pipeline() as p:
+        r1 = await p.submit("select 1")
+        # The error of the cursor is raised by the pipeline, as usual.
+        with pytest.raises(e.UndefinedTable):
+            await aconn.execute("select * from nosuchtable")
+            await p.sync()
+        # Make sure the failed query is synced, whether it raised or not.
+        await p.sync()
+        r2 = await p.submit("select 2")
+
+    assert await r1.result() == [(1,)]
+    with pytest.raises(e.InFailedSqlTransaction):
+        await r2.result()
+    await aconn.rollback()
+
+
+async def test_submit_prepared(aconn):
+    async with aconn.pipeline() as p:
+        results = [
+            await p.submit("select %s::int", [i], prepare=True) for i in range(3)
+        ]
+
+    assert [await r.result() for r in results] == [[(i,)] for i in range(3)]
+    assert len(aconn._prepared._names) == 1
+
+
+async def test_submit_prepare_error(aconn):
+    await aconn.set_autocommit(True)
+    aconn.prepare_threshold = 0
+    async with aconn.pipeline() as p:
+        r1 = await p.submit("select * from nosuchtable")
+        await p.sync()
+        r2 = await p.submit("select 1")
+
+    with pytest.raises(e.UndefinedTable):
+        await r1.result()
+    assert await r2.result() == [(1,)]
+    assert len(aconn._prepared._names) == 1
+
+
+async def test_submit_multiplex(aconn):
+    await aconn.set_autocommit(True)
+
+    async def worker(p, i):
+        r = await p.submit("select %s::int / %s", [i, i % 3])
+        try:
+            return (await r.result())[0][0]
+        except e.DivisionByZero:
+            return None
+
+    async with aconn.pipeline(multiplex=True) as p:
+        res = await asyncio.gather(*[worker(p, i) for i in range(30)])
+
+    assert res == [None if not i % 3 else i // (i % 3) for i in range(30)]
+
+
+async def test_multiplex_execute_batch(aconn):
+    await aconn.set_autocommit(True)
+
+    async def worker(i):
+        cur = aconn.cursor()
+        try:
+            await cur.execute_batch(
+                [("select %s::int", [i]), ("select 1 / %s", [i % 3])]
+            )
+        except e.DivisionByZero:
+            return None
+        assert cur.nextset()
+        return i
+
+    async with aconn.pipeline(multiplex=True):
+        res = await asyncio.gather(*[worker(i) for i in range(30)])
+
+    assert res == [None if not i % 3 else i for i in range(30)]
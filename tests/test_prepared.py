@@ -7,7 +7,11 @@ from decimal import Decimal
 
 import pytest
 
-from psycopg.rows import namedtuple_row
+import psycopg
+from psycopg.adapt import Transformer
+from psycopg.rows import dict_row, namedtuple_row
+from psycopg._queries import PostgresQuery
+from psycopg._preparing import Prepare, PrepareManager
 
 
 @pytest.mark.parametrize("value", [None, 0, 3])
@@ -260,6 +264,265 @@ def test_change_type_savepoint(conn):
                     raise ZeroDivisionError()
 
 
+def test_registry_maxsize():
+    reg = psycopg.PreparedRegistry(maxsize=2)
+    for i in range(3):
+        reg.add((f"select {i}".encode(), ()))
+    reg.add((b"select 1", ()))
+    assert reg.keys() == [(b"select 2", ()), (b"select 1", ())]
+    reg.discard((b"select 2", ()))
+    assert len(reg) == 1
+
+    with pytest.raises(ValueError):
+        psycopg.PreparedRegistry(maxsize=0)
+
+
+@pytest.mark.parametrize("policy, survives", [("lru", False), ("lfu", True)])
+def test_prepared_eviction(conn, policy, survives):
+    conn.prepared_max = 3
+    conn.prepared_eviction = policy
+    conn.prepare_threshold = 0
+    for i in range(5):
+        conn.execute("select 'hot'")
+    for i in range(5):
+        conn.execute(f"select {i}")
+
+    stmts = get_prepared_statements(conn)
+    assert len(stmts) == 3
+    assert ("select 'hot'" in [stmt.statement for stmt in stmts]) == survives
+    assert conn.prepared_stats().evictions == 3
+
+
+def test_prepared_eviction_lfu_new_statement(conn):
+    conn.prepared_max = 3
+    conn.prepared_eviction = "lfu"
+    conn.prepare_threshold = 0
+    for i in range(3):
+        for j in range(5):
+            conn.execute(f"select {i}")
+
+    # A new hot statement entering the full cache is not evicted at once...
+    for i in range(10):
+        conn.execute("select 'hot'")
+    stats = conn.prepared_stats()
+    assert stats.prepares == 4
+    assert stats.evictions == 1
+
+    # ...and it is not evicted by statements executed less often.
+    conn.execute("select 'cold'")
+    stmts = get_prepared_statements(conn)
+    assert len(stmts) == 3
+    assert "select 'hot'" in [stmt.statement for stmt in stmts]
+    assert "select 'cold'" in [stmt.statement for stmt in stmts]
+    assert conn.prepared_stats().evictions == 2
+
+
+def test_prepared_eviction_bad(conn):
+    with pytest.raises(ValueError):
+        conn.prepared_eviction = "mru"
+    assert conn.prepared_eviction == "lru"
+
+
+def test_prepared_stats(conn):
+    conn.prepare_threshold = 2
+    for i in range(5):
+        conn.execute("select %s::int", [i])
+    conn.execute("select 'a'")
+    conn.execute("select 'b'", prepare=False)
+
+    stats = conn.prepared_stats()
+    assert stats.hits == 2
+    assert stats.misses == 3
+    assert stats.prepares == 1
+    assert stats.evictions == 0
+    assert [(s.query, s.name, s.executions) for s in stats.statements] == [
+        (b"select $1::int", b"_pg3_0", 3),
+        (b"select 'a'", None, 1),
+        (b"select 'b'", None, 1),
+    ]
+
+
+def test_adaptive_one_shot(conn):
+    conn.prepare_threshold = 0
+    conn.prepare_adaptive = True
+    for i in range(10):
+        conn.execute(f"select {i}")
+    assert not get_prepared_statements(conn)
+
+    conn.execute("select 'forced'", prepare=True)
+    assert len(get_prepared_statements(conn)) == 1
+
+
+def test_adaptive_loop(conn):
+    conn.prepare_adaptive = True
+    for i in range(2):
+        conn.execute("select %s::int", [i])
+    assert len(get_prepared_statements(conn)) == 1
+
+
+def test_adaptive_threshold(conn):
+    conn.prepare_threshold = 3
+    conn.prepare_adaptive = True
+    conn._prepared.loop_interval = 0
+    res = []
+    for i in range(5):
+        conn.execute("select %s::int", [i])
+        res.append(len(get_prepared_statements(conn)))
+    assert res == [0, 0, 0, 1, 1]
+
+
+def test_adaptive_long_query(conn):
+    conn.prepare_adaptive = True
+    conn._prepared.loop_interval = 0
+    query = "select " + ", ".join(["%s::int"] * 40)
+    for i in range(2):
+        conn.execute(query, list(range(40)))
+    assert len(get_prepared_statements(conn)) == 1
+
+
+def test_adaptive_slow_query(conn):
+    conn.prepare_adaptive = True
+    conn._prepared.loop_interval = 0
+    conn.execute("select 1")
+    for i in range(2):
+        conn.execute("select pg_sleep(0.01)")
+    assert [s.statement for s in get_prepared_statements(conn)] == [
+        "select pg_sleep(0.01)"
+    ]
+
+
+def test_adaptive_slow_network():
+    # Queries slow because of the network round trip are not prepared.
+    mgr = PrepareManager()
+    mgr.prepare_adaptive = True
+    mgr.loop_interval = 0
+    for query, latency, want in [
+        (b"select 1", 0.05, Prepare.NO),
+        (b"select 2", 0.051, Prepare.NO),
+        (b"select 3", 0.06, Prepare.SHOULD),
+    ]:
+        pgq = PostgresQuery(Transformer())
+        pgq.convert(query, None)
+        mgr.maybe_add_to_cache(pgq, Prepare.NO, b"")
+        mgr.record_latency(pgq, latency)
+        assert mgr.get(pgq)[0] == want
+
+
+def test_prepare_query(conn):
+    q = conn.prepare("select %s::int + 1, %s::text")
+    assert isinstance(q, psycopg.PreparedQuery)
+    assert q.query == b"select $1::int + 1, $2::text"
+    cur = q.execute([1, "a"])
+    assert cur.fetchall() == [(2, "a")]
+    assert (q.execute([2, "b"])) is cur
+    assert cur.fetchall() == [(3, "b")]
+
+    stmts = get_prepared_statements(conn)
+    assert [stmt.statement for stmt in stmts] == ["select $1::int + 1, $2::text"]
+
+
+def test_prepare_query_row_factory(conn):
+    q = conn.prepare("select %(x)s::int as x", binary=True, row_factory=dict_row)
+    cur = q.execute({"x": 10})
+    assert cur.pgresult.fformat(0) == 1
+    assert cur.fetchone() == {"x": 10}
+
+
+def test_prepare_query_types(conn):
+    q = conn.prepare("select %s")
+    for value in [1, "a", 2]:
+        cur = q.execute([value])
+        assert cur.fetchone() == (value,)
+    assert len(get_prepared_statements(conn)) == 2
+
+
+def test_prepare_query_close(conn):
+    with conn.prepare("select %s::int") as q:
+        q.execute([1])
+        assert not q.closed
+    assert q.closed
+    with pytest.raises(psycopg.InterfaceError):
+        q.execute([1])
+
+    conn.execute("select 1")
+    assert not get_prepared_statements(conn)
+
+
+def test_prepare_query_error(conn):
+    q = conn.prepare("select * from preptable where id = %s")
+    for i in range(2):
+        with pytest.raises(psycopg.errors.UndefinedTable):
+            q.execute([i])
+        conn.rollback()
+    assert not get_prepared_statements(conn)
+
+    conn.execute("create table preptable (id int)")
+    cur = q.execute([1])
+    assert cur.fetchall() == []
+
+
+def test_prepare_query_rollback(conn):
+    conn.prepare_threshold = 0
+    q = conn.prepare("select %s::int")
+    q.execute([1])
+    conn.execute("select 'auto'")
+    assert len(get_prepared_statements(conn)) == 2
+
+    conn.rollback()
+    assert not get_prepared_statements(conn)
+    cur = q.execute([2])
+    assert cur.fetchone() == (2,)
+
+
+@pytest.mark.pipeline
+def test_prepare_query_pipeline(conn):
+    q = conn.prepare("select %s::int")
+    with conn.pipeline() as p:
+        cur = q.execute([1])
+        p.sync()
+        assert cur.fetchone() == (1,)
+        cur = q.execute([2])
+    assert cur.fetchone() == (2,)
+    assert len(get_prepared_statements(conn)) == 1
+
+
+def test_registry_record(conn):
+    reg = conn.prepared_registry = psycopg.PreparedRegistry()
+    conn.prepare_threshold = 1
+    for i in range(3):
+        conn.execute("select %s::int", [i])
+        conn.execute("select %s::text", ["x"], prepare=False)
+
+    assert [key[0] for key in reg.keys()] == [b"select $1::int"]
+
+    with pytest.raises(psycopg.errors.UndefinedTable):
+        conn.execute("select * from nosuchtable", prepare=True)
+    assert len(reg) == 1
+
+
+def test_registry_preload(conn_cls, dsn, conn):
+    reg = conn.prepared_registry = psycopg.PreparedRegistry()
+    conn.prepare_threshold = 0
+    conn.execute("select %s::int", [1])
+    conn.execute("select %s::text", ["x"])
+    reg.add((b"select * from nosuchtable", ()))
+
+    with conn_cls.connect(dsn) as conn2:
+        conn2.prepared_registry = reg
+        conn2._preload_prepared()
+        stmts = get_prepared_statements(conn2)
+        assert sorted(stmt.statement for stmt in stmts) == [
+            "select $1::int",
+            "select $1::text",
+        ]
+        assert len(conn2._prepared._names) == 2
+        assert len(reg) == 2
+
+        cur = conn2.execute("select %s::int", [42])
+        assert cur.fetchone() == (42,)
+        assert len(get_prepared_statements(conn2)) == 2
+
+
 def get_prepared_statements(conn):
     cur = conn.cursor(row_factory=namedtuple_row)
     cur.execute(
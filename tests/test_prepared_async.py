@@ -7,7 +7,8 @@ from decimal import Decimal
 
 import pytest
 
-from psycopg.rows import namedtuple_row
+import psycopg
+from psycopg.rows import dict_row, namedtuple_row
 
 
 @pytest.mark.parametrize("value", [None, 0, 3])
@@ -189,6 +190,235 @@ async def test_untyped_json(aconn):
     assert got == [["jsonb"]]
 
 
+@pytest.mark.parametrize("policy, survives", [("lru", False), ("lfu", True)])
+async def test_prepared_eviction(aconn, policy, survives):
+    aconn.prepared_max = 3
+    aconn.prepared_eviction = policy
+    aconn.prepare_threshold = 0
+    for i in range(5):
+        await aconn.execute("select 'hot'")
+    for i in range(5):
+        await aconn.execute(f"select {i}")
+
+    stmts = await get_prepared_statements(aconn)
+    assert len(stmts) == 3
+    assert ("select 'hot'" in [stmt.statement for stmt in stmts]) == survives
+    assert aconn.prepared_stats().evictions == 3
+
+
+async def test_prepared_eviction_lfu_new_statement(aconn):
+    aconn.prepared_max = 3
+    aconn.prepared_eviction = "lfu"
+    aconn.prepare_threshold = 0
+    for i in range(3):
+        for j in range(5):
+            await aconn.execute(f"select {i}")
+
+    # A new hot statement entering the full cache is not evicted at once...
+    for i in range(10):
+        await aconn.execute("select 'hot'")
+    stats = aconn.prepared_stats()
+    assert stats.prepares == 4
+    assert stats.evictions == 1
+
+    # ...and it is not evicted by statements executed less often.
+    await aconn.execute("select 'cold'")
+    stmts = await get_prepared_statements(aconn)
+    assert len(stmts) == 3
+    assert "select 'hot'" in [stmt.statement for stmt in stmts]
+    assert "select 'cold'" in [stmt.statement for stmt in stmts]
+    assert aconn.prepared_stats().evictions == 2
+
+
+async def test_prepared_eviction_bad(aconn):
+    with pytest.raises(ValueError):
+        aconn.prepared_eviction = "mru"
+    assert aconn.prepared_eviction == "lru"
+
+
+async def test_prepared_stats(aconn):
+    aconn.prepare_threshold = 2
+    for i in range(5):
+        await aconn.execute("select %s::int", [i])
+    await aconn.execute("select 'a'")
+    await aconn.execute("select 'b'", prepare=False)
+
+    stats = aconn.prepared_stats()
+    assert stats.hits == 2
+    assert stats.misses == 3
+    assert stats.prepares == 1
+    assert stats.evictions == 0
+    assert [(s.query, s.name, s.executions) for s in stats.statements] == [
+        (b"select $1::int", b"_pg3_0", 3),
+        (b"select 'a'", None, 1),
+        (b"select 'b'", None, 1),
+    ]
+
+
+async def test_adaptive_one_shot(aconn):
+    aconn.prepare_threshold = 0
+    aconn.prepare_adaptive = True
+    for i in range(10):
+        await aconn.execute(f"select {i}")
+    assert not await get_prepared_statements(aconn)
+
+    await aconn.execute("select 'forced'", prepare=True)
+    assert len(await get_prepared_statements(aconn)) == 1
+
+
+async def test_adaptive_loop(aconn):
+    aconn.prepare_adaptive = True
+    for i in range(2):
+        await aconn.execute("select %s::int", [i])
+    assert len(await get_prepared_statements(aconn)) == 1
+
+
+async def test_adaptive_threshold(aconn):
+    aconn.prepare_threshold = 3
+    aconn.prepare_adaptive = True
+    aconn._prepared.loop_interval = 0
+    res = []
+    for i in range(5):
+        await aconn.execute("select %s::int", [i])
+        res.append(len(await get_prepared_statements(aconn)))
+    assert res == [0, 0, 0, 1, 1]
+
+
+async def test_adaptive_long_query(aconn):
+    aconn.prepare_adaptive = True
+    aconn._prepared.loop_interval = 0
+    query = "select " + ", ".join(["%s::int"] * 40)
+    for i in range(2):
+        await aconn.execute(query, list(range(40)))
+    assert len(await get_prepared_statements(aconn)) == 1
+
+
+async def test_adaptive_slow_query(aconn):
+    aconn.prepare_adaptive = True
+    aconn._prepared.loop_interval = 0
+    await aconn.execute("select 1")
+    for i in range(2):
+        await aconn.execute("select pg_sleep(0.01)")
+    assert [s.statement for s in await get_prepared_statements(aconn)] == [
+        "select pg_sleep(0.01)"
+    ]
+
+
+async def test_prepare_query(aconn):
+    q = aconn.prepare("select %s::int + 1, %s::text")
+    assert isinstance(q, psycopg.AsyncPreparedQuery)
+    assert q.query == b"select $1::int + 1, $2::text"
+    cur = await q.execute([1, "a"])
+    assert await cur.fetchall() == [(2, "a")]
+    assert (await q.execute([2, "b"])) is cur
+    assert await cur.fetchall() == [(3, "b")]
+
+    stmts = await get_prepared_statements(aconn)
+    assert [stmt.statement for stmt in stmts] == ["select $1::int + 1, $2::text"]
+
+
+async def test_prepare_query_row_factory(aconn):
+    q = aconn.prepare("select %(x)s::int as x", binary=True, row_factory=dict_row)
+    cur = await q.execute({"x": 10})
+    assert cur.pgresult.fformat(0) == 1
+    assert await cur.fetchone() == {"x": 10}
+
+
+async def test_prepare_query_types(aconn):
+    q = aconn.prepare("select %s")
+    for value in [1, "a", 2]:
+        cur = await q.execute([value])
+        assert await cur.fetchone() == (value,)
+    assert len(await get_prepared_statements(aconn)) == 2
+
+
+async def test_prepare_query_close(aconn):
+    async with aconn.prepare("select %s::int") as q:
+        await q.execute([1])
+        assert not q.closed
+    assert q.closed
+    with pytest.raises(psycopg.InterfaceError):
+        await q.execute([1])
+
+    await aconn.execute("select 1")
+    assert not await get_prepared_statements(aconn)
+
+
+async def test_prepare_query_error(aconn):
+    q = aconn.prepare("select * from preptable where id = %s")
+    for i in range(2):
+        with pytest.raises(psycopg.errors.UndefinedTable):
+            await q.execute([i])
+        await aconn.rollback()
+    assert not await get_prepared_statements(aconn)
+
+    await aconn.execute("create table preptable (id int)")
+    cur = await q.execute([1])
+    assert await cur.fetchall() == []
+
+
+async def test_prepare_query_rollback(aconn):
+    aconn.prepare_threshold = 0
+    q = aconn.prepare("select %s::int")
+    await q.execute([1])
+    await aconn.execute("select 'auto'")
+    assert len(await get_prepared_statements(aconn)) == 2
+
+    await aconn.rollback()
+    assert not await get_prepared_statements(aconn)
+    cur = await q.execute([2])
+    assert await cur.fetchone() == (2,)
+
+
+@pytest.mark.pipeline
+async def test_prepare_query_pipeline(aconn):
+    q = aconn.prepare("select %s::int")
+    async with aconn.pipeline() as p:
+        cur = await q.execute([1])
+        await p.sync()
+        assert await cur.fetchone() == (1,)
+        cur = await q.execute([2])
+    assert await cur.fetchone() == (2,)
+    assert len(await get_prepared_statements(aconn)) == 1
+
+
+async def test_registry_record(aconn):
+    reg = aconn.prepared_registry = psycopg.PreparedRegistry()
+    aconn.prepare_threshold = 1
+    for i in range(3):
+        await aconn.execute("select %s::int", [i])
+        await aconn.execute("select %s::text", ["x"], prepare=False)
+
+    assert [key[0] for key in reg.keys()] == [b"select $1::int"]
+
+    with pytest.raises(psycopg.errors.UndefinedTable):
+        await aconn.execute("select * from nosuchtable", prepare=True)
+    assert len(reg) == 1
+
+
+async def test_registry_preload(aconn_cls, dsn, aconn):
+    reg = aconn.prepared_registry = psycopg.PreparedRegistry()
+    aconn.prepare_threshold = 0
+    await aconn.execute("select %s::int", [1])
+    await aconn.execute("select %s::text", ["x"])
+    reg.add((b"select * from nosuchtable", ()))
+
+    async with await aconn_cls.connect(dsn) as aconn2:
+        aconn2.prepared_registry = reg
+        await aconn2._preload_prepared()
+        stmts = await get_prepared_statements(aconn2)
+        assert sorted(stmt.statement for stmt in stmts) == [
+            "select $1::int",
+            "select $1::text",
+        ]
+        assert len(aconn2._prepared._names) == 2
+        assert len(reg) == 2
+
+        cur = await aconn2.execute("select %s::int", [42])
+        assert await cur.fetchone() == (42,)
+        assert len(await get_prepared_statements(aconn2)) == 2
+
+
 async def get_prepared_statements(aconn):
     cur = aconn.cursor(row_factory=namedtuple_row)
     await cur.execute(
@@ -3,7 +3,7 @@ import pytest
 import psycopg
 from psycopg import pq
 from psycopg.adapt import Transformer, PyFormat
-from psycopg._queries import PostgresQuery, _split_query
+from psycopg._queries import PostgresQuery, _split_query, _query2copy, _query2unnest
 
 
 @pytest.mark.parametrize(
@@ -160,3 +160,108 @@ def test_pq_query_badprog(query, params):
     pq = PostgresQuery(Transformer())
     with pytest.raises(psycopg.ProgrammingError):
         pq.convert(query, params)
+
+
+@pytest.mark.parametrize(
+    "query, nparams, want",
+    [
+        (
+            b"insert into t (a, b) values ($1, $2)",
+            2,
+            b"insert into t (a, b) SELECT _psycopg_args.p1, _psycopg_args.p2"
+            b" FROM unnest($1, $2) AS _psycopg_args(p1, p2)",
+        ),
+        (
+            b"INSERT INTO t VALUES ($1, lower($2)::text) ON CONFLICT DO NOTHING",
+            2,
+            b"INSERT INTO t SELECT _psycopg_args.p1, lower(_psycopg_args.p2)::text"
+            b" FROM unnest($1, $2) AS _psycopg_args(p1, p2) ON CONFLICT DO NOTHING",
+        ),
+        (
+            b"insert into t values ($1, '$2 (', $$ $1) $$)",
+            1,
+            b"insert into t SELECT _psycopg_args.p1, '$2 (', $$ $1) $$"
+            b" FROM unnest($1) AS _psycopg_args(p1)",
+        ),
+        (
+            b"update t set a = $1 where id = $2",
+            2,
+            b"update t set a = _psycopg_args.p1 FROM unnest($1, $2)"
+            b" AS _psycopg_args(p1, p2) where id = _psycopg_args.p2",
+        ),
+        (
+            b"update t set a = (select b from x where x.id = $1) where id = $2",
+            2,
+            b"update t set a = (select b from x where x.id = _psycopg_args.p1)"
+            b" FROM unnest($1, $2) AS _psycopg_args(p1, p2)"
+            b" where id = _psycopg_args.p2",
+        ),
+        (
+            b"delete from t where id = $1",
+            1,
+            b"delete from t USING unnest($1) AS _psycopg_args(p1)"
+            b" where id = _psycopg_args.p1",
+        ),
+        (b"insert into t values ($1), ($2)", 2, None),
+        (b"insert into t values ($1, default)", 1, None),
+        (b"insert into t select $1", 1, None),
+        (b"insert into t values ($1) on conflict (a) do update set b = $2", 2, None),
+        (
+            b"insert into t values ($1, $2) on conflict (a) do update"
+            b" set b = excluded.b",
+            2,
+            None,
+        ),
+        (
+            b"insert into t values ($1) on conflict on constraint c"
+            b" DO UPDATE set b = 0",
+            1,
+            None,
+        ),
+        (
+            b"insert into t values ($1) on conflict (a) do nothing",
+            1,
+            b"insert into t SELECT _psycopg_args.p1"
+            b" FROM unnest($1) AS _psycopg_args(p1) on conflict (a) do nothing",
+        ),
+        (b"update t set a = $1", 1, None),
+        (b"update t set a = $1 from x where x.id = $2", 2, None),
+        (b"update t set a = $1 where current of c", 1, None),
+        (b"delete from t using x where x.id = $1", 1, None),
+        (b"with x as (select 1) insert into t values ($1)", 1, None),
+        (b"select $1", 1, None),
+        (b"insert into t values ($1))", 1, None),
+    ],
+)
+def test_query2unnest(query, nparams, want):
+    assert _query2unnest(query, nparams) == want
+
+
+@pytest.mark.parametrize(
+    "query, nparams, want",
+    [
+        (
+            b"insert into t (a, b) values ($1, $2)",
+            2,
+            (b"COPY t (a, b) FROM STDIN (FORMAT BINARY)", b"t"),
+        ),
+        (
+            b'INSERT INTO "S".t ("A b", c) -- comment\n VALUES ($1,$2);',
+            2,
+            (b'COPY "S".t ("A b", c) FROM STDIN (FORMAT BINARY)', b'"S".t'),
+        ),
+        (b"insert into t values ($1, $2)", 2, None),
+        (b"insert into t (a, b) values ($2, $1)", 2, None),
+        (b"insert into t (a, b) values ($1, $1)", 1, None),
+        (b"insert into t (a, b) values ($1, 10)", 1, None),
+        (b"insert into t (a, b) values ($1, lower($2))", 2, None),
+        (b"insert into t (a) values ($1), ($2)", 2, None),
+        (b"insert into t as x (a) values ($1)", 1, None),
+        (b"insert into t (a) values ($1) returning a", 1, None),
+        (b"insert into t (a) values ($1) on conflict do nothing", 1, None),
+        (b"insert into t (a) select $1", 1, None),
+        (b"update t set a = $1", 1, None),
+    ],
+)
+def test_query2copy(query, nparams, want):
+    assert _query2copy(query, nparams) == want
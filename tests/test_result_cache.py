@@ -0,0 +1,215 @@
+"""
+Client-side result cache tests
+"""
+
+import time
+
+import pytest
+
+import psycopg
+from psycopg import ResultCache
+from psycopg.rows import dict_row
+
+
+@pytest.fixture
+def cache_conn(conn):
+    conn.autocommit = True
+    conn.result_cache = ResultCache()
+    return conn
+
+
+def test_no_cache_by_default(conn):
+    assert conn.result_cache is None
+    assert conn.execute("select 1", cache=True).fetchone() == (1,)
+
+
+def test_cache_hit(cache_conn):
+    cache = cache_conn.result_cache
+    cur = cache_conn.execute("select %s::int, now()", [1], cache=True)
+    row1 = cur.fetchone()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cur = cache_conn.execute("select %s::int, now()", [1], cache=True)
+    assert cur.fetchone() == row1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+
+
+def test_not_cached_without_flag(cache_conn):
+    cache = cache_conn.result_cache
+    cache_conn.execute("select 1")
+    cache_conn.execute("select 1")
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert len(cache) == 0
+
+
+def test_cache_key(cache_conn):
+    cache = cache_conn.result_cache
+    cache_conn.execute("select %s::int", [1], cache=True)
+    cache_conn.execute("select %s::int", [2], cache=True)
+    cache_conn.execute("select %s::int", [1], cache=True, binary=True)
+    cache_conn.execute("select %s::int", ["1"], cache=True)
+    assert (cache.hits, cache.misses) == (0, 4)
+
+    cur = cache_conn.execute("select %s::int", [1], cache=True, binary=True)
+    assert cur.pgresult.fformat(0) == 1
+    assert cur.fetchone() == (1,)
+    assert cache.hits == 1
+
+
+def test_cursor_state(cache_conn):
+    cur = cache_conn.cursor(row_factory=dict_row)
+    for i in range(2):
+        cur.execute("select generate_series(1, 3) as x", cache=True, cache_tags=["foo"])
+        assert cur.rowcount == 3
+        assert cur.description[0].name == "x"
+        assert cur.fetchall() == [{"x": 1}, {"x": 2}, {"x": 3}]
+        assert cur._query.query == b"select generate_series(1, 3) as x"
+
+    assert cache_conn.result_cache.hits == 1
+
+
+def test_commands_not_cached(cache_conn):
+    cache = cache_conn.result_cache
+    cache_conn.execute("create temp table rctest (id int)")
+    for i in range(2):
+        cache_conn.execute("insert into rctest values (%s)", [i], cache=True)
+    assert len(cache) == 0
+    assert cache_conn.execute("select count(*) from rctest").fetchone() == (2,)
+
+
+def test_error_not_cached(cache_conn):
+    cache = cache_conn.result_cache
+    with pytest.raises(psycopg.DataError):
+        cache_conn.execute("select 1 / %s", [0], cache=True)
+    assert len(cache) == 0
+
+
+def test_ttl(cache_conn):
+    cache = cache_conn.result_cache = ResultCache(ttl=0.1)
+    cache_conn.execute("select 1", cache=True)
+    cache_conn.execute("select 1", cache=True)
+    assert cache.hits == 1
+    time.sleep(0.2)
+    cache_conn.execute("select 1", cache=True)
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 2, 1)
+
+
+def test_maxsize(cache_conn):
+    cache = cache_conn.result_cache = ResultCache(maxsize=2)
+    cache_conn.execute("select 1", cache=True)
+    cache_conn.execute("select 2", cache=True)
+    cache_conn.execute("select 1", cache=True)
+    cache_conn.execute("select 3", cache=True)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+    cache_conn.execute("select 1", cache=True)
+    assert cache.hits == 2
+    cache_conn.execute("select 2", cache=True)
+    assert cache.hits == 2
+
+
+def test_invalidate(cache_conn):
+    cache = cache_conn.result_cache
+    cache_conn.execute("select 1", cache_tags=["a"])
+    cache_conn.execute("select 2", cache_tags=["a", "b"])
+    cache_conn.execute("select 3", cache_tags=["b"])
+    cache_conn.execute("select 4", cache=True)
+    assert len(cache) == 4
+
+    cache.invalidate("a")
+    assert len(cache) == 2
+    assert cache.invalidations == 2
+    cache.invalidate("b", "c")
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.invalidations == 4
+
+
+def test_notify_invalidate(conn_cls, dsn, cache_conn):
+    cache = cache_conn.result_cache = ResultCache(channel="rcache")
+    cache_conn.execute("listen rcache")
+    cache_conn.execute("select 1", cache_tags=["a"])
+    cache_conn.execute("select 2", cache_tags=["b"])
+    cache_conn.execute("select 3", cache=True)
+
+    with conn_cls.connect(dsn, autocommit=True) as nconn:
+        nconn.execute("notify rcache, 'a'")
+        nconn.execute("notify other, 'b'")
+
+    time.sleep(0.1)
+    cache_conn.execute("select 2", cache_tags=["b"])
+    assert (cache.hits, cache.invalidations) == (1, 1)
+    cache_conn.execute("select 1", cache_tags=["a"])
+    assert cache.hits == 1
+
+    with conn_cls.connect(dsn, autocommit=True) as nconn:
+        nconn.execute("notify rcache")
+
+    time.sleep(0.1)
+    cache_conn.execute("select 3", cache=True)
+    assert cache.hits == 1
+    assert len(cache) == 1
+
+
+def test_replace_cache(cache_conn):
+    cache = cache_conn.result_cache = ResultCache(channel="rcache")
+    assert cache.handle_notify in cache_conn._notify_handlers
+    cache_conn.result_cache = None
+    assert cache.handle_notify not in cache_conn._notify_handlers
+
+
+def test_transaction_not_cached(conn):
+    cache = conn.result_cache = ResultCache()
+    conn.execute("select 1", cache=True)
+    conn.execute("select 1", cache=True)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert len(cache) == 0
+
+    with conn.transaction():
+        conn.execute("select 1", cache=True)
+    assert len(cache) == 0
+
+
+def test_transaction_rollback(cache_conn):
+    cache = cache_conn.result_cache
+    cache_conn.execute("create temp table rctest (id int)")
+    with cache_conn.transaction(force_rollback=True):
+        cache_conn.execute("insert into rctest values (1)")
+        cur = cache_conn.execute("select count(*) from rctest", cache=True)
+        assert cur.fetchone() == (1,)
+    cur = cache_conn.execute("select count(*) from rctest", cache=True)
+    assert cur.fetchone() == (0,)
+    assert cache.hits == 0
+
+    # Results stored outside the transaction are still returned inside.
+    with cache_conn.transaction():
+        cur = cache_conn.execute("select count(*) from rctest", cache=True)
+        assert cur.fetchone() == (0,)
+    assert cache.hits == 1
+
+
+def test_shared_cache(conn_cls, dsn, cache_conn):
+    cache = cache_conn.result_cache
+    cache_conn.execute("select 1", cache=True)
+    with conn_cls.connect(dsn) as conn2:
+        conn2.result_cache = cache
+        assert conn2.execute("select 1", cache=True).fetchone() == (1,)
+    assert cache.hits == 1
+
+
+@pytest.mark.pipeline
+def test_pipeline_not_cached(cache_conn):
+    cache = cache_conn.result_cache
+    with cache_conn.pipeline():
+        cache_conn.execute("select 1", cache=True)
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("args", [{"maxsize": 0}, {"ttl": 0}])
+def test_bad_args(args):
+    with pytest.raises(ValueError):
+        ResultCache(**args)
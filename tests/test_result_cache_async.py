@@ -0,0 +1,88 @@
+"""
+Client-side result cache tests on async connections
+"""
+
+import asyncio
+
+import pytest
+
+import psycopg
+from psycopg import ResultCache
+from psycopg.rows import dict_row
+
+
+@pytest.fixture
+async def cache_aconn(aconn):
+    await aconn.set_autocommit(True)
+    aconn.result_cache = ResultCache()
+    return aconn
+
+
+async def test_cache_hit(cache_aconn):
+    cache = cache_aconn.result_cache
+    cur = await cache_aconn.execute("select %s::int, now()", [1], cache=True)
+    row1 = await cur.fetchone()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cur = await cache_aconn.execute("select %s::int, now()", [1], cache=True)
+    assert await cur.fetchone() == row1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+async def test_cursor_state(cache_aconn):
+    cur = cache_aconn.cursor(row_factory=dict_row)
+    for i in range(2):
+        await cur.execute(
+            "select generate_series(1, 3) as x", cache=True, cache_tags=["foo"]
+        )
+        assert cur.rowcount == 3
+        assert await cur.fetchall() == [{"x": 1}, {"x": 2}, {"x": 3}]
+
+    assert cache_aconn.result_cache.hits == 1
+
+
+async def test_commands_not_cached(cache_aconn):
+    await cache_aconn.execute("create temp table rctest (id int)")
+    await cache_aconn.execute("insert into rctest values (1)", cache=True)
+    assert len(cache_aconn.result_cache) == 0
+
+
+async def test_error_not_cached(cache_aconn):
+    with pytest.raises(psycopg.DataError):
+        await cache_aconn.execute("select 1 / %s", [0], cache=True)
+    assert len(cache_aconn.result_cache) == 0
+
+
+async def test_transaction_not_cached(aconn):
+    cache = aconn.result_cache = ResultCache()
+    await aconn.execute("select 1", cache=True)
+    await aconn.execute("select 1", cache=True)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert len(cache) == 0
+
+    async with aconn.transaction():
+        await aconn.execute("select 1", cache=True)
+    assert len(cache) == 0
+
+
+async def test_notify_invalidate(aconn_cls, dsn, cache_aconn):
+    cache = cache_aconn.result_cache = ResultCache(channel="rcache")
+    await cache_aconn.execute("listen rcache")
+    await cache_aconn.execute("select 1", cache_tags=["a"])
+    await cache_aconn.execute("select 2", cache_tags=["b"])
+
+    async with await aconn_cls.connect(dsn, autocommit=True) as nconn:
+        await nconn.execute("notify rcache, 'a'")
+
+    await asyncio.sleep(0.1)
+    await cache_aconn.execute("select 2", cache_tags=["b"])
+    await cache_aconn.execute("select 1", cache_tags=["a"])
+    assert (cache.hits, cache.misses, cache.invalidations) == (1, 3, 1)
+
+
+@pytest.mark.pipeline
+async def test_pipeline_not_cached(cache_aconn):
+    cache = cache_aconn.result_cache
+    async with cache_aconn.pipeline():
+        await cache_aconn.execute("select 1", cache=True)
+    assert len(cache) == 0
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 import psycopg
@@ -28,6 +30,27 @@ def test_dict_row(conn):
     assert not cur.nextset()
 
 
+@pytest.mark.parametrize("fmt_out", psycopg.pq.Format)
+def test_dict_row_values(conn, fmt_out):
+    cur = conn.cursor(row_factory=rows.dict_row, binary=fmt_out)
+    cur.execute(
+        "select x as a, x::text as b, null::int as c, 'd' as a"
+        " from generate_series(1, 3) x"
+    )
+    assert isinstance(cur._make_row, rows.DictRowMaker)
+
+    # Duplicate names behave like dict(): the last value, the first position.
+    expected = [{"a": "d", "b": str(i), "c": None} for i in range(1, 4)]
+    assert cur.fetchone() == expected[0]
+    assert cur.fetchmany(1) == expected[1:2]
+    assert cur.fetchall() == expected[2:]
+    cur.scroll(0, "absolute")
+    assert list(cur.fetchone()) == ["a", "b", "c"]
+
+    (key,) = cur.execute("select 1 as my_column").fetchone()
+    assert key is sys.intern("my_column")
+
+
 def test_namedtuple_row(conn):
     rows._make_nt.cache_clear()
     cur = conn.cursor(row_factory=rows.namedtuple_row)
@@ -102,9 +125,71 @@ def test_kwargs_row(conn):
     assert p.age == 42
 
 
+def test_lazy_row(conn):
+    cur = conn.cursor(row_factory=rows.lazy_row)
+    cur.execute("select 'bob' as name, 3 as id, null as x")
+    (r,) = cur.fetchall()
+    assert isinstance(r, rows.LazyRow)
+    assert r == ("bob", 3, None)
+    assert r["name"] == r[0] == r[-3] == "bob"
+    assert r["id"] == 3
+    assert r[1:] == (3, None)
+    assert len(r) == 3
+    assert list(r) == ["bob", 3, None]
+    assert r.keys() == ["name", "id", "x"]
+    with pytest.raises(KeyError):
+        r["y"]
+    with pytest.raises(IndexError):
+        r[3]
+
+    cur.execute("select 'a' as letter; select 1 as number")
+    assert cur.fetchone()["letter"] == "a"
+    assert cur.nextset()
+    assert cur.fetchone()["number"] == 1
+
+
+def test_lazy_row_load_on_access(conn):
+    calls = []
+
+    class CountingLoader(psycopg.types.numeric.IntLoader):
+        def load(self, data):
+            calls.append(bytes(data))
+            return super().load(data)
+
+    conn.adapters.register_loader("int4", CountingLoader)
+    cur = conn.cursor(row_factory=rows.lazy_row)
+    cur.execute("select x, x * 10 from generate_series(1, 3) x")
+    recs = cur.fetchall()
+    assert calls == []
+    assert recs[1][1] == 20
+    assert recs[1][1] == 20
+    assert calls == [b"20"]
+    assert recs[2] == (3, 30)
+    assert calls == [b"20", b"3", b"30"]
+
+
+def test_lazy_row_fetchone(conn):
+    cur = conn.cursor(row_factory=rows.lazy_row)
+    cur.execute("select generate_series(1, 2) as n")
+    r1 = cur.fetchone()
+    r2 = cur.fetchone()
+    cur.execute("select 'x' as n")
+    assert r1["n"] == 1
+    assert r2["n"] == 2
+    assert cur.fetchone()["n"] == "x"
+
+
+@pytest.mark.crdb_skip("server-side cursor")
+def test_lazy_row_server_cursor(conn):
+    with conn.cursor("foo", row_factory=rows.lazy_row) as cur:
+        cur.execute("select generate_series(1, 3) as n")
+        assert cur.fetchone()["n"] == 1
+        assert [r["n"] for r in cur.fetchmany(2)] == [2, 3]
+
+
 @pytest.mark.parametrize(
     "factory",
-    "tuple_row dict_row namedtuple_row class_row args_row kwargs_row".split(),
+    "tuple_row dict_row namedtuple_row class_row args_row kwargs_row lazy_row".split(),
 )
 def test_no_result(factory, conn):
     cur = conn.cursor(row_factory=factory_from_name(factory))
@@ -115,7 +200,7 @@ def test_no_result(factory, conn):
 
 @pytest.mark.crdb_skip("no col query")
 @pytest.mark.parametrize(
-    "factory", "tuple_row dict_row namedtuple_row args_row".split()
+    "factory", "tuple_row dict_row namedtuple_row args_row lazy_row".split()
 )
 def test_no_column(factory, conn):
     cur = conn.cursor(row_factory=factory_from_name(factory))
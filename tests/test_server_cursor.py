@@ -1,7 +1,11 @@
+import concurrent.futures
+from array import array
+from types import SimpleNamespace
+
 import pytest
 
 import psycopg
-from psycopg import rows, errors as e
+from psycopg import pq, rows, errors as e
 from psycopg.pq import Format
 
 pytestmark = pytest.mark.crdb_skip("server-side cursor")
@@ -288,6 +292,13 @@ def test_executemany(conn):
     cur.close()
 
 
+def test_execute_batch(conn):
+    cur = conn.cursor("foo")
+    with pytest.raises(e.NotSupportedError):
+        cur.execute_batch([("select %s", (1,))])
+    cur.close()
+
+
 def test_fetchone(conn):
     with conn.cursor("foo") as cur:
         cur.execute("select generate_series(1, %s) as bar", (2,))
@@ -318,6 +329,17 @@ def test_fetchall(conn):
         assert cur.fetchall() == []
 
 
+def test_fetch_columns(conn):
+    with conn.cursor("foo") as cur:
+        cur.execute("select x, x::text from generate_series(1, %s) x", (5,))
+        assert cur.fetchone() == (1, "1")
+        assert cur.fetchmany_columns(2) == [array("i", [2, 3]), ["2", "3"]]
+        assert cur.rownumber == 3
+        assert cur.fetch_columns() == [array("i", [4, 5]), ["4", "5"]]
+        assert cur.rownumber == 5
+        assert cur.fetch_columns() == [array("i"), []]
+
+
 def test_nextset(conn):
     with conn.cursor("foo") as cur:
         cur.execute("select generate_series(1, %s) as bar", (3,))
@@ -428,6 +450,161 @@ def test_itersize(conn, commands):
             assert "fetch forward 2" in cmd.lower()
 
 
+@pytest.mark.parametrize("nrecs", [0, 5, 6, 7])
+def test_prefetch(conn, nrecs):
+    with conn.cursor("foo") as cur:
+        assert not cur.prefetch
+        cur.prefetch = True
+        cur.itersize = 3
+        cur.execute("select generate_series(1, %s) as bar", (nrecs,))
+        recs = []
+        for rec in cur:
+            assert cur.rownumber == rec[0]
+            recs.append(rec)
+    assert recs == [(i,) for i in range(1, nrecs + 1)]
+
+
+def test_prefetch_in_flight(conn):
+    with conn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        cur.execute("select generate_series(1, 5) as bar")
+        it = iter(cur)
+        assert next(it) == (1,)
+        # The next batch was requested before the first was returned
+        assert cur._fetch_pending
+        assert conn.pgconn.transaction_status == pq.TransactionStatus.ACTIVE
+        assert list(it) == [(2,), (3,), (4,), (5,)]
+        assert not cur._fetch_pending
+
+
+def test_prefetch_break(conn):
+    with conn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        cur.execute("select generate_series(1, 10) as bar")
+        for rec in cur:
+            if rec == (3,):
+                break
+        assert not cur._fetch_pending
+        # The rows fetched in advance are lost
+        assert cur.fetchone() == (7,)
+
+    assert conn.execute("select 42").fetchone() == (42,)
+
+
+def test_prefetch_query_in_loop(conn):
+    with conn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        cur.execute("select generate_series(1, 5) as bar")
+        recs = []
+        for rec in cur:
+            recs.append(rec)
+            # The batch requested in advance is received before the query
+            assert conn.execute("select %s::int", rec).fetchone() == rec
+        assert recs == [(1,), (2,), (3,), (4,), (5,)]
+
+
+def test_prefetch_other_thread(conn):
+    with conn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        cur.execute("select generate_series(1, 5) as bar")
+        it = iter(cur)
+        assert next(it) == (1,)
+        assert cur._fetch_pending
+        with concurrent.futures.ThreadPoolExecutor(1) as ex:
+            f = ex.submit(lambda: conn.execute("select 42").fetchone())
+            assert f.result() == (42,)
+        assert list(it) == [(2,), (3,), (4,), (5,)]
+
+
+def test_prefetch_close_in_loop(conn):
+    cur = conn.cursor("foo")
+    cur.prefetch = True
+    cur.itersize = 2
+    cur.execute("select generate_series(1, 10) as bar")
+    for rec in cur:
+        cur.close()
+        break
+    assert cur.closed
+    assert conn.execute("select 42").fetchone() == (42,)
+
+
+def test_prefetch_fetch_in_loop(conn):
+    with conn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        cur.execute("select generate_series(1, 10) as bar")
+        with pytest.raises(e.ProgrammingError):
+            for rec in cur:
+                cur.fetchone()
+
+
+def test_prefetch_error(conn):
+    with conn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        cur.execute("select 1 / (5 - x) from generate_series(1, 10) as x")
+        recs = []
+        with pytest.raises(e.DivisionByZero):
+            for rec in cur:
+                recs.append(rec)
+        assert len(recs) == 4
+
+
+def test_prefetch_steal_cursor(conn):
+    cur1 = conn.cursor()
+    cur1.execute("declare test cursor for select generate_series(1, 5) as s")
+    cur2 = conn.cursor("test")
+    cur2.prefetch = True
+    cur2.itersize = 2
+    assert list(cur2) == [(1,), (2,), (3,), (4,), (5,)]
+    cur2.close()
+
+
+@pytest.mark.parametrize("width, grow", [(1, True), (10000, False)])
+def test_iterbytes(conn, commands, width, grow):
+    with conn.cursor("foo") as cur:
+        assert cur.iterbytes is None
+        cur.itersize = 10
+        cur.iterbytes = 50000
+        cur.execute("select repeat('x', %s) from generate_series(1, 1000)", [width])
+        commands.popall()
+
+        assert len(list(cur)) == 1000
+        nums = [int(cmd.split()[2]) for cmd in commands.popall()]
+        assert nums[0] == 10
+        if grow:
+            # The batch size changes gradually
+            assert nums[1:5] == [20, 40, 80, 160]
+        else:
+            assert nums[1] == 5
+            assert len(set(nums[1:-1])) <= 2
+        assert cur.itersize == 10
+
+
+@pytest.mark.parametrize(
+    "num, size, want",
+    [(10, 0, 10), (10, 500, 20), (10, 10**9, 5), (1, 10**9, 1), (80000, 1, 100000)],
+)
+def test_iterbytes_next_size(num, size, want):
+    res = SimpleNamespace(ntuples=num, memory_size=size)
+    cur = SimpleNamespace(iterbytes=1000, pgresult=res)
+    assert psycopg.ServerCursor._next_itersize(cur, num) == want  # type: ignore
+
+
+def test_iterbytes_prefetch(conn):
+    with conn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 10
+        cur.iterbytes = 10000
+        cur.execute("select x, repeat('x', 100) from generate_series(1, 1000) x")
+        recs = [rec[0] for rec in cur]
+    assert recs == list(range(1, 1001))
+
+
 def test_cant_scroll_by_default(conn):
     cur = conn.cursor("tmp")
     assert cur.scrollable is None
@@ -1,3 +1,5 @@
+from array import array
+
 import pytest
 
 import psycopg
@@ -298,6 +300,13 @@ async def test_executemany(aconn):
     await cur.close()
 
 
+async def test_execute_batch(aconn):
+    cur = aconn.cursor("foo")
+    with pytest.raises(e.NotSupportedError):
+        await cur.execute_batch([("select %s", (1,))])
+    await cur.close()
+
+
 async def test_fetchone(aconn):
     async with aconn.cursor("foo") as cur:
         await cur.execute("select generate_series(1, %s) as bar", (2,))
@@ -328,6 +337,17 @@ async def test_fetchall(aconn):
         assert await cur.fetchall() == []
 
 
+async def test_fetch_columns(aconn):
+    async with aconn.cursor("foo") as cur:
+        await cur.execute("select x, x::text from generate_series(1, %s) x", (5,))
+        assert await cur.fetchone() == (1, "1")
+        assert await cur.fetchmany_columns(2) == [array("i", [2, 3]), ["2", "3"]]
+        assert cur.rownumber == 3
+        assert await cur.fetch_columns() == [array("i", [4, 5]), ["4", "5"]]
+        assert cur.rownumber == 5
+        assert await cur.fetch_columns() == [array("i"), []]
+
+
 async def test_nextset(aconn):
     async with aconn.cursor("foo") as cur:
         await cur.execute("select generate_series(1, %s) as bar", (3,))
@@ -443,6 +463,138 @@ async def test_itersize(aconn, acommands):
             assert "fetch forward 2" in cmd.lower()
 
 
+@pytest.mark.parametrize("nrecs", [0, 5, 6, 7])
+async def test_prefetch(aconn, nrecs):
+    async with aconn.cursor("foo") as cur:
+        assert not cur.prefetch
+        cur.prefetch = True
+        cur.itersize = 3
+        await cur.execute("select generate_series(1, %s) as bar", (nrecs,))
+        recs = []
+        async for rec in cur:
+            assert cur.rownumber == rec[0]
+            recs.append(rec)
+    assert recs == [(i,) for i in range(1, nrecs + 1)]
+
+
+async def test_prefetch_in_flight(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        await cur.execute("select generate_series(1, 5) as bar")
+        it = cur.__aiter__()
+        assert await it.__anext__() == (1,)
+        assert cur._fetch_pending
+        assert [rec async for rec in it] == [(2,), (3,), (4,), (5,)]
+        assert not cur._fetch_pending
+
+
+async def test_prefetch_break(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        await cur.execute("select generate_series(1, 10) as bar")
+        it = cur.__aiter__()
+        async for rec in it:
+            if rec == (3,):
+                break
+        await it.aclose()
+        assert not cur._fetch_pending
+        assert await cur.fetchone() == (7,)
+
+    cur = await aconn.execute("select 42")
+    assert await cur.fetchone() == (42,)
+
+
+async def test_prefetch_query_in_loop(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        await cur.execute("select generate_series(1, 5) as bar")
+        recs = []
+        async for rec in cur:
+            recs.append(rec)
+            # The batch requested in advance is received before the query
+            cur2 = await aconn.execute("select %s::int", rec)
+            assert await cur2.fetchone() == rec
+        assert recs == [(1,), (2,), (3,), (4,), (5,)]
+
+
+async def test_prefetch_break_no_aclose(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        await cur.execute("select generate_series(1, 10) as bar")
+        async for rec in cur:
+            if rec == (3,):
+                break
+        # The iterator is not closed, but the connection can be used.
+        cur2 = await aconn.execute("select 42")
+        assert await cur2.fetchone() == (42,)
+        with pytest.raises(e.ProgrammingError):
+            await cur.fetchone()
+
+    assert not cur._fetch_stash
+    cur2 = await aconn.execute("select 43")
+    assert await cur2.fetchone() == (43,)
+
+
+async def test_prefetch_close_in_loop(aconn):
+    cur = aconn.cursor("foo")
+    cur.prefetch = True
+    cur.itersize = 2
+    await cur.execute("select generate_series(1, 10) as bar")
+    async for rec in cur:
+        await cur.close()
+        break
+    assert cur.closed
+    cur = await aconn.execute("select 42")
+    assert await cur.fetchone() == (42,)
+
+
+async def test_prefetch_error(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 2
+        await cur.execute("select 1 / (5 - x) from generate_series(1, 10) as x")
+        recs = []
+        with pytest.raises(e.DivisionByZero):
+            async for rec in cur:
+                recs.append(rec)
+        assert len(recs) == 4
+
+
+@pytest.mark.parametrize("width, grow", [(1, True), (10000, False)])
+async def test_iterbytes(aconn, acommands, width, grow):
+    async with aconn.cursor("foo") as cur:
+        assert cur.iterbytes is None
+        cur.itersize = 10
+        cur.iterbytes = 50000
+        await cur.execute(
+            "select repeat('x', %s) from generate_series(1, 1000)", [width]
+        )
+        acommands.popall()
+
+        assert len([rec async for rec in cur]) == 1000
+        nums = [int(cmd.split()[2]) for cmd in acommands.popall()]
+        assert nums[0] == 10
+        if grow:
+            # The batch size changes gradually
+            assert nums[1:5] == [20, 40, 80, 160]
+        else:
+            assert nums[1] == 5
+
+
+async def test_iterbytes_prefetch(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.prefetch = True
+        cur.itersize = 10
+        cur.iterbytes = 10000
+        await cur.execute("select x, repeat('x', 100) from generate_series(1, 1000) x")
+        recs = [rec[0] async for rec in cur]
+    assert recs == list(range(1, 1001))
+
+
 async def test_cant_scroll_by_default(aconn):
     cur = aconn.cursor("tmp")
     assert cur.scrollable is None
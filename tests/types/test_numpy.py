@@ -0,0 +1,113 @@
+import pytest
+
+import psycopg
+from psycopg.pq import Format
+from psycopg.adapt import PyFormat
+from psycopg._compat import prod
+
+np = pytest.importorskip("numpy")
+
+from psycopg.types.numpy import register_numpy  # noqa: E402
+
+dtypes = [
+    ("bool", "bool"),
+    ("int16", "int2"),
+    ("int32", "int4"),
+    ("int64", "int8"),
+    ("float32", "float4"),
+    ("float64", "float8"),
+]
+
+
+@pytest.fixture
+def numpy_conn(conn):
+    register_numpy(conn)
+    return conn
+
+
+@pytest.mark.parametrize("dtype, pgtype", dtypes)
+@pytest.mark.parametrize("shape", [(5,), (2, 3), (2, 1, 2)])
+def test_roundtrip(numpy_conn, dtype, pgtype, shape):
+    a = (np.arange(prod(shape)) % 3).astype(dtype).reshape(shape)
+    cur = numpy_conn.cursor(binary=True)
+    cur.execute("select %b, pg_typeof(%b) = %s::regtype", [a, a, f"{pgtype}[]"])
+    got, ok = cur.fetchone()
+    assert ok
+    assert isinstance(got, np.ndarray)
+    assert got.dtype == np.dtype(dtype)
+    assert got.shape == shape
+    assert (got == a).all()
+
+
+def test_load(numpy_conn):
+    cur = numpy_conn.cursor(binary=True)
+    cur.execute("select '{{1.5,2},{3,-4.25}}'::float8[], '{}'::int4[]")
+    got, empty = cur.fetchone()
+    assert got.dtype == np.float64
+    assert got.tolist() == [[1.5, 2.0], [3.0, -4.25]]
+    assert empty.dtype == np.int32
+    assert empty.shape == (0,)
+
+
+def test_load_nulls(numpy_conn):
+    cur = numpy_conn.cursor(binary=True)
+    cur.execute("select '{1,NULL,3}'::int4[]")
+    (got,) = cur.fetchone()
+    assert got.dtype == object
+    assert got.tolist() == [1, None, 3]
+
+
+def test_load_other_types(numpy_conn):
+    cur = numpy_conn.cursor(binary=True)
+    cur.execute("select '{a,b}'::text[]")
+    assert cur.fetchone()[0] == ["a", "b"]
+
+
+def test_dump_not_contiguous(numpy_conn):
+    a = np.arange(10, dtype="float64")[::3]
+    cur = numpy_conn.cursor()
+    cur.execute("select %b", [a])
+    assert cur.fetchone()[0] == [0.0, 3.0, 6.0, 9.0]
+
+
+def test_dump_empty(numpy_conn):
+    cur = numpy_conn.cursor()
+    cur.execute("select %b::float8[]", [np.array([], dtype="float64")])
+    assert cur.fetchone()[0] == []
+
+
+def test_dump_0d(numpy_conn):
+    cur = numpy_conn.cursor()
+    with pytest.raises(psycopg.DataError, match="0-dimensional"):
+        cur.execute("select %b", [np.array(42, dtype="int64")])
+    cur.execute("select %b", [np.array(42, dtype="int64").reshape(1)])
+    assert cur.fetchone()[0] == [42]
+
+
+@pytest.mark.parametrize("fmt_in", [PyFormat.AUTO, PyFormat.BINARY])
+def test_dump_bad_dtype(numpy_conn, fmt_in):
+    cur = numpy_conn.cursor()
+    with pytest.raises(psycopg.DataError, match="dtype"):
+        cur.execute(f"select %{fmt_in.value}", [np.array(["a", "b"])])
+
+
+@pytest.mark.parametrize("fmt_out", Format)
+def test_load_text(numpy_conn, fmt_out):
+    cur = numpy_conn.cursor(binary=fmt_out)
+    cur.execute("select '{1,2}'::int8[]")
+    got = cur.fetchone()[0]
+    if fmt_out == Format.BINARY:
+        assert isinstance(got, np.ndarray)
+    else:
+        assert got == [1, 2]
+
+
+def test_register_context(conn):
+    cur = conn.cursor(binary=True)
+    register_numpy(cur)
+    cur.execute("select %s", [np.array([1, 2], dtype="int64")])
+    assert cur.fetchone()[0].dtype == np.int64
+
+    cur = conn.cursor(binary=True)
+    cur.execute("select '{1,2}'::int8[]")
+    assert cur.fetchone()[0] == [1, 2]